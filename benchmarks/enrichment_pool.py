@@ -0,0 +1,233 @@
+"""Latency of HTTP enrichment against a local stub service.
+
+Compares opening a new client, and so a new connection, for every entity with
+the shared connection-pooled client used by the HTTP enricher, on the same
+keep-alive stub service. Then compares enriching the distinct entities of a
+document one by one with enriching them concurrently ahead of the
+pseudonymization.
+
+Usage:
+    python -m benchmarks.enrichment_pool --entities 500 --service-latency-ms 5
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import override
+
+import httpx
+from logger import LogLevel, LoguruLogger
+
+from src.data_deidentifier.adapters.infrastructure.enrichment.http_service import (
+    HttpPseudonymEnricher,
+)
+from src.data_deidentifier.adapters.infrastructure.enrichment.prefetch import (
+    EnrichmentPrefetcher,
+)
+from src.data_deidentifier.adapters.infrastructure.http.pool import HttpClientPool
+from src.data_deidentifier.domain.contracts.enricher.enricher import (
+    PseudonymEnricherContract,
+)
+from src.data_deidentifier.domain.contracts.enricher.manager import (
+    PseudonymEnrichmentManagerContract,
+)
+from src.data_deidentifier.domain.types.entity import Entity
+
+WARMUP_ENTITIES = 20
+
+DOCUMENTS = 5
+
+
+class StubEnrichmentHandler(BaseHTTPRequestHandler):
+    """Answers every enrichment request with the same country."""
+
+    protocol_version = "HTTP/1.1"
+    latency_seconds = 0.0
+
+    def do_POST(self) -> None:
+        """Read the request and return the enrichment."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.latency_seconds)
+        body = json.dumps({"text": "France"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: object) -> None:
+        """Keep the benchmark output quiet."""
+
+
+class SingleEnrichmentManager(PseudonymEnrichmentManagerContract):
+    """Provides the same enricher for every entity type."""
+
+    def __init__(self, enricher: PseudonymEnricherContract) -> None:
+        """Initialize the manager.
+
+        Args:
+            enricher: The enricher to provide
+        """
+        self.enricher = enricher
+
+    @override
+    def get_enricher_for_entity(self, entity_type: str) -> PseudonymEnricherContract:
+        return self.enricher
+
+
+def get_entity(index: int) -> Entity:
+    """Build a sample entity.
+
+    Args:
+        index: Number making the entity text distinct
+
+    Returns:
+        The entity
+    """
+    return Entity(
+        type="LOCATION",
+        start=0,
+        end=5,
+        score=1.0,
+        text=f"city-{index}",
+    )
+
+
+def measure(enrich: Callable[[Entity], object], entities: int) -> list[float]:
+    """Enrich sample entities and record the latency of each.
+
+    Args:
+        enrich: Enriches one entity
+        entities: Number of entities to enrich
+
+    Returns:
+        The latency of each enrichment in seconds
+    """
+    latencies = []
+    for index in range(entities):
+        entity = get_entity(index)
+        started_at = time.perf_counter()
+        enrich(entity)
+        latencies.append(time.perf_counter() - started_at)
+    return latencies
+
+
+def measure_documents(
+    enrich_document: Callable[[list[Entity]], object],
+    document_entities: int,
+) -> list[float]:
+    """Enrich sample documents and record the latency of each.
+
+    Args:
+        enrich_document: Enriches the entities of one document
+        document_entities: Number of distinct entities of a document
+
+    Returns:
+        The latency of each document in seconds
+    """
+    latencies = []
+    for document in range(DOCUMENTS):
+        entities = [
+            get_entity(document * document_entities + index)
+            for index in range(document_entities)
+        ]
+        started_at = time.perf_counter()
+        enrich_document(entities)
+        latencies.append(time.perf_counter() - started_at)
+    return latencies
+
+
+def print_latencies(name: str, latencies: list[float]) -> None:
+    """Print the latency statistics of a measure.
+
+    Args:
+        name: Name of the measure
+        latencies: The latencies measured in seconds
+    """
+    print(  # noqa: T201
+        f"{name:<12}"
+        f" mean={statistics.mean(latencies) * 1000:.3f}ms"
+        f" median={statistics.median(latencies) * 1000:.3f}ms"
+        f" p95={statistics.quantiles(latencies, n=20)[-1] * 1000:.3f}ms",
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the latency per entity of each client."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=500)
+    parser.add_argument("--document-entities", type=int, default=50)
+    parser.add_argument("--service-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    StubEnrichmentHandler.latency_seconds = args.service_latency_ms / 1000
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubEnrichmentHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/enrich"
+
+    def enrich_with_new_client(entity: Entity) -> object:
+        with httpx.Client() as client:
+            response = client.post(url, json={"text": entity.text}, timeout=10)
+            response.raise_for_status()
+            return response.json()["text"]
+
+    enricher = HttpPseudonymEnricher(
+        params={"url": url},
+        logger=LoguruLogger(level=LogLevel.WARNING),
+    )
+    clients = {
+        "new": enrich_with_new_client,
+        "pooled": enricher.get_enrichment,
+    }
+
+    manager = SingleEnrichmentManager(enricher=enricher)
+
+    def enrich_sequentially(entities: list[Entity]) -> object:
+        return [enricher.get_enrichment(entity) for entity in entities]
+
+    def enrich_concurrently(entities: list[Entity]) -> object:
+        return EnrichmentPrefetcher.prefetch(
+            entities=entities,
+            enrichment_manager=manager,
+            enrichable_types={"LOCATION"},
+            max_concurrency=16,
+        )
+
+    documents = {
+        "sequential": enrich_sequentially,
+        "prefetched": enrich_concurrently,
+    }
+
+    print(f"Stub service at {url} - {args.entities} entities")  # noqa: T201
+    try:
+        for name, enrich in clients.items():
+            measure(enrich=enrich, entities=WARMUP_ENTITIES)
+            print_latencies(
+                name=name,
+                latencies=measure(enrich=enrich, entities=args.entities),
+            )
+
+        print(  # noqa: T201
+            f"{DOCUMENTS} documents of {args.document_entities} distinct entities",
+        )
+        for name, enrich_document in documents.items():
+            enrich_document([get_entity(index) for index in range(WARMUP_ENTITIES)])
+            print_latencies(
+                name=name,
+                latencies=measure_documents(
+                    enrich_document=enrich_document,
+                    document_entities=args.document_entities,
+                ),
+            )
+    finally:
+        HttpClientPool.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
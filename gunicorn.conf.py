@@ -3,6 +3,7 @@
 See: https://docs.gunicorn.org/en/stable/settings.html
 """
 
+import gc
 import multiprocessing
 import os
 
@@ -12,13 +13,45 @@ bind = (
     f":{os.getenv('APP_INTERNAL_PORT', '8005')}"
 )
 
-reload = os.getenv("ENVIRONMENT", "development") == "development"
-
 # Worker Processes
 workers = int(os.getenv("WORKERS_COUNT", min(multiprocessing.cpu_count() * 2 + 1, 8)))
 threads = int(os.getenv("THREADS_PER_WORKER", "1"))
 worker_class = "uvicorn.workers.UvicornWorker"
 
+# Load the app and its engines once in the master, shared copy-on-write by workers
+preload_app = os.getenv("PRELOAD_APP", "false").lower() == "true"
+
+# Code reloading is not compatible with preloading
+reload = os.getenv("ENVIRONMENT", "development") == "development" and not preload_app
+
 # Logging
 loglevel = os.getenv("LOG_LEVEL", "info").lower()
 accesslog = "-"
+
+
+def on_starting(_server: object) -> None:
+    """Disable the garbage collector in the master when preloading.
+
+    Avoids freeing objects between loads, which would leave holes in the
+    memory pages shared with workers.
+    """
+    if preload_app:
+        gc.disable()
+
+
+def when_ready(_server: object) -> None:
+    """Build the engines in the master right before the workers are forked.
+
+    The garbage collector is re-enabled once the loaded objects are frozen, so
+    that only the preloading runs without collection, and the master and the
+    workers forked from it collect as usual afterwards.
+    """
+    if preload_app:
+        from src.data_deidentifier.adapters.api.preload import (  # noqa: PLC0415
+            preload_engines,
+        )
+
+        try:
+            preload_engines()
+        finally:
+            gc.enable()
@@ -1,23 +1,59 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from logger import LoggerContract
+from pydantic import BaseModel
 
 from src.data_deidentifier.adapters.api.dependencies import (
     get_config,
+    get_executor,
+    get_logger,
+    get_record_stream_anonymization_service,
     get_structured_data_anonymization_service,
     get_text_anonymization_service,
+    get_validator,
+)
+from src.data_deidentifier.adapters.api.json_stream import (
+    IncrementalJsonReader,
+    JsonDocumentStream,
+)
+from src.data_deidentifier.adapters.api.ndjson import NDJSON_MEDIA_TYPE, NdjsonStream
+from src.data_deidentifier.adapters.api.structured_payload import (
+    StructuredPayload,
+    StructuredPayloadMapper,
 )
 from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
+from src.data_deidentifier.adapters.infrastructure.execution.executor import (
+    TaskExecutor,
+)
+from src.data_deidentifier.domain.contracts.validator import EntityTypeValidatorContract
+from src.data_deidentifier.domain.services.anonymization.stream import (
+    RecordStreamAnonymizationService,
+)
 from src.data_deidentifier.domain.services.anonymization.structured import (
     StructuredDataAnonymizationService,
 )
 from src.data_deidentifier.domain.services.anonymization.text import (
     TextAnonymizationService,
 )
+from src.data_deidentifier.domain.types.stream_record import StreamRecord
+from src.data_deidentifier.domain.types.structured_analysis_options import (
+    StructuredAnalysisOptions,
+)
+from src.data_deidentifier.domain.types.text_anonymization_result import (
+    TextAnonymizationResult,
+)
 
 from .schemas import (
+    AnonymizeStreamParams,
+    AnonymizeStreamStructuredItem,
     AnonymizeStructuredDataRequest,
     AnonymizeStructuredDataResponse,
+    AnonymizeStructuredStreamParams,
+    AnonymizeTextBatchItem,
+    AnonymizeTextBatchRequest,
+    AnonymizeTextBatchResponse,
     AnonymizeTextRequest,
     AnonymizeTextResponse,
 )
@@ -38,6 +74,7 @@ async def anonymize_text(
         Depends(get_text_anonymization_service),
     ],
     config: Annotated[ConfigContract, Depends(get_config)],
+    executor: Annotated[TaskExecutor, Depends(get_executor)],
 ) -> AnonymizeTextResponse:
     """Anonymize PII entities in text content.
 
@@ -45,6 +82,7 @@ async def anonymize_text(
         query: The request containing text to anonymize
         anonymization_service: The text anonymizer service instance
         config: The application configuration
+        executor: The executor running the CPU-bound work
 
     Returns:
         Anonymized text and information about the entities that were anonymized
@@ -58,7 +96,8 @@ async def anonymize_text(
     )
     effective_entity_types = query.entity_types or config.get_default_entity_types()
 
-    result = anonymization_service.anonymize(
+    result = await executor.run(
+        anonymization_service.anonymize,
         text=query.text,
         operator=effective_operator,
         operator_params=query.operator_params,
@@ -74,6 +113,69 @@ async def anonymize_text(
             "operator": effective_operator,
             "language": effective_language,
             "min_score": effective_min_score,
+            "analysis": result.analysis_details,
+        },
+    )
+
+
+@router.post(
+    "/text/batch",
+    tags=["Data anonymization"],
+    summary="Anonymize a batch of texts for PII entities",
+    status_code=200,
+)
+async def anonymize_text_batch(
+    query: AnonymizeTextBatchRequest,
+    anonymization_service: Annotated[
+        TextAnonymizationService,
+        Depends(get_text_anonymization_service),
+    ],
+    config: Annotated[ConfigContract, Depends(get_config)],
+    executor: Annotated[TaskExecutor, Depends(get_executor)],
+) -> AnonymizeTextBatchResponse:
+    """Anonymize PII entities in a batch of texts sharing the same settings.
+
+    Args:
+        query: The request containing texts to anonymize
+        anonymization_service: The text anonymizer service instance
+        config: The application configuration
+        executor: The executor running the CPU-bound work
+
+    Returns:
+        Anonymized texts and information about the entities that were anonymized
+    """
+    effective_operator = query.operator or config.get_default_anonymization_operator()
+    effective_language = query.language or config.get_default_language()
+    effective_min_score = (
+        query.min_score
+        if query.min_score is not None
+        else config.get_default_minimum_score()
+    )
+    effective_entity_types = query.entity_types or config.get_default_entity_types()
+
+    results = await executor.run(
+        anonymization_service.anonymize_batch,
+        texts=query.texts,
+        operator=effective_operator,
+        operator_params=query.operator_params,
+        language=effective_language,
+        min_score=effective_min_score,
+        entity_types=effective_entity_types,
+    )
+
+    return AnonymizeTextBatchResponse(
+        results=[
+            AnonymizeTextBatchItem(
+                anonymized_text=result.anonymized_text,
+                detected_entities=result.detected_entities,
+            )
+            for result in results
+        ],
+        meta={
+            "operator": effective_operator,
+            "language": effective_language,
+            "min_score": effective_min_score,
+            "texts_count": len(results),
         },
     )
 
@@ -91,6 +193,7 @@ async def anonymize_structured(
         Depends(get_structured_data_anonymization_service),
     ],
     config: Annotated[ConfigContract, Depends(get_config)],
+    executor: Annotated[TaskExecutor, Depends(get_executor)],
 ) -> AnonymizeStructuredDataResponse:
     """Anonymize PII entities in structured data.
 
@@ -98,6 +201,7 @@ async def anonymize_structured(
         query: The request containing structured data to anonymize
         anonymization_service: The structured data anonymization instance
         config: The application configuration
+        executor: The executor running the CPU-bound work
 
     Returns:
         Anonymized structured data and information about the fields that were anonymized
@@ -106,19 +210,209 @@ async def anonymize_structured(
     effective_language = query.language or config.get_default_language()
     effective_entity_types = query.entity_types or config.get_default_entity_types()
 
-    result = anonymization_service.anonymize(
-        data=query.data,
+    result = await executor.run(
+        anonymization_service.anonymize,
+        data=StructuredPayloadMapper.payload_to_domain(payload=query.data),
         operator=effective_operator,
         operator_params=query.operator_params,
         language=effective_language,
         entity_types=effective_entity_types,
+        analysis_options=StructuredAnalysisOptions(
+            bypass_cache=query.bypass_cache,
+            sample_size=query.sample_size,
+            min_agreement=query.min_agreement,
+            random_seed=query.random_seed,
+            stratified_sampling=query.stratified_sampling,
+            field_hints=query.field_hints,
+            free_text=query.free_text,
+            free_text_min_length=query.free_text_min_length,
+        ),
     )
 
     return AnonymizeStructuredDataResponse(
-        anonymized_data=result.anonymized_data,
+        anonymized_data=StructuredPayloadMapper.domain_to_payload(
+            data=result.anonymized_data,
+            layout=query.data,
+        ),
         detected_fields=result.field_mapping,
         meta={
             "operator": effective_operator,
             "language": effective_language,
+            "analysis": result.analysis_details,
         },
     )
+
+
+@router.post(
+    "/stream",
+    tags=["Data anonymization"],
+    summary="Anonymize a stream of NDJSON records for PII entities",
+    status_code=200,
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def anonymize_stream(  # noqa: PLR0913
+    request: Request,
+    params: Annotated[AnonymizeStreamParams, Query()],
+    anonymization_service: Annotated[
+        RecordStreamAnonymizationService,
+        Depends(get_record_stream_anonymization_service),
+    ],
+    validator: Annotated[EntityTypeValidatorContract, Depends(get_validator)],
+    config: Annotated[ConfigContract, Depends(get_config)],
+    executor: Annotated[TaskExecutor, Depends(get_executor)],
+    logger: Annotated[LoggerContract, Depends(get_logger)],
+) -> StreamingResponse:
+    """Anonymize PII entities in a stream of records sharing the same settings.
+
+    The body is an `application/x-ndjson` stream of records, each a JSON
+    string (a text) or a JSON object (structured data). Records are read and
+    anonymized in micro-batches as the response is written, with one NDJSON
+    result line per record, in order.
+
+    Args:
+        request: The request whose body holds the records
+        params: The settings shared by all the records
+        anonymization_service: The record stream anonymization service instance
+        validator: The entity type validator, checking the settings upfront
+        config: The application configuration
+        executor: The executor running the CPU-bound work
+        logger: The logger instance
+
+    Returns:
+        A streaming response of anonymized records
+    """
+    effective_operator = params.operator or config.get_default_anonymization_operator()
+    effective_language = params.language or config.get_default_language()
+    effective_min_score = (
+        params.min_score
+        if params.min_score is not None
+        else config.get_default_minimum_score()
+    )
+    effective_entity_types = params.entity_types or config.get_default_entity_types()
+
+    # Fail before the response starts, while an error status can still be sent
+    validator.validate_entity_types(entity_types=effective_entity_types)
+
+    async def anonymize_records(records: list[StreamRecord]) -> list[BaseModel]:
+        results = await executor.run(
+            anonymization_service.anonymize_records,
+            records=records,
+            operator=effective_operator,
+            operator_params=params.operator_params,
+            language=effective_language,
+            min_score=effective_min_score,
+            entity_types=effective_entity_types,
+        )
+        return [
+            AnonymizeTextBatchItem(
+                anonymized_text=result.anonymized_text,
+                detected_entities=result.detected_entities,
+            )
+            if isinstance(result, TextAnonymizationResult)
+            else AnonymizeStreamStructuredItem(
+                anonymized_data=dict(result.anonymized_data),
+                detected_fields=result.field_mapping,
+            )
+            for result in results
+        ]
+
+    return StreamingResponse(
+        NdjsonStream.write_results(
+            batches=NdjsonStream.read_batches(
+                chunks=request.stream(),
+                batch_size=config.get_stream_batch_size(),
+                max_record_bytes=config.get_stream_max_record_bytes(),
+            ),
+            process=anonymize_records,
+            logger=logger,
+        ),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+@router.post(
+    "/structured/stream",
+    tags=["Data anonymization"],
+    summary="Anonymize a large structured document while it is received",
+    status_code=200,
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/json": {}}}},
+)
+async def anonymize_structured_stream(  # noqa: PLR0913
+    request: Request,
+    params: Annotated[AnonymizeStructuredStreamParams, Query()],
+    anonymization_service: Annotated[
+        StructuredDataAnonymizationService,
+        Depends(get_structured_data_anonymization_service),
+    ],
+    validator: Annotated[EntityTypeValidatorContract, Depends(get_validator)],
+    config: Annotated[ConfigContract, Depends(get_config)],
+    executor: Annotated[TaskExecutor, Depends(get_executor)],
+    logger: Annotated[LoggerContract, Depends(get_logger)],
+) -> StreamingResponse:
+    """Anonymize PII entities in a large JSON document, chunk by chunk.
+
+    The body is a JSON array of objects, or a JSON object whose members may
+    hold large arrays. It is parsed incrementally: array elements are
+    anonymized by chunks of `STREAM_BATCH_SIZE` and written to the response
+    as soon as they are, so that memory is bounded by the chunk size rather
+    than the document size. The response is the anonymized document alone.
+
+    Errors found before the response starts, such as an invalid entity type
+    or a body that is not a JSON array or object, get an error status. Once
+    the response has started, its status stays 200: a later failure, such as
+    invalid JSON, an oversized value, a top-level array element that is not
+    an object or an overloaded server, ends the document early, with an
+    `error` member of the top-level object, or a last `{"error": ...}` element
+    of the top-level array.
+
+    Args:
+        request: The request whose body holds the document
+        params: The anonymization settings
+        anonymization_service: The structured data anonymization service instance
+        validator: The entity type validator, checking the settings upfront
+        config: The application configuration
+        executor: The executor running the CPU-bound work
+        logger: The logger instance
+
+    Returns:
+        A streaming response of the anonymized document
+    """
+    effective_operator = params.operator or config.get_default_anonymization_operator()
+    effective_language = params.language or config.get_default_language()
+    effective_entity_types = params.entity_types or config.get_default_entity_types()
+
+    # Fail before the response starts, while an error status can still be sent
+    validator.validate_entity_types(entity_types=effective_entity_types)
+
+    async def anonymize_chunk(payload: StructuredPayload) -> StructuredPayload:
+        result = await executor.run(
+            anonymization_service.anonymize,
+            data=StructuredPayloadMapper.payload_to_domain(payload=payload),
+            operator=effective_operator,
+            operator_params=params.operator_params,
+            language=effective_language,
+            entity_types=effective_entity_types,
+            analysis_options=StructuredAnalysisOptions(field_hints=params.field_hints),
+        )
+        return StructuredPayloadMapper.domain_to_payload(
+            data=result.anonymized_data,
+            layout=payload,
+        )
+
+    document_stream = JsonDocumentStream(
+        reader=IncrementalJsonReader(
+            chunks=request.stream(),
+            max_value_bytes=config.get_stream_max_record_bytes(),
+        ),
+        process=anonymize_chunk,
+        chunk_size=config.get_stream_batch_size(),
+        logger=logger,
+    )
+    opening = await document_stream.open()
+
+    return StreamingResponse(
+        document_stream.write(opening=opening),
+        media_type="application/json",
+    )
@@ -1,13 +1,15 @@
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, Json
 
+from src.data_deidentifier.adapters.api.structured_payload import StructuredPayload
 from src.data_deidentifier.domain.types.anonymization_operator import (
     AnonymizationOperator,
 )
 from src.data_deidentifier.domain.types.entity import Entity
 from src.data_deidentifier.domain.types.language import SupportedLanguage
-from src.data_deidentifier.domain.types.structured_data import StructuredData
+
+MAX_BATCH_TEXTS = 1000
 
 
 class AnonymizeTextRequest(BaseModel):
@@ -66,6 +68,78 @@ class AnonymizeTextResponse(BaseModel):
     )
 
 
+class AnonymizeTextBatchRequest(BaseModel):
+    """Request model for anonymizing a batch of texts.
+
+    This model defines the input parameters
+    for the batch text anonymization endpoint.
+    All texts share the same settings and are analyzed in a single pass.
+    """
+
+    texts: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_TEXTS,
+        description="The text contents to anonymize",
+    )
+
+    operator: AnonymizationOperator | None = Field(
+        default=None,
+        description="Anonymization method",
+    )
+
+    operator_params: dict[str, Any] | None = Field(
+        default=None,
+        description="Anonymization operator parameters",
+    )
+
+    language: SupportedLanguage | None = Field(
+        default=None,
+        description="Language code of the texts (e.g., 'en', 'fr', 'es')",
+    )
+
+    min_score: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Minimum confidence score threshold (0.0 to 1.0)",
+    )
+
+    entity_types: list[str] | None = Field(
+        default=None,
+        description="Types of entities to detect (defaults to all supported types)",
+    )
+
+
+class AnonymizeTextBatchItem(BaseModel):
+    """Result for one text of a batch anonymization request."""
+
+    anonymized_text: str = Field(..., description="The anonymized text content")
+
+    detected_entities: list[Entity] = Field(
+        ...,
+        description="List of detected PII entities",
+    )
+
+
+class AnonymizeTextBatchResponse(BaseModel):
+    """Response model for batch text anonymization.
+
+    This model defines the structure of the response
+    returned by the batch text anonymization endpoint.
+    """
+
+    results: list[AnonymizeTextBatchItem] = Field(
+        ...,
+        description="One result per input text, in the input order",
+    )
+
+    meta: dict[str, Any] | None = Field(
+        default_factory=dict,
+        description="Statistics about the anonymization operation",
+    )
+
+
 class AnonymizeStructuredDataRequest(BaseModel):
     """Request model for anonymizing structured data.
 
@@ -73,7 +147,13 @@ class AnonymizeStructuredDataRequest(BaseModel):
     for the structured data anonymization endpoint.
     """
 
-    data: StructuredData = Field(..., description="The structured data to anonymize")
+    data: StructuredPayload = Field(
+        ...,
+        description=(
+            "The structured data to anonymize: a JSON document, a list of flat "
+            "records, or a table as {'columns': [...], 'rows': [[...]]}"
+        ),
+    )
 
     operator: AnonymizationOperator | None = Field(
         default=None,
@@ -95,6 +175,63 @@ class AnonymizeStructuredDataRequest(BaseModel):
         description="Types of entities to detect (defaults to all supported types)",
     )
 
+    bypass_cache: bool = Field(
+        default=False,
+        description=(
+            "Analyze the data even if data of the same structure has been "
+            "analyzed recently"
+        ),
+    )
+
+    sample_size: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of values analyzed per table column",
+    )
+
+    min_agreement: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Minimum share of the sampled values of a table column agreeing on "
+            "an entity type for the column to be mapped to it (0.0 to 1.0)"
+        ),
+    )
+
+    random_seed: int | None = Field(
+        default=None,
+        description="Seed of the sampling of table columns",
+    )
+
+    stratified_sampling: bool | None = Field(
+        default=None,
+        description="Sample the distinct values of table columns rather than rows",
+    )
+
+    field_hints: dict[str, str] | None = Field(
+        default=None,
+        description=(
+            "Entity type of known fields, by field name (key path for nested "
+            "documents, e.g. {'user.email': 'EMAIL_ADDRESS'}), mapped without "
+            "being analyzed"
+        ),
+    )
+
+    free_text: bool = Field(
+        default=False,
+        description=(
+            "Anonymize the entities found in fields holding long strings (e.g. "
+            "comments) instead of replacing these fields as a whole"
+        ),
+    )
+
+    free_text_min_length: int | None = Field(
+        default=None,
+        ge=1,
+        description="Length from which a string value makes its field free text",
+    )
+
 
 class AnonymizeStructuredDataResponse(BaseModel):
     """Response model for structured data anonymization.
@@ -103,7 +240,7 @@ class AnonymizeStructuredDataResponse(BaseModel):
     by the structured data anonymization endpoint.
     """
 
-    anonymized_data: StructuredData = Field(
+    anonymized_data: StructuredPayload = Field(
         ...,
         description="The anonymized structured data",
     )
@@ -117,3 +254,88 @@ class AnonymizeStructuredDataResponse(BaseModel):
         default_factory=dict,
         description="Statistics about the anonymization operation",
     )
+
+
+class AnonymizeStreamParams(BaseModel):
+    """Query parameters of the stream anonymization endpoint.
+
+    The records are sent as the NDJSON body of the request, so the settings
+    shared by all of them are passed in the query string.
+    """
+
+    operator: AnonymizationOperator | None = Field(
+        default=None,
+        description="Anonymization method",
+    )
+
+    operator_params: Json[dict[str, Any]] | None = Field(
+        default=None,
+        description="Anonymization method parameters, as a JSON object",
+    )
+
+    language: SupportedLanguage | None = Field(
+        default=None,
+        description="Language code of the records (e.g., 'en', 'fr', 'es')",
+    )
+
+    min_score: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Minimum confidence score threshold of text records (0.0 to 1.0)",
+    )
+
+    entity_types: list[str] | None = Field(
+        default=None,
+        description="Types of entities to detect (defaults to all supported types)",
+    )
+
+
+class AnonymizeStreamStructuredItem(BaseModel):
+    """Result for one JSON object record of a stream anonymization request."""
+
+    anonymized_data: dict[str, Any] = Field(
+        ...,
+        description="The anonymized JSON object",
+    )
+
+    detected_fields: dict[str, str] = Field(
+        ...,
+        description="Entity type of each anonymized field",
+    )
+
+
+class AnonymizeStructuredStreamParams(BaseModel):
+    """Query parameters of the streamed structured data anonymization endpoint.
+
+    The document is sent as the body of the request, so the settings are
+    passed in the query string.
+    """
+
+    operator: AnonymizationOperator | None = Field(
+        default=None,
+        description="Anonymization method",
+    )
+
+    operator_params: Json[dict[str, Any]] | None = Field(
+        default=None,
+        description="Anonymization operator parameters, as a JSON object",
+    )
+
+    language: SupportedLanguage | None = Field(
+        default=None,
+        description="Language code of the data (e.g., 'en', 'fr', 'es')",
+    )
+
+    entity_types: list[str] | None = Field(
+        default=None,
+        description="Types of entities to detect (defaults to all supported types)",
+    )
+
+    field_hints: Json[dict[str, str]] | None = Field(
+        default=None,
+        description=(
+            "Entity type of known fields, by field name, as a JSON object, "
+            "mapped without being analyzed"
+        ),
+    )
@@ -0,0 +1,187 @@
+from logger import LoggerContract
+
+from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
+from src.data_deidentifier.adapters.infrastructure.enrichment.factory import (
+    EnrichmentFactory,
+)
+from src.data_deidentifier.adapters.presidio.anonymizer.structured import (
+    PresidioStructuredDataAnonymizer,
+)
+from src.data_deidentifier.adapters.presidio.anonymizer.text import (
+    PresidioTextAnonymizer,
+)
+from src.data_deidentifier.adapters.presidio.pseudonymizer.structured import (
+    PresidioStructuredDataPseudonymizer,
+)
+from src.data_deidentifier.adapters.presidio.pseudonymizer.text import (
+    PresidioTextPseudonymizer,
+)
+from src.data_deidentifier.adapters.presidio.validator import PresidioValidator
+from src.data_deidentifier.domain.contracts.anonymizer.structured import (
+    StructuredDataAnonymizerContract,
+)
+from src.data_deidentifier.domain.contracts.anonymizer.text import (
+    TextAnonymizerContract,
+)
+from src.data_deidentifier.domain.contracts.enricher.manager import (
+    PseudonymEnrichmentManagerContract,
+)
+from src.data_deidentifier.domain.contracts.pseudonymizer.structured import (
+    StructuredDataPseudonymizerContract,
+)
+from src.data_deidentifier.domain.contracts.pseudonymizer.text import (
+    TextPseudonymizerContract,
+)
+from src.data_deidentifier.domain.contracts.validator import EntityTypeValidatorContract
+from src.data_deidentifier.domain.services.anonymization.stream import (
+    RecordStreamAnonymizationService,
+)
+from src.data_deidentifier.domain.services.anonymization.structured import (
+    StructuredDataAnonymizationService,
+)
+from src.data_deidentifier.domain.services.anonymization.text import (
+    TextAnonymizationService,
+)
+from src.data_deidentifier.domain.services.pseudonymization.stream import (
+    RecordStreamPseudonymizationService,
+)
+from src.data_deidentifier.domain.services.pseudonymization.structured import (
+    StructuredDataPseudonymizationService,
+)
+from src.data_deidentifier.domain.services.pseudonymization.text import (
+    TextPseudonymizationService,
+)
+
+
+class ServiceContainer:
+    """Worker-scoped holder of the application object graph.
+
+    Adapters and services keep no state between calls, so they are built once
+    per worker and shared by every request instead of being rebuilt by the
+    dependency functions on each request. Per-request state, such as the
+    pseudonymization method instance that keeps pseudonyms consistent within
+    a request, is created by the services for each call and never stored here.
+
+    Members are built by `build`, which loads the NLP models if they are not
+    loaded yet: the lifespan hook runs it in a thread before the worker serves
+    requests, so that no request builds them on the event loop.
+
+    Attributes:
+        validator: Shared entity type validator, caching the supported entity types
+        pseudonym_enricher: Shared pseudonym enricher, or None if enrichment is
+            not configured
+        text_anonymizer: Shared text anonymizer
+        structured_anonymizer: Shared structured data anonymizer
+        text_pseudonymizer: Shared text pseudonymizer
+        structured_pseudonymizer: Shared structured data pseudonymizer
+        text_anonymization_service: Shared text anonymization service
+        structured_data_anonymization_service: Shared structured data
+            anonymization service
+        text_pseudonymization_service: Shared text pseudonymization service
+        structured_data_pseudonymization_service: Shared structured data
+            pseudonymization service
+        record_stream_anonymization_service: Shared record stream
+            anonymization service
+        record_stream_pseudonymization_service: Shared record stream
+            pseudonymization service
+    """
+
+    validator: EntityTypeValidatorContract
+    pseudonym_enricher: PseudonymEnrichmentManagerContract | None
+    text_anonymizer: TextAnonymizerContract
+    structured_anonymizer: StructuredDataAnonymizerContract
+    text_pseudonymizer: TextPseudonymizerContract
+    structured_pseudonymizer: StructuredDataPseudonymizerContract
+    text_anonymization_service: TextAnonymizationService
+    structured_data_anonymization_service: StructuredDataAnonymizationService
+    text_pseudonymization_service: TextPseudonymizationService
+    structured_data_pseudonymization_service: StructuredDataPseudonymizationService
+    record_stream_anonymization_service: RecordStreamAnonymizationService
+    record_stream_pseudonymization_service: RecordStreamPseudonymizationService
+
+    def __init__(self, config: ConfigContract, logger: LoggerContract) -> None:
+        """Initialize the service container, without building its members.
+
+        Args:
+            config: The application configuration
+            logger: The logger instance
+        """
+        self.config = config
+        self.logger = logger
+
+    def build(self) -> None:
+        """Build the adapters and services shared by the requests.
+
+        Blocking, as it may load the NLP models: to be run off the event loop.
+        """
+        self.validator = PresidioValidator(logger=self.logger)
+        self.pseudonym_enricher = self._build_pseudonym_enricher()
+
+        self.text_anonymizer = PresidioTextAnonymizer(
+            config=self.config,
+            logger=self.logger,
+        )
+        self.structured_anonymizer = PresidioStructuredDataAnonymizer(
+            config=self.config,
+            logger=self.logger,
+        )
+        self.text_pseudonymizer = PresidioTextPseudonymizer(
+            config=self.config,
+            logger=self.logger,
+        )
+        self.structured_pseudonymizer = PresidioStructuredDataPseudonymizer(
+            config=self.config,
+            logger=self.logger,
+        )
+
+        self.text_anonymization_service = TextAnonymizationService(
+            anonymizer=self.text_anonymizer,
+            validator=self.validator,
+        )
+        self.structured_data_anonymization_service = StructuredDataAnonymizationService(
+            anonymizer=self.structured_anonymizer,
+            validator=self.validator,
+        )
+        self.text_pseudonymization_service = TextPseudonymizationService(
+            pseudonymizer=self.text_pseudonymizer,
+            validator=self.validator,
+            logger=self.logger,
+            pseudonym_enricher=self.pseudonym_enricher,
+        )
+        self.structured_data_pseudonymization_service = (
+            StructuredDataPseudonymizationService(
+                pseudonymizer=self.structured_pseudonymizer,
+                validator=self.validator,
+                logger=self.logger,
+                pseudonym_enricher=self.pseudonym_enricher,
+            )
+        )
+        self.record_stream_anonymization_service = RecordStreamAnonymizationService(
+            text_anonymizer=self.text_anonymizer,
+            structured_anonymizer=self.structured_anonymizer,
+            validator=self.validator,
+        )
+        self.record_stream_pseudonymization_service = (
+            RecordStreamPseudonymizationService(
+                text_pseudonymizer=self.text_pseudonymizer,
+                structured_pseudonymizer=self.structured_pseudonymizer,
+                validator=self.validator,
+                logger=self.logger,
+                pseudonym_enricher=self.pseudonym_enricher,
+            )
+        )
+
+    def _build_pseudonym_enricher(self) -> PseudonymEnrichmentManagerContract | None:
+        """Build the pseudonym enricher, if enrichment is configured.
+
+        Returns:
+            The enrichment manager, or None if enrichment is not configured
+        """
+        if not self.config.get_enrichment_configurations():
+            self.logger.warning("No configurations provided for entity enrichment")
+            return None
+
+        return EnrichmentFactory(
+            config=self.config,
+            logger=self.logger,
+        )
@@ -3,23 +3,12 @@ from typing import Annotated
 from fastapi import Depends, Request
 from logger import LoggerContract
 
+from src.data_deidentifier.adapters.api.container import ServiceContainer
 from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
-from src.data_deidentifier.adapters.infrastructure.enrichment.factory import (
-    EnrichmentFactory,
+from src.data_deidentifier.adapters.infrastructure.execution.executor import (
+    TaskExecutor,
 )
-from src.data_deidentifier.adapters.presidio.anonymizer.structured import (
-    PresidioStructuredDataAnonymizer,
-)
-from src.data_deidentifier.adapters.presidio.anonymizer.text import (
-    PresidioTextAnonymizer,
-)
-from src.data_deidentifier.adapters.presidio.pseudonymizer.structured import (
-    PresidioStructuredDataPseudonymizer,
-)
-from src.data_deidentifier.adapters.presidio.pseudonymizer.text import (
-    PresidioTextPseudonymizer,
-)
-from src.data_deidentifier.adapters.presidio.validator import PresidioValidator
+from src.data_deidentifier.adapters.presidio.warmup import PresidioEngineWarmer
 from src.data_deidentifier.domain.contracts.anonymizer.structured import (
     StructuredDataAnonymizerContract,
 )
@@ -36,12 +25,18 @@ from src.data_deidentifier.domain.contracts.pseudonymizer.text import (
     TextPseudonymizerContract,
 )
 from src.data_deidentifier.domain.contracts.validator import EntityTypeValidatorContract
+from src.data_deidentifier.domain.services.anonymization.stream import (
+    RecordStreamAnonymizationService,
+)
 from src.data_deidentifier.domain.services.anonymization.structured import (
     StructuredDataAnonymizationService,
 )
 from src.data_deidentifier.domain.services.anonymization.text import (
     TextAnonymizationService,
 )
+from src.data_deidentifier.domain.services.pseudonymization.stream import (
+    RecordStreamPseudonymizationService,
+)
 from src.data_deidentifier.domain.services.pseudonymization.structured import (
     StructuredDataPseudonymizationService,
 )
@@ -74,239 +69,212 @@ async def get_logger(request: Request) -> LoggerContract:
     return request.state.logger
 
 
+async def get_executor(request: Request) -> TaskExecutor:
+    """Get the task executor from the request state.
+
+    Args:
+        request: The FastAPI request object
+
+    Returns:
+        The executor running CPU-bound work off the event loop
+    """
+    return request.state.executor
+
+
+async def get_warmer(request: Request) -> PresidioEngineWarmer:
+    """Get the engine warmer, holding the readiness state, from the request state.
+
+    Args:
+        request: The FastAPI request object
+
+    Returns:
+        The engine warmer of the worker
+    """
+    return request.state.warmer
+
+
+async def get_container(request: Request) -> ServiceContainer:
+    """Get the worker-scoped service container from the request state.
+
+    Args:
+        request: The FastAPI request object
+
+    Returns:
+        The container holding the shared adapters and services
+    """
+    return request.state.container
+
+
 async def get_text_anonymizer(
-    logger: Annotated[LoggerContract, Depends(get_logger)],
+    container: Annotated[ServiceContainer, Depends(get_container)],
 ) -> TextAnonymizerContract:
-    """Create and return a text anonymizer instance.
+    """Get the shared text anonymizer instance.
 
     Args:
-        logger: The logger instance
+        container: The worker-scoped service container
 
     Returns:
         An implementation of the text anonymizer contract
     """
-    return PresidioTextAnonymizer(
-        logger=logger,
-    )
+    return container.text_anonymizer
 
 
 async def get_validator(
-    logger: Annotated[LoggerContract, Depends(get_logger)],
+    container: Annotated[ServiceContainer, Depends(get_container)],
 ) -> EntityTypeValidatorContract:
-    """Create and return an entity type validator instance.
+    """Get the shared entity type validator instance.
 
     Args:
-        logger: The logger instance
+        container: The worker-scoped service container
 
     Returns:
         An implementation of the entity type validator contract
     """
-    return PresidioValidator(
-        logger=logger,
-    )
+    return container.validator
 
 
 async def get_structured_anonymizer(
-    logger: Annotated[LoggerContract, Depends(get_logger)],
+    container: Annotated[ServiceContainer, Depends(get_container)],
 ) -> StructuredDataAnonymizerContract:
-    """Create and return a structured data anonymizer instance.
+    """Get the shared structured data anonymizer instance.
 
     Args:
-        logger: The logger instance
+        container: The worker-scoped service container
 
     Returns:
         An implementation of the structured data anonymizer contract
     """
-    return PresidioStructuredDataAnonymizer(
-        logger=logger,
-    )
+    return container.structured_anonymizer
 
 
 async def get_pseudonym_enricher(
-    config: Annotated[ConfigContract, Depends(get_config)],
-    logger: Annotated[LoggerContract, Depends(get_logger)],
+    container: Annotated[ServiceContainer, Depends(get_container)],
 ) -> PseudonymEnrichmentManagerContract | None:
-    """Create and return a pseudonym enricher instance.
+    """Get the shared pseudonym enricher instance.
 
     Args:
-        config: The application configuration containing enrichment settings
-        logger: The logger instance
+        container: The worker-scoped service container
 
     Returns:
-        An implementation of the enrichment manager contract.
+        An implementation of the enrichment manager contract, or None if
+            enrichment is not configured
     """
-    enrichment_configs = config.get_enrichment_configurations()
-    if not enrichment_configs:
-        logger.warning("No configurations provided for entity enrichment")
-        return None
-
-    return EnrichmentFactory(
-        config=config,
-        logger=logger,
-    )
+    return container.pseudonym_enricher
 
 
 async def get_text_pseudonymizer(
-    config: Annotated[ConfigContract, Depends(get_config)],
-    logger: Annotated[LoggerContract, Depends(get_logger)],
+    container: Annotated[ServiceContainer, Depends(get_container)],
 ) -> TextPseudonymizerContract:
-    """Create and return a text pseudonymizer instance.
+    """Get the shared text pseudonymizer instance.
 
     Args:
-        config: The application configuration
-        logger: The logger instance
+        container: The worker-scoped service container
 
     Returns:
         An implementation of the text pseudonymizer contract
     """
-    return PresidioTextPseudonymizer(
-        config=config,
-        logger=logger,
-    )
+    return container.text_pseudonymizer
 
 
 async def get_structured_pseudonymizer(
-    config: Annotated[ConfigContract, Depends(get_config)],
-    logger: Annotated[LoggerContract, Depends(get_logger)],
+    container: Annotated[ServiceContainer, Depends(get_container)],
 ) -> StructuredDataPseudonymizerContract:
-    """Create and return a structured data pseudonymizer instance.
+    """Get the shared structured data pseudonymizer instance.
 
     Args:
-        config: The application configuration
-        logger: The logger instance
+        container: The worker-scoped service container
 
     Returns:
         An implementation of the structured data pseudonymizer contract
     """
-    return PresidioStructuredDataPseudonymizer(
-        config=config,
-        logger=logger,
-    )
+    return container.structured_pseudonymizer
 
 
 async def get_text_anonymization_service(
-    anonymizer: Annotated[TextAnonymizerContract, Depends(get_text_anonymizer)],
-    validator: Annotated[EntityTypeValidatorContract, Depends(get_validator)],
+    container: Annotated[ServiceContainer, Depends(get_container)],
 ) -> TextAnonymizationService:
-    """Create and return a text anonymization service instance.
-
-    This dependency factory creates a fully configured text anonymization service
-    with all necessary dependencies injected. The service orchestrates the text
-    anonymization process by validating entity types and delegating to the
-    appropriate anonymizer implementation.
+    """Get the shared text anonymization service instance.
 
     Args:
-        anonymizer: The text anonymizer implementation to use for processing
-        validator: The entity type validator for validating input parameters
+        container: The worker-scoped service container
 
     Returns:
-        TextAnonymizationService: A configured service instance ready to
-            anonymize PII entities in text content.
+        TextAnonymizationService: The service anonymizing PII entities in
+            text content
     """
-    return TextAnonymizationService(
-        anonymizer=anonymizer,
-        validator=validator,
-    )
+    return container.text_anonymization_service
 
 
 async def get_structured_data_anonymization_service(
-    anonymizer: Annotated[
-        StructuredDataAnonymizerContract,
-        Depends(get_structured_anonymizer),
-    ],
-    validator: Annotated[EntityTypeValidatorContract, Depends(get_validator)],
+    container: Annotated[ServiceContainer, Depends(get_container)],
 ) -> StructuredDataAnonymizationService:
-    """Create and return a structured data anonymization service instance.
-
-    This dependency factory creates a fully configured structured data anonymization
-    service with all necessary dependencies injected. The service orchestrates the
-    anonymization process for structured data formats like JSON and DataFrames.
+    """Get the shared structured data anonymization service instance.
 
     Args:
-        anonymizer: The structured data anonymizer implementation to use for processing
-        validator: The entity type validator for validating input parameters
+        container: The worker-scoped service container
 
     Returns:
-        StructuredDataAnonymizationService: A configured service instance ready to
-            anonymize PII entities in structured data.
+        StructuredDataAnonymizationService: The service anonymizing PII
+            entities in structured data
     """
-    return StructuredDataAnonymizationService(
-        anonymizer=anonymizer,
-        validator=validator,
-    )
+    return container.structured_data_anonymization_service
 
 
 async def get_text_pseudonymization_service(
-    pseudonymizer: Annotated[
-        TextPseudonymizerContract,
-        Depends(get_text_pseudonymizer),
-    ],
-    validator: Annotated[EntityTypeValidatorContract, Depends(get_validator)],
-    logger: Annotated[LoggerContract, Depends(get_logger)],
-    pseudonym_enricher: Annotated[
-        PseudonymEnrichmentManagerContract | None,
-        Depends(get_pseudonym_enricher),
-    ],
+    container: Annotated[ServiceContainer, Depends(get_container)],
 ) -> TextPseudonymizationService:
-    """Create and return a text pseudonymization service instance.
-
-    This dependency factory creates a fully configured text pseudonymization service
-    with all necessary dependencies injected. The service orchestrates the text
-    pseudonymization process, including optional pseudonym enrichment for enhanced
-    utility while maintaining privacy.
+    """Get the shared text pseudonymization service instance.
 
     Args:
-        pseudonymizer: The text pseudonymizer implementation to use for processing
-        validator: The entity type validator for validating input parameters
-        logger: The logger instance for recording service operations
-        pseudonym_enricher: Optional pseudonym enricher
-            for adding contextual information to pseudonymized entities
+        container: The worker-scoped service container
 
     Returns:
-        TextPseudonymizationService: A configured service instance ready to
-            pseudonymize PII entities in text content with optional enrichment.
+        TextPseudonymizationService: The service pseudonymizing PII entities
+            in text content with optional enrichment
     """
-    return TextPseudonymizationService(
-        pseudonymizer=pseudonymizer,
-        validator=validator,
-        logger=logger,
-        pseudonym_enricher=pseudonym_enricher,
-    )
+    return container.text_pseudonymization_service
 
 
 async def get_structured_data_pseudonymization_service(
-    pseudonymizer: Annotated[
-        StructuredDataPseudonymizerContract,
-        Depends(get_structured_pseudonymizer),
-    ],
-    validator: Annotated[EntityTypeValidatorContract, Depends(get_validator)],
-    logger: Annotated[LoggerContract, Depends(get_logger)],
-    pseudonym_enricher: Annotated[
-        PseudonymEnrichmentManagerContract | None,
-        Depends(get_pseudonym_enricher),
-    ],
+    container: Annotated[ServiceContainer, Depends(get_container)],
 ) -> StructuredDataPseudonymizationService:
-    """Create and return a structured data pseudonymization service instance.
+    """Get the shared structured data pseudonymization service instance.
+
+    Args:
+        container: The worker-scoped service container
+
+    Returns:
+        StructuredDataPseudonymizationService: The service pseudonymizing PII
+            entities in structured data with optional enrichment
+    """
+    return container.structured_data_pseudonymization_service
+
+
+async def get_record_stream_anonymization_service(
+    container: Annotated[ServiceContainer, Depends(get_container)],
+) -> RecordStreamAnonymizationService:
+    """Get the shared record stream anonymization service instance.
+
+    Args:
+        container: The worker-scoped service container
+
+    Returns:
+        RecordStreamAnonymizationService: The service anonymizing PII entities
+            in streams of records
+    """
+    return container.record_stream_anonymization_service
+
 
-    This dependency factory creates a fully configured structured data pseudonymization
-    service with all necessary dependencies injected. The service orchestrates the
-    pseudonymization process for structured data formats with optional entity
-    enrichment capabilities.
+async def get_record_stream_pseudonymization_service(
+    container: Annotated[ServiceContainer, Depends(get_container)],
+) -> RecordStreamPseudonymizationService:
+    """Get the shared record stream pseudonymization service instance.
 
     Args:
-        pseudonymizer: The data pseudonymizer implementation to use for processing
-        validator: The entity type validator for validating input parameters
-        logger: The logger instance for recording service operations
-        pseudonym_enricher: Optional entity enricher for adding contextual information
-            to pseudonymized entities
+        container: The worker-scoped service container
 
     Returns:
-        StructuredDataPseudonymizationService: A configured service instance ready to
-            pseudonymize PII entities in structured data with optional enrichment.
+        RecordStreamPseudonymizationService: The service pseudonymizing PII
+            entities in streams of records with optional enrichment
     """
-    return StructuredDataPseudonymizationService(
-        pseudonymizer=pseudonymizer,
-        validator=validator,
-        logger=logger,
-        pseudonym_enricher=pseudonym_enricher,
-    )
+    return container.record_stream_pseudonymization_service
@@ -2,6 +2,9 @@ from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from logger import LogLevel
 
+from src.data_deidentifier.adapters.infrastructure.execution.executor import (
+    ExecutorOverloadedError,
+)
 from src.data_deidentifier.domain.exceptions import (
     AnonymizationError,
     DataDeidentifierError,
@@ -32,6 +35,7 @@ class ExceptionHandler:
             AnonymizationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
             DataDeidentifierError: status.HTTP_500_INTERNAL_SERVER_ERROR,
             EntityTypeValidationError: status.HTTP_400_BAD_REQUEST,
+            ExecutorOverloadedError: status.HTTP_503_SERVICE_UNAVAILABLE,
             InvalidInputDataError: status.HTTP_400_BAD_REQUEST,
             InvalidInputTextError: status.HTTP_400_BAD_REQUEST,
             PseudonymizationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,394 @@
+import codecs
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from logger import LoggerContract
+
+from src.data_deidentifier.adapters.api.ndjson import UNEXPECTED_ERROR_MESSAGE
+from src.data_deidentifier.adapters.api.structured_payload import StructuredPayload
+from src.data_deidentifier.domain.exceptions import (
+    DataDeidentifierError,
+    InvalidInputDataError,
+)
+
+type DocumentProcessor = Callable[[StructuredPayload], Awaitable[StructuredPayload]]
+
+_WHITESPACE = " \t\n\r"
+
+
+class IncrementalJsonReader:
+    """Reads JSON values one at a time from a body received in chunks.
+
+    Only the part of the body that has not been consumed yet is kept, so that
+    memory is bounded by the largest value read rather than the body size.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], max_value_bytes: int) -> None:
+        """Initialize the reader.
+
+        Args:
+            chunks: The body, as received
+            max_value_bytes: Maximum size of a value read at once
+        """
+        self.chunks = chunks
+        self.max_value_bytes = max_value_bytes
+
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    async def peek(self) -> str | None:
+        """Get the next non-whitespace character without consuming it.
+
+        Returns:
+            The character, or None at the end of the body
+        """
+        while True:
+            while (
+                self._position < len(self._buffer)
+                and self._buffer[self._position] in _WHITESPACE
+            ):
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not await self._fill():
+                return None
+
+    async def expect(self, characters: str) -> str:
+        """Consume the next non-whitespace character, which must be one of some.
+
+        Args:
+            characters: The expected characters
+
+        Returns:
+            The consumed character
+
+        Raises:
+            InvalidInputDataError: If another character, or the end of the body,
+                comes next
+        """
+        character = await self.peek()
+        if character is None or character not in characters:
+            msg = f"Invalid JSON document: expected one of {characters!r}"
+            raise InvalidInputDataError(msg)
+        self._position += 1
+        return character
+
+    async def read_value(self) -> Any:  # noqa: ANN401
+        """Consume the next JSON value.
+
+        Returns:
+            The decoded value
+
+        Raises:
+            InvalidInputDataError: If the value is invalid or too large
+        """
+        await self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                value, end = None, None
+
+            # A value ending with the buffer may be cut, e.g. a number
+            if end is not None and (end < len(self._buffer) or self._exhausted):
+                self._position = end
+                return value
+
+            if len(self._buffer) - self._position > self.max_value_bytes:
+                msg = f"JSON value larger than {self.max_value_bytes} bytes"
+                raise InvalidInputDataError(msg)
+
+            if not await self._fill():
+                if end is not None:
+                    self._position = end
+                    return value
+                raise InvalidInputDataError("Invalid JSON document")
+
+    async def read_end(self) -> None:
+        """Check that nothing but whitespace is left in the body.
+
+        Raises:
+            InvalidInputDataError: If some content is left
+        """
+        if await self.peek() is not None:
+            raise InvalidInputDataError("Invalid JSON document: unexpected content")
+
+    async def _fill(self) -> bool:
+        """Read the next chunk of the body, dropping the consumed content.
+
+        Returns:
+            False if the body has been read entirely, True otherwise
+        """
+        if self._exhausted:
+            return False
+
+        self._buffer = self._buffer[self._position :]
+        self._position = 0
+
+        try:
+            chunk = await anext(self.chunks)
+        except StopAsyncIteration:
+            self._exhausted = True
+            self._buffer += self._text_decoder.decode(b"", final=True)
+            return False
+
+        self._buffer += self._text_decoder.decode(chunk)
+        return True
+
+
+@dataclass
+class _OpenContainer:
+    """An array or object of the output document not closed yet.
+
+    Attributes:
+        closing: The character closing the container
+        empty: Whether nothing has been written in the container yet
+    """
+
+    closing: bytes
+    empty: bool = True
+
+
+class JsonDocumentStream:
+    """De-identifies a large JSON document while it is being received.
+
+    The document is a JSON array of objects, or a JSON object. The elements of
+    the top-level array, and of the arrays held by the members of the object,
+    are read and processed by chunks; the other members of the object are
+    processed one by one. The output is written as soon as each chunk or
+    member is processed, so that memory is bounded by the chunk size rather
+    than the document size.
+
+    Once the output has started, its status can no longer change: a failure,
+    e.g. invalid JSON further in the body or an overloaded server, ends the
+    output early with the containers still open closed and an error, as an
+    `error` member of the top-level object or a last `{"error": ...}` element
+    of the top-level array, so that the output remains a valid JSON document.
+    Unexpected errors end it the same way, with a generic message.
+    """
+
+    def __init__(
+        self,
+        reader: IncrementalJsonReader,
+        process: DocumentProcessor,
+        chunk_size: int,
+        logger: LoggerContract,
+    ) -> None:
+        """Initialize the document stream.
+
+        Args:
+            reader: The reader of the request body
+            process: De-identifies a structured payload, returning it in the
+                same layout
+            chunk_size: Number of array elements processed together
+            logger: Logger for logging events
+        """
+        self.reader = reader
+        self.process = process
+        self.chunk_size = chunk_size
+        self.logger = logger
+
+        # Containers of the output written so far, outermost first
+        self._containers: list[_OpenContainer] = []
+        # Whether an object key has been written without its value yet
+        self._awaiting_value = False
+
+    async def open(self) -> str:
+        """Read the start of the document, before the response is started.
+
+        Returns:
+            The opening character of the document
+
+        Raises:
+            InvalidInputDataError: If the body is not a JSON array or object
+        """
+        return await self.reader.expect("[{")
+
+    async def write(self, opening: str) -> AsyncIterator[bytes]:
+        """Process the rest of the document and write the output document.
+
+        Args:
+            opening: The opening character returned by `open`
+
+        Yields:
+            The parts of the output JSON document, ended by an error if the
+            rest of the document cannot be processed
+        """
+        parts = self._write_array(key=None) if opening == "[" else self._write_object()
+        try:
+            async for part in parts:
+                yield part
+        except DataDeidentifierError as e:
+            self.logger.warning(
+                "Structured stream ended early",
+                {"open_containers": len(self._containers), "error": str(e)},
+            )
+            yield self._write_error(message=str(e))
+        except Exception as e:
+            self.logger.exception(
+                "Structured stream failed unexpectedly",
+                e,
+                {"open_containers": len(self._containers)},
+            )
+            yield self._write_error(message=UNEXPECTED_ERROR_MESSAGE)
+
+    def _write_error(self, message: str) -> bytes:
+        """Close the containers still open, adding an error to the outermost.
+
+        Args:
+            message: Why the document could not be processed entirely
+
+        Returns:
+            The end of the output document
+        """
+        end = b"null" if self._awaiting_value else b""
+        error = json.dumps(message).encode()
+        for depth, container in reversed(list(enumerate(self._containers))):
+            if depth == 0:
+                separator = b"" if container.empty else b","
+                member = (
+                    b'{"error":' + error + b"}"
+                    if container.closing == b"]"
+                    else b'"error":' + error
+                )
+                end += separator + member
+            end += container.closing
+
+        self._containers = []
+        self._awaiting_value = False
+        return end
+
+    def _open(self, opening: bytes, closing: bytes) -> bytes:
+        """Record a container being opened in the output.
+
+        Args:
+            opening: The character opening the container
+            closing: The character closing the container
+
+        Returns:
+            The opening character
+        """
+        if self._containers:
+            self._containers[-1].empty = False
+        self._containers.append(_OpenContainer(closing=closing))
+        self._awaiting_value = False
+        return opening
+
+    async def _close(self) -> bytes:
+        """Record the innermost container being closed in the output.
+
+        The end of the body is checked before the outermost container is
+        closed, so that an error can still be added to it.
+
+        Returns:
+            The closing character
+
+        Raises:
+            InvalidInputDataError: If some content follows the document
+        """
+        if len(self._containers) == 1:
+            await self.reader.read_end()
+        return self._containers.pop().closing
+
+    async def _write_object(self) -> AsyncIterator[bytes]:
+        """Process the members of the top-level object, once its `{` is consumed.
+
+        Yields:
+            The parts of the output object
+        """
+        yield self._open(opening=b"{", closing=b"}")
+        if await self.reader.peek() == "}":
+            await self.reader.expect("}")
+            yield await self._close()
+            return
+
+        separator = b""
+        while True:
+            key = await self.reader.read_value()
+            if not isinstance(key, str):
+                raise InvalidInputDataError("Invalid JSON document: expected a key")
+            await self.reader.expect(":")
+
+            yield separator + json.dumps(key).encode() + b":"
+            self._containers[-1].empty = False
+            self._awaiting_value = True
+            if await self.reader.peek() == "[":
+                await self.reader.expect("[")
+                async for part in self._write_array(key=key):
+                    yield part
+            else:
+                value = await self.reader.read_value()
+                processed = await self.process({key: value})
+                yield json.dumps(processed[key]).encode()
+                self._awaiting_value = False
+
+            separator = b","
+            if await self.reader.expect(",}") == "}":
+                break
+
+        yield await self._close()
+
+    async def _write_array(self, key: str | None) -> AsyncIterator[bytes]:
+        """Process the elements of an array by chunks, once its `[` is consumed.
+
+        Args:
+            key: Key of the object member holding the array, or None for the
+                top-level array
+
+        Yields:
+            The parts of the output array
+        """
+        yield self._open(opening=b"[", closing=b"]")
+        if await self.reader.peek() == "]":
+            await self.reader.expect("]")
+            yield await self._close()
+            return
+
+        separator = b""
+        chunk: list[Any] = []
+        while True:
+            chunk.append(await self.reader.read_value())
+            closed = await self.reader.expect(",]") == "]"
+
+            if len(chunk) >= self.chunk_size or closed:
+                for element in await self._process_chunk(key=key, chunk=chunk):
+                    yield separator + json.dumps(element).encode()
+                    separator = b","
+                    self._containers[-1].empty = False
+                chunk = []
+
+            if closed:
+                break
+
+        yield await self._close()
+
+    async def _process_chunk(self, key: str | None, chunk: list[Any]) -> list[Any]:
+        """Process a chunk of array elements.
+
+        Elements of the top-level array are processed as a list of records,
+        elements of a member array as the array of a document holding the
+        member only, so that their fields are named by key path.
+
+        Args:
+            key: Key of the object member holding the array, or None for the
+                top-level array
+            chunk: The elements to process
+
+        Returns:
+            The processed elements, in order
+
+        Raises:
+            InvalidInputDataError: If an element of the top-level array is not
+                an object
+        """
+        if key is not None:
+            return (await self.process({key: chunk}))[key]
+
+        if not all(isinstance(element, dict) for element in chunk):
+            raise InvalidInputDataError("Top-level array elements must be objects")
+        return await self.process(chunk)
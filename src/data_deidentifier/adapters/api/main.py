@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
@@ -6,9 +7,20 @@ from fastapi import FastAPI
 from logger import LogLevel, LoguruLogger
 
 from src.data_deidentifier.adapters.infrastructure.config.settings import Settings
+from src.data_deidentifier.adapters.infrastructure.execution.executor import (
+    TaskExecutor,
+)
+from src.data_deidentifier.adapters.infrastructure.http.breaker import (
+    CircuitBreakerRegistry,
+)
+from src.data_deidentifier.adapters.infrastructure.http.pool import HttpClientPool
+from src.data_deidentifier.adapters.presidio.engines import PresidioEngineFactory
+from src.data_deidentifier.adapters.presidio.warmup import PresidioEngineWarmer
 
 from .anonymize.router import router as anonymize_router
+from .container import ServiceContainer
 from .exception_handler import ExceptionHandler
+from .monitoring.router import router as monitoring_router
 from .pseudonymize.router import router as pseudonymize_router
 
 config = Settings()
@@ -22,7 +34,8 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[dict[str, Any]]:
         _app: The FastAPI application instance
 
     Yields:
-        A dictionary containing logger and config objects
+        A dictionary containing logger, config, executor, warmer and container
+        objects
     """
     logger = LoguruLogger(level=config.get_log_level())
     logger.info(
@@ -33,10 +46,55 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[dict[str, Any]]:
         },
     )
 
-    yield {"config": config, "logger": logger}
+    PresidioEngineFactory.configure(config=config)
+    HttpClientPool.configure(config=config, logger=logger)
+    CircuitBreakerRegistry.configure(config=config)
+
+    executor = TaskExecutor(
+        logger=logger,
+        mode=config.get_execution_mode(),
+        max_workers=config.get_execution_max_workers(),
+        max_queue_size=config.get_execution_max_queue_size(),
+    )
+
+    # Adapters and services are shared by every request of the worker. They
+    # are built off the event loop, before the first request, so that no
+    # request loads the NLP models on the loop
+    container = ServiceContainer(config=config, logger=logger)
+    await asyncio.to_thread(container.build)
+
+    # Warm the shared adapters up in the background: the worker answers health
+    # and readiness probes meanwhile, and only reports ready once it is done
+    warmer = PresidioEngineWarmer(config=config, logger=logger)
+    warmup_task = None
+    if config.is_warmup_enabled():
+        warmup_task = asyncio.create_task(
+            asyncio.to_thread(
+                warmer.warm_up,
+                validator=container.validator,
+                text_anonymizer=container.text_anonymizer,
+                structured_anonymizer=container.structured_anonymizer,
+            ),
+        )
+    else:
+        warmer.mark_ready()
+
+    yield {
+        "config": config,
+        "logger": logger,
+        "executor": executor,
+        "warmer": warmer,
+        "container": container,
+    }
 
     logger.info("Application shutting down")
 
+    if warmup_task is not None and not warmup_task.done():
+        await warmup_task
+
+    executor.shutdown()
+    HttpClientPool.close()
+
 
 app = FastAPI(
     title="Data deidentification API",
@@ -50,3 +108,4 @@ exception_handler.configure(app=app)
 
 app.include_router(router=anonymize_router)
 app.include_router(router=pseudonymize_router)
+app.include_router(router=monitoring_router)
@@ -0,0 +1,93 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response, status
+
+from src.data_deidentifier.adapters.api.dependencies import get_executor, get_warmer
+from src.data_deidentifier.adapters.infrastructure.enrichment.cached import (
+    CachedPseudonymEnricher,
+)
+from src.data_deidentifier.adapters.infrastructure.execution.executor import (
+    TaskExecutor,
+)
+from src.data_deidentifier.adapters.infrastructure.http.breaker import (
+    CircuitBreakerRegistry,
+)
+from src.data_deidentifier.adapters.infrastructure.system.memory import (
+    ProcessMemoryInspector,
+)
+from src.data_deidentifier.adapters.presidio.engines import PresidioEngineFactory
+from src.data_deidentifier.adapters.presidio.warmup import PresidioEngineWarmer
+
+from .schemas import HealthResponse, MetricsResponse, ReadinessResponse
+
+router = APIRouter()
+
+
+@router.get(
+    "/health",
+    tags=["Monitoring"],
+    summary="Liveness probe",
+    status_code=200,
+)
+async def health() -> HealthResponse:
+    """Report that the worker is alive and its event loop responsive.
+
+    Returns:
+        The liveness status
+    """
+    return HealthResponse(status="ok")
+
+
+@router.get(
+    "/ready",
+    tags=["Monitoring"],
+    summary="Readiness probe",
+    status_code=200,
+    responses={503: {"model": ReadinessResponse}},
+)
+async def ready(
+    response: Response,
+    warmer: Annotated[PresidioEngineWarmer, Depends(get_warmer)],
+) -> ReadinessResponse:
+    """Report whether the worker has warmed its engines up and can take traffic.
+
+    Args:
+        response: The outgoing response, whose status is set to 503 until ready
+        warmer: The engine warmer of the worker
+
+    Returns:
+        The readiness status and warm-up details
+    """
+    if not warmer.is_ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return ReadinessResponse(status="warming_up", details=warmer.get_status())
+
+    return ReadinessResponse(status="ready", details=warmer.get_status())
+
+
+@router.get(
+    "/metrics",
+    tags=["Monitoring"],
+    summary="Get runtime metrics of the current worker",
+    status_code=200,
+)
+async def get_metrics(
+    executor: Annotated[TaskExecutor, Depends(get_executor)],
+) -> MetricsResponse:
+    """Get runtime metrics of the worker process serving the request.
+
+    Args:
+        executor: The task executor instance
+
+    Returns:
+        Metrics of the worker components
+    """
+    return MetricsResponse(
+        executor=executor.get_metrics(),
+        memory=ProcessMemoryInspector.get_usage(),
+        caches={
+            **PresidioEngineFactory.get_caches_metrics(),
+            **CachedPseudonymEnricher.get_cache_metrics(),
+        },
+        circuit_breakers=CircuitBreakerRegistry.get_metrics(),
+    )
@@ -0,0 +1,52 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class MetricsResponse(BaseModel):
+    """Response model for the runtime metrics.
+
+    This model defines the structure of the response
+    returned by the metrics endpoint.
+    """
+
+    executor: dict[str, Any] = Field(
+        ...,
+        description="Queue depth, wait time and throughput of the task executor",
+    )
+
+    memory: dict[str, int] | None = Field(
+        default=None,
+        description="Resident, shared and unique memory of the worker process",
+    )
+
+    caches: dict[str, dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Size, hit rate and evictions of the caches in use",
+    )
+
+    circuit_breakers: dict[str, dict[str, Any]] = Field(
+        default_factory=dict,
+        description="State and failure rate of the circuit of each enrichment service",
+    )
+
+
+class HealthResponse(BaseModel):
+    """Response model for the liveness probe."""
+
+    status: str = Field(..., description="Liveness status of the worker")
+
+
+class ReadinessResponse(BaseModel):
+    """Response model for the readiness probe.
+
+    This model defines the structure of the response
+    returned by the readiness endpoint.
+    """
+
+    status: str = Field(..., description="Readiness status of the worker")
+
+    details: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Warm-up duration and error, if any",
+    )
@@ -0,0 +1,224 @@
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+
+from logger import LoggerContract
+from pydantic import BaseModel
+
+from src.data_deidentifier.domain.exceptions import DataDeidentifierError
+from src.data_deidentifier.domain.types.stream_record import StreamRecord
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Error reported in the body for unexpected errors, whose details are only logged
+UNEXPECTED_ERROR_MESSAGE = "An internal server error occurred."
+
+type RecordsProcessor = Callable[[list[StreamRecord]], Awaitable[list[BaseModel]]]
+
+
+@dataclass
+class NdjsonLine:
+    """A line of an NDJSON request body.
+
+    Attributes:
+        number: Position of the line in the body, starting at 1
+        record: The record held by the line, if it is valid
+        error: Why the line was rejected, if it is invalid
+    """
+
+    number: int
+    record: StreamRecord | None = None
+    error: str | None = None
+
+
+class NdjsonStream:
+    """Reads NDJSON request bodies in micro-batches and writes NDJSON results.
+
+    The body is consumed as the results are written, so that a request holds
+    at most one micro-batch of records and one line being read in memory,
+    whatever the size of its body. Each line holds a record, either a JSON
+    string (a text) or a JSON object (structured data), and gets one result
+    line, in the input order. Invalid lines get an error line instead, and
+    the stream goes on.
+    """
+
+    @classmethod
+    async def read_batches(
+        cls,
+        chunks: AsyncIterator[bytes],
+        batch_size: int,
+        max_record_bytes: int,
+    ) -> AsyncIterator[list[NdjsonLine]]:
+        """Group the lines of a body into micro-batches.
+
+        Args:
+            chunks: The body, as received
+            batch_size: Maximum number of lines of a micro-batch
+            max_record_bytes: Maximum size of a line, above which it is rejected
+
+        Yields:
+            The non-blank lines of the body, by micro-batches
+        """
+        batch = []
+        async for line in cls.read_lines(
+            chunks=chunks,
+            max_record_bytes=max_record_bytes,
+        ):
+            batch.append(line)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    @classmethod
+    async def read_lines(
+        cls,
+        chunks: AsyncIterator[bytes],
+        max_record_bytes: int,
+    ) -> AsyncIterator[NdjsonLine]:
+        """Split a body into lines and parse their records.
+
+        Args:
+            chunks: The body, as received
+            max_record_bytes: Maximum size of a line, above which it is rejected
+
+        Yields:
+            The non-blank lines of the body
+        """
+        buffer = bytearray()
+        number = 0
+        oversized = False
+
+        async for chunk in chunks:
+            buffer += chunk
+            while (end := buffer.find(b"\n")) != -1:
+                number += 1
+                content = bytes(buffer[:end])
+                del buffer[: end + 1]
+                line = (
+                    cls._reject_oversized(number, max_record_bytes)
+                    if oversized or len(content) > max_record_bytes
+                    else cls._parse(number=number, content=content)
+                )
+                oversized = False
+                if line is not None:
+                    yield line
+
+            # Drop the start of a line too long to be kept, up to its end
+            if len(buffer) > max_record_bytes:
+                buffer.clear()
+                oversized = True
+
+        if buffer or oversized:
+            number += 1
+            line = (
+                cls._reject_oversized(number, max_record_bytes)
+                if oversized
+                else cls._parse(number=number, content=bytes(buffer))
+            )
+            if line is not None:
+                yield line
+
+    @classmethod
+    async def write_results(
+        cls,
+        batches: AsyncIterator[list[NdjsonLine]],
+        process: RecordsProcessor,
+        logger: LoggerContract,
+    ) -> AsyncIterator[bytes]:
+        """De-identify micro-batches of lines and write one result line per line.
+
+        A micro-batch failing as a whole, e.g. when the server is overloaded,
+        gets an error line per record and the stream goes on. Unexpected errors
+        are handled the same way, with a generic message, since the response
+        status can no longer tell the client about them.
+
+        Args:
+            batches: The lines of the body, by micro-batches
+            process: De-identifies the records of a micro-batch, returning one
+                result per record, in order
+            logger: Logger for logging events
+
+        Yields:
+            The NDJSON result lines
+        """
+        async for batch in batches:
+            valid_lines = [line for line in batch if line.error is None]
+            results: dict[int, BaseModel] = {}
+            batch_error = None
+            if valid_lines:
+                try:
+                    processed = await process([line.record for line in valid_lines])
+                except DataDeidentifierError as e:
+                    logger.warning(
+                        "Stream micro-batch failed",
+                        {"records_count": len(valid_lines), "error": str(e)},
+                    )
+                    batch_error = str(e)
+                except Exception as e:
+                    logger.exception(
+                        "Stream micro-batch failed unexpectedly",
+                        e,
+                        {"records_count": len(valid_lines)},
+                    )
+                    batch_error = UNEXPECTED_ERROR_MESSAGE
+                else:
+                    results = {
+                        line.number: result
+                        for line, result in zip(valid_lines, processed, strict=True)
+                    }
+
+            for line in batch:
+                if line.number in results:
+                    payload = {
+                        "line": line.number,
+                        **results[line.number].model_dump(mode="json"),
+                    }
+                else:
+                    payload = {"line": line.number, "error": line.error or batch_error}
+                yield (json.dumps(payload) + "\n").encode()
+
+    @staticmethod
+    def _parse(number: int, content: bytes) -> NdjsonLine | None:
+        """Parse the record of a line.
+
+        Args:
+            number: Position of the line in the body
+            content: The line, without its line break
+
+        Returns:
+            The parsed line, or None for a blank line
+        """
+        if not content.strip():
+            return None
+
+        try:
+            record = json.loads(content)
+        except ValueError:
+            return NdjsonLine(number=number, error="Invalid JSON")
+
+        if isinstance(record, str) or (isinstance(record, dict) and record):
+            return NdjsonLine(number=number, record=record)
+
+        return NdjsonLine(
+            number=number,
+            error="A record must be a JSON string or a non-empty JSON object",
+        )
+
+    @staticmethod
+    def _reject_oversized(number: int, max_record_bytes: int) -> NdjsonLine:
+        """Reject a line longer than the maximum size of a record.
+
+        Args:
+            number: Position of the line in the body
+            max_record_bytes: Maximum size of a line
+
+        Returns:
+            The rejected line
+        """
+        return NdjsonLine(
+            number=number,
+            error=f"Record larger than {max_record_bytes} bytes",
+        )
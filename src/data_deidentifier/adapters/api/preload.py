@@ -0,0 +1,51 @@
+import gc
+
+from logger import LoguruLogger
+
+from src.data_deidentifier.adapters.api.container import ServiceContainer
+from src.data_deidentifier.adapters.infrastructure.config.settings import Settings
+from src.data_deidentifier.adapters.infrastructure.system.memory import (
+    ProcessMemoryInspector,
+)
+from src.data_deidentifier.adapters.presidio.engines import PresidioEngineFactory
+from src.data_deidentifier.adapters.presidio.warmup import PresidioEngineWarmer
+
+
+def preload_engines() -> None:
+    """Build the Presidio engines in the gunicorn master before workers fork.
+
+    Workers then inherit the loaded models through copy-on-write pages instead
+    of loading their own copy. The objects alive at this point are moved to the
+    permanent generation (`gc.freeze`), so that garbage collections in workers
+    never write to their pages and break the sharing.
+
+    Raises:
+        RuntimeError: If the engines could not be built
+    """
+    config = Settings()
+    logger = LoguruLogger(level=config.get_log_level())
+
+    PresidioEngineFactory.configure(config=config)
+
+    container = ServiceContainer(config=config, logger=logger)
+    container.build()
+
+    warmer = PresidioEngineWarmer(config=config, logger=logger)
+    warmer.warm_up(
+        validator=container.validator,
+        text_anonymizer=container.text_anonymizer,
+        structured_anonymizer=container.structured_anonymizer,
+    )
+    if not warmer.is_ready:
+        raise RuntimeError("Engines preloading failed")
+
+    gc.collect()
+    gc.freeze()
+
+    logger.info(
+        "Engines preloaded in master process",
+        {
+            "frozen_objects": gc.get_freeze_count(),
+            "memory": ProcessMemoryInspector.get_usage(),
+        },
+    )
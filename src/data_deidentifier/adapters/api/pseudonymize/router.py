@@ -1,23 +1,53 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from logger import LoggerContract
+from pydantic import BaseModel
 
 from src.data_deidentifier.adapters.api.dependencies import (
     get_config,
+    get_executor,
+    get_logger,
+    get_record_stream_pseudonymization_service,
     get_structured_data_pseudonymization_service,
     get_text_pseudonymization_service,
+    get_validator,
+)
+from src.data_deidentifier.adapters.api.ndjson import NDJSON_MEDIA_TYPE, NdjsonStream
+from src.data_deidentifier.adapters.api.structured_payload import (
+    StructuredPayloadMapper,
 )
 from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
+from src.data_deidentifier.adapters.infrastructure.execution.executor import (
+    TaskExecutor,
+)
+from src.data_deidentifier.domain.contracts.validator import EntityTypeValidatorContract
+from src.data_deidentifier.domain.services.pseudonymization.stream import (
+    RecordStreamPseudonymizationService,
+)
 from src.data_deidentifier.domain.services.pseudonymization.structured import (
     StructuredDataPseudonymizationService,
 )
 from src.data_deidentifier.domain.services.pseudonymization.text import (
     TextPseudonymizationService,
 )
+from src.data_deidentifier.domain.types.stream_record import StreamRecord
+from src.data_deidentifier.domain.types.structured_analysis_options import (
+    StructuredAnalysisOptions,
+)
+from src.data_deidentifier.domain.types.text_pseudonymization_result import (
+    TextPseudonymizationResult,
+)
 
 from .schemas import (
+    PseudonymizeStreamParams,
+    PseudonymizeStreamStructuredItem,
     PseudonymizeStructuredDataRequest,
     PseudonymizeStructuredDataResponse,
+    PseudonymizeTextBatchItem,
+    PseudonymizeTextBatchRequest,
+    PseudonymizeTextBatchResponse,
     PseudonymizeTextRequest,
     PseudonymizeTextResponse,
 )
@@ -38,6 +68,7 @@ async def pseudonymize_text(
         Depends(get_text_pseudonymization_service),
     ],
     config: Annotated[ConfigContract, Depends(get_config)],
+    executor: Annotated[TaskExecutor, Depends(get_executor)],
 ) -> PseudonymizeTextResponse:
     """Pseudonymize PII entities in text content.
 
@@ -45,6 +76,7 @@ async def pseudonymize_text(
         query: The request containing text to pseudonymize
         pseudonymization_service: The text pseudonymization instance
         config: The application configuration
+        executor: The executor running the CPU-bound work
 
     Returns:
         Pseudonymized text and information about the entities that were pseudonymized
@@ -58,7 +90,8 @@ async def pseudonymize_text(
     )
     effective_entity_types = query.entity_types or config.get_default_entity_types()
 
-    result = pseudonymization_service.pseudonymize(
+    result = await executor.run(
+        pseudonymization_service.pseudonymize,
         text=query.text,
         method=effective_method,
         method_params=query.method_params,
@@ -74,6 +107,71 @@ async def pseudonymize_text(
             "method": effective_method,
             "language": effective_language,
             "min_score": effective_min_score,
+            "analysis": result.analysis_details,
+        },
+    )
+
+
+@router.post(
+    "/text/batch",
+    tags=["Text pseudonymization"],
+    summary="Pseudonymize a batch of texts for PII entities",
+    status_code=200,
+)
+async def pseudonymize_text_batch(
+    query: PseudonymizeTextBatchRequest,
+    pseudonymization_service: Annotated[
+        TextPseudonymizationService,
+        Depends(get_text_pseudonymization_service),
+    ],
+    config: Annotated[ConfigContract, Depends(get_config)],
+    executor: Annotated[TaskExecutor, Depends(get_executor)],
+) -> PseudonymizeTextBatchResponse:
+    """Pseudonymize PII entities in a batch of texts sharing the same settings.
+
+    Pseudonyms are consistent across all texts of the batch.
+
+    Args:
+        query: The request containing texts to pseudonymize
+        pseudonymization_service: The text pseudonymization instance
+        config: The application configuration
+        executor: The executor running the CPU-bound work
+
+    Returns:
+        Pseudonymized texts and information about the entities that were pseudonymized
+    """
+    effective_method = query.method or config.get_default_pseudonymization_method()
+    effective_language = query.language or config.get_default_language()
+    effective_min_score = (
+        query.min_score
+        if query.min_score is not None
+        else config.get_default_minimum_score()
+    )
+    effective_entity_types = query.entity_types or config.get_default_entity_types()
+
+    results = await executor.run(
+        pseudonymization_service.pseudonymize_batch,
+        texts=query.texts,
+        method=effective_method,
+        method_params=query.method_params,
+        language=effective_language,
+        min_score=effective_min_score,
+        entity_types=effective_entity_types,
+    )
+
+    return PseudonymizeTextBatchResponse(
+        results=[
+            PseudonymizeTextBatchItem(
+                pseudonymized_text=result.pseudonymized_text,
+                detected_entities=result.detected_entities,
+            )
+            for result in results
+        ],
+        meta={
+            "method": effective_method,
+            "language": effective_language,
+            "min_score": effective_min_score,
+            "texts_count": len(results),
         },
     )
 
@@ -91,6 +189,7 @@ async def pseudonymize_structured(
         Depends(get_structured_data_pseudonymization_service),
     ],
     config: Annotated[ConfigContract, Depends(get_config)],
+    executor: Annotated[TaskExecutor, Depends(get_executor)],
 ) -> PseudonymizeStructuredDataResponse:
     """Pseudonymize PII entities in structured data.
 
@@ -98,6 +197,7 @@ async def pseudonymize_structured(
         query: The request containing structured data to pseudonymize
         pseudonymization_service: The structured data pseudonymization instance
         config: The application configuration
+        executor: The executor running the CPU-bound work
 
     Returns:
         Pseudonymized structured data
@@ -107,19 +207,126 @@ async def pseudonymize_structured(
     effective_language = query.language or config.get_default_language()
     effective_entity_types = query.entity_types or config.get_default_entity_types()
 
-    result = pseudonymization_service.pseudonymize(
-        data=query.data,
+    result = await executor.run(
+        pseudonymization_service.pseudonymize,
+        data=StructuredPayloadMapper.payload_to_domain(payload=query.data),
         method=effective_method,
         method_params=query.method_params,
         language=effective_language,
         entity_types=effective_entity_types,
+        analysis_options=StructuredAnalysisOptions(
+            bypass_cache=query.bypass_cache,
+            sample_size=query.sample_size,
+            min_agreement=query.min_agreement,
+            random_seed=query.random_seed,
+            stratified_sampling=query.stratified_sampling,
+            field_hints=query.field_hints,
+        ),
     )
 
     return PseudonymizeStructuredDataResponse(
-        pseudonymized_data=result.pseudonymized_data,
+        pseudonymized_data=StructuredPayloadMapper.domain_to_payload(
+            data=result.pseudonymized_data,
+            layout=query.data,
+        ),
         detected_fields=result.field_mapping,
         meta={
             "method": effective_method,
             "language": effective_language,
+            "analysis": result.analysis_details,
         },
     )
+
+
+@router.post(
+    "/stream",
+    tags=["Data pseudonymization"],
+    summary="Pseudonymize a stream of NDJSON records for PII entities",
+    status_code=200,
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def pseudonymize_stream(  # noqa: PLR0913
+    request: Request,
+    params: Annotated[PseudonymizeStreamParams, Query()],
+    pseudonymization_service: Annotated[
+        RecordStreamPseudonymizationService,
+        Depends(get_record_stream_pseudonymization_service),
+    ],
+    validator: Annotated[EntityTypeValidatorContract, Depends(get_validator)],
+    config: Annotated[ConfigContract, Depends(get_config)],
+    executor: Annotated[TaskExecutor, Depends(get_executor)],
+    logger: Annotated[LoggerContract, Depends(get_logger)],
+) -> StreamingResponse:
+    """Pseudonymize PII entities in a stream of records sharing the same settings.
+
+    The body is an `application/x-ndjson` stream of records, each a JSON
+    string (a text) or a JSON object (structured data). Records are read and
+    pseudonymized in micro-batches as the response is written, with one
+    NDJSON result line per record, in order. Pseudonyms are consistent across
+    all the records of the stream.
+
+    Args:
+        request: The request whose body holds the records
+        params: The settings shared by all the records
+        pseudonymization_service: The record stream pseudonymization service
+            instance
+        validator: The entity type validator, checking the settings upfront
+        config: The application configuration
+        executor: The executor running the CPU-bound work
+        logger: The logger instance
+
+    Returns:
+        A streaming response of pseudonymized records
+    """
+    effective_method = params.method or config.get_default_pseudonymization_method()
+    effective_language = params.language or config.get_default_language()
+    effective_min_score = (
+        params.min_score
+        if params.min_score is not None
+        else config.get_default_minimum_score()
+    )
+    effective_entity_types = params.entity_types or config.get_default_entity_types()
+
+    # Fail before the response starts, while an error status can still be sent
+    validator.validate_entity_types(entity_types=effective_entity_types)
+    method = pseudonymization_service.create_method(
+        method=effective_method,
+        method_params=params.method_params,
+    )
+
+    async def pseudonymize_records(records: list[StreamRecord]) -> list[BaseModel]:
+        nonlocal method
+        results, method = await executor.run(
+            pseudonymization_service.pseudonymize_records,
+            records=records,
+            method=method,
+            language=effective_language,
+            min_score=effective_min_score,
+            entity_types=effective_entity_types,
+        )
+        return [
+            PseudonymizeTextBatchItem(
+                pseudonymized_text=result.pseudonymized_text,
+                detected_entities=result.detected_entities,
+            )
+            if isinstance(result, TextPseudonymizationResult)
+            else PseudonymizeStreamStructuredItem(
+                pseudonymized_data=dict(result.pseudonymized_data),
+                detected_fields=result.field_mapping,
+            )
+            for result in results
+        ]
+
+    return StreamingResponse(
+        NdjsonStream.write_results(
+            batches=NdjsonStream.read_batches(
+                chunks=request.stream(),
+                batch_size=config.get_stream_batch_size(),
+                max_record_bytes=config.get_stream_max_record_bytes(),
+            ),
+            process=pseudonymize_records,
+            logger=logger,
+        ),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
@@ -1,13 +1,15 @@
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, Json
 
+from src.data_deidentifier.adapters.api.structured_payload import StructuredPayload
 from src.data_deidentifier.domain.types.entity import Entity
 from src.data_deidentifier.domain.types.language import SupportedLanguage
 from src.data_deidentifier.domain.types.pseudonymization_method import (
     PseudonymizationMethod,
 )
-from src.data_deidentifier.domain.types.structured_data import StructuredData
+
+MAX_BATCH_TEXTS = 1000
 
 
 class PseudonymizeTextRequest(BaseModel):
@@ -66,6 +68,78 @@ class PseudonymizeTextResponse(BaseModel):
     )
 
 
+class PseudonymizeTextBatchRequest(BaseModel):
+    """Request model for pseudonymizing a batch of texts.
+
+    This model defines the input parameters
+    for the batch text pseudonymization endpoint.
+    All texts share the same settings and are analyzed in a single pass.
+    """
+
+    texts: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_TEXTS,
+        description="The text contents to pseudonymize",
+    )
+
+    method: PseudonymizationMethod | None = Field(
+        default=None,
+        description="Pseudonymization method",
+    )
+
+    method_params: dict[str, Any] | None = Field(
+        default=None,
+        description="Pseudonymization method parameters",
+    )
+
+    language: SupportedLanguage | None = Field(
+        default=None,
+        description="Language code of the texts (e.g., 'en', 'fr', 'es')",
+    )
+
+    min_score: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Minimum confidence score threshold (0.0 to 1.0)",
+    )
+
+    entity_types: list[str] | None = Field(
+        default=None,
+        description="Types of entities to detect (defaults to all supported types)",
+    )
+
+
+class PseudonymizeTextBatchItem(BaseModel):
+    """Result for one text of a batch pseudonymization request."""
+
+    pseudonymized_text: str = Field(..., description="The pseudonymized text content")
+
+    detected_entities: list[Entity] = Field(
+        ...,
+        description="List of detected PII entities",
+    )
+
+
+class PseudonymizeTextBatchResponse(BaseModel):
+    """Response model for batch text pseudonymization.
+
+    This model defines the structure of the response
+    returned by the batch text pseudonymization endpoint.
+    """
+
+    results: list[PseudonymizeTextBatchItem] = Field(
+        ...,
+        description="One result per input text, in the input order",
+    )
+
+    meta: dict[str, Any] | None = Field(
+        default_factory=dict,
+        description="Statistics about the pseudonymization operation",
+    )
+
+
 class PseudonymizeStructuredDataRequest(BaseModel):
     """Request model for pseudonymizing structured data.
 
@@ -73,7 +147,13 @@ class PseudonymizeStructuredDataRequest(BaseModel):
     for the structured data pseudonymization endpoint.
     """
 
-    data: StructuredData = Field(..., description="The structured data to pseudonymize")
+    data: StructuredPayload = Field(
+        ...,
+        description=(
+            "The structured data to pseudonymize: a JSON document, a list of flat "
+            "records, or a table as {'columns': [...], 'rows': [[...]]}"
+        ),
+    )
 
     method: PseudonymizationMethod | None = Field(
         default=None,
@@ -95,6 +175,49 @@ class PseudonymizeStructuredDataRequest(BaseModel):
         description="Types of entities to detect (defaults to all supported types)",
     )
 
+    bypass_cache: bool = Field(
+        default=False,
+        description=(
+            "Analyze the data even if data of the same structure has been "
+            "analyzed recently"
+        ),
+    )
+
+    sample_size: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of values analyzed per table column",
+    )
+
+    min_agreement: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Minimum share of the sampled values of a table column agreeing on "
+            "an entity type for the column to be mapped to it (0.0 to 1.0)"
+        ),
+    )
+
+    random_seed: int | None = Field(
+        default=None,
+        description="Seed of the sampling of table columns",
+    )
+
+    stratified_sampling: bool | None = Field(
+        default=None,
+        description="Sample the distinct values of table columns rather than rows",
+    )
+
+    field_hints: dict[str, str] | None = Field(
+        default=None,
+        description=(
+            "Entity type of known fields, by field name (key path for nested "
+            "documents, e.g. {'user.email': 'EMAIL_ADDRESS'}), mapped without "
+            "being analyzed"
+        ),
+    )
+
 
 class PseudonymizeStructuredDataResponse(BaseModel):
     """Response model for structured data pseudonymization.
@@ -103,7 +226,7 @@ class PseudonymizeStructuredDataResponse(BaseModel):
     by the structured data pseudonymization endpoint.
     """
 
-    pseudonymized_data: StructuredData = Field(
+    pseudonymized_data: StructuredPayload = Field(
         ...,
         description="The pseudonymized structured data",
     )
@@ -117,3 +240,52 @@ class PseudonymizeStructuredDataResponse(BaseModel):
         default_factory=dict,
         description="Statistics about the pseudonymization operation",
     )
+
+
+class PseudonymizeStreamParams(BaseModel):
+    """Query parameters of the stream pseudonymization endpoint.
+
+    The records are sent as the NDJSON body of the request, so the settings
+    shared by all of them are passed in the query string.
+    """
+
+    method: PseudonymizationMethod | None = Field(
+        default=None,
+        description="Pseudonymization method",
+    )
+
+    method_params: Json[dict[str, Any]] | None = Field(
+        default=None,
+        description="Pseudonymization method parameters, as a JSON object",
+    )
+
+    language: SupportedLanguage | None = Field(
+        default=None,
+        description="Language code of the records (e.g., 'en', 'fr', 'es')",
+    )
+
+    min_score: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Minimum confidence score threshold of text records (0.0 to 1.0)",
+    )
+
+    entity_types: list[str] | None = Field(
+        default=None,
+        description="Types of entities to detect (defaults to all supported types)",
+    )
+
+
+class PseudonymizeStreamStructuredItem(BaseModel):
+    """Result for one JSON object record of a stream pseudonymization request."""
+
+    pseudonymized_data: dict[str, Any] = Field(
+        ...,
+        description="The pseudonymized JSON object",
+    )
+
+    detected_fields: dict[str, str] = Field(
+        ...,
+        description="Entity type of each pseudonymized field",
+    )
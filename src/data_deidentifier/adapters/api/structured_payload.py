@@ -0,0 +1,125 @@
+from collections.abc import Mapping
+from typing import Any
+
+from src.data_deidentifier.domain.exceptions import InvalidInputDataError
+from src.data_deidentifier.domain.types.structured_data import StructuredData
+from src.data_deidentifier.domain.types.tabular_data import TabularData
+
+type StructuredPayload = dict[str, Any] | list[dict[str, Any]]
+
+COLUMNS_KEY = "columns"
+ROWS_KEY = "rows"
+
+
+class StructuredPayloadMapper:
+    """Handles the conversion between structured data payloads and domain data.
+
+    Three payload layouts are accepted:
+        - a JSON document, e.g. `{"user": {"name": "..."}}`
+        - a list of flat records, e.g. `[{"name": "...", "email": "..."}]`
+        - a columnar table, e.g. `{"columns": ["name"], "rows": [["..."]]}`
+
+    Records and columnar tables are converted to tabular data, analyzed per
+    column, and returned in the layout they were received in.
+    """
+
+    @classmethod
+    def payload_to_domain(cls, payload: StructuredPayload) -> StructuredData:
+        """Convert a structured data payload to domain data.
+
+        Args:
+            payload: The structured data payload
+
+        Returns:
+            Tabular data for records and columnar tables, the document otherwise
+
+        Raises:
+            InvalidInputDataError: If a table has duplicate columns, or rows not
+                matching its columns
+        """
+        if isinstance(payload, list):
+            return cls._records_to_domain(payload)
+
+        if not cls._is_columnar(payload):
+            return payload
+
+        columns = [str(column) for column in payload[COLUMNS_KEY]]
+        if len(set(columns)) != len(columns):
+            raise InvalidInputDataError("Column names must be unique")
+
+        rows = payload[ROWS_KEY]
+        for index, row in enumerate(rows):
+            if not isinstance(row, list) or len(row) != len(columns):
+                msg = f"Row {index} does not hold one value per column"
+                raise InvalidInputDataError(msg)
+
+        return TabularData(columns=columns, rows=rows)
+
+    @classmethod
+    def domain_to_payload(
+        cls,
+        data: StructuredData,
+        layout: StructuredPayload,
+    ) -> StructuredPayload:
+        """Convert domain data back to the layout of a payload.
+
+        Records only get back the keys they were received with, not those
+        added to fill their columns.
+
+        Args:
+            data: The domain data
+            layout: The payload the data was converted from
+
+        Returns:
+            The data in the layout of the original payload
+        """
+        if not isinstance(data, TabularData):
+            return dict(data)
+
+        if isinstance(layout, list):
+            return [
+                {
+                    column: value
+                    for column, value in zip(data.columns, row, strict=True)
+                    if column in record
+                }
+                for record, row in zip(layout, data.rows, strict=True)
+            ]
+
+        return {COLUMNS_KEY: data.columns, ROWS_KEY: data.rows}
+
+    @staticmethod
+    def _records_to_domain(records: list[dict[str, Any]]) -> TabularData:
+        """Convert a list of flat records to tabular data.
+
+        Columns are the keys of all the records, in order of appearance, and
+        values missing from a record are set to None.
+
+        Args:
+            records: The records
+
+        Returns:
+            The records as tabular data
+        """
+        columns = list(dict.fromkeys(key for record in records for key in record))
+        return TabularData(
+            columns=columns,
+            rows=[[record.get(column) for column in columns] for record in records],
+        )
+
+    @staticmethod
+    def _is_columnar(payload: StructuredPayload) -> bool:
+        """Check whether a payload is a columnar table.
+
+        Args:
+            payload: The structured data payload
+
+        Returns:
+            True if the payload only holds a list of columns and a list of rows
+        """
+        return (
+            isinstance(payload, Mapping)
+            and payload.keys() == {COLUMNS_KEY, ROWS_KEY}
+            and isinstance(payload[COLUMNS_KEY], list)
+            and isinstance(payload[ROWS_KEY], list)
+        )
@@ -0,0 +1,159 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass
+class CacheMetrics:
+    """Counters of a cache, since its creation."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+@dataclass
+class _CacheEntry[V]:
+    value: V
+    size_bytes: int
+    expires_at: float | None
+
+
+class TTLCache[K, V]:
+    """Thread-safe LRU cache bounded by entries count, memory and age.
+
+    Least recently used entries are evicted once the cache holds `max_entries`
+    entries or its estimated size exceeds `max_bytes`. Entries older than
+    `ttl_seconds` are dropped when they are next looked up.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+        sizeof: Callable[[V], int] = sys.getsizeof,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum estimated size of the values kept (None for no limit)
+            ttl_seconds: Lifetime of an entry in seconds (None for no expiration)
+            sizeof: Function estimating the size of a value in bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sizeof = sizeof
+
+        self._entries: OrderedDict[K, _CacheEntry[V]] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self._metrics = CacheMetrics()
+
+    def __len__(self) -> int:
+        """Get the number of entries currently kept.
+
+        Returns:
+            The number of entries
+        """
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Get the value cached for a key, marking it as recently used.
+
+        Args:
+            key: The key to look up
+
+        Returns:
+            The cached value, or None if absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._metrics.misses += 1
+                return None
+
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._metrics.expirations += 1
+                self._metrics.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._metrics.hits += 1
+            return entry.value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        """Cache a value, evicting least recently used entries if needed.
+
+        A value larger than `max_bytes` on its own is not cached.
+
+        Args:
+            key: The key to cache the value under
+            value: The value to cache
+            ttl_seconds: Lifetime of this entry in seconds (None means the
+                lifetime of the cache)
+        """
+        size_bytes = self.sizeof(value)
+        if self.max_bytes is not None and size_bytes > self.max_bytes:
+            return
+
+        ttl_seconds = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _CacheEntry(
+                value=value,
+                size_bytes=size_bytes,
+                expires_at=expires_at,
+            )
+            self._size_bytes += size_bytes
+
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._size_bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._metrics.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get the cache usage and counters.
+
+        Returns:
+            Entries count, estimated size, hit rate, bounds and counters
+        """
+        with self._lock:
+            lookups = self._metrics.hits + self._metrics.misses
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hit_rate": self._metrics.hits / lookups if lookups else None,
+                **asdict(self._metrics),
+            }
+
+    def _remove(self, key: K) -> None:
+        """Remove an entry; the lock must be held by the caller.
+
+        Args:
+            key: The key of the entry to remove
+        """
+        entry = self._entries.pop(key)
+        self._size_bytes -= entry.size_bytes
@@ -6,10 +6,13 @@ from configcore import ConfigContract as CoreConfigContract
 from src.data_deidentifier.domain.types.anonymization_operator import (
     AnonymizationOperator,
 )
+from src.data_deidentifier.domain.types.execution_mode import ExecutionMode
+from src.data_deidentifier.domain.types.field_kind import FieldKind
 from src.data_deidentifier.domain.types.language import SupportedLanguage
 from src.data_deidentifier.domain.types.pseudonymization_method import (
     PseudonymizationMethod,
 )
+from src.data_deidentifier.domain.types.segmentation_mode import SegmentationMode
 
 
 class ConfigContract(CoreConfigContract):
@@ -79,3 +82,396 @@ class ConfigContract(CoreConfigContract):
             }
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def get_nlp_models(self) -> dict[str, str]:
+        """Get the spaCy model loaded for each language.
+
+        Returns:
+            A mapping of language codes to spaCy model names
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_nlp_disabled_components(self) -> list[str]:
+        """Get the spaCy pipeline components skipped when processing texts.
+
+        Returns:
+            Names of the components kept loaded but disabled
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_nlp_excluded_components(self) -> list[str]:
+        """Get the spaCy pipeline components removed from the loaded models.
+
+        Returns:
+            Names of the components removed from the pipelines
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_execution_mode(self) -> ExecutionMode:
+        """Get the kind of pool used to run CPU-bound analysis and anonymization.
+
+        Returns:
+            The execution mode (thread or process pool)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_execution_max_workers(self) -> int | None:
+        """Get the number of workers of the execution pool.
+
+        Returns:
+            The number of workers, or None to use the number of CPUs
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_execution_max_queue_size(self) -> int:
+        """Get the number of tasks allowed to wait for a free execution worker.
+
+        Returns:
+            The maximum queue size, beyond which new tasks are rejected
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_analysis_batch_size(self) -> int:
+        """Get the number of texts sent together through the NLP pipeline.
+
+        Returns:
+            The batch size used for batched text analysis
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_analysis_n_process(self) -> int:
+        """Get the number of processes used for batched text analysis.
+
+        Returns:
+            The number of NLP processes (1 means in-process)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_analysis_chunk_size(self) -> int | None:
+        """Get the length above which texts are analyzed in chunks.
+
+        Returns:
+            The maximum length of a chunk in characters, or None to analyze
+            texts in a single pass
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_analysis_chunk_overlap(self) -> int:
+        """Get the length shared by consecutive chunks of a long text.
+
+        Returns:
+            The maximum overlap between two chunks in characters
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_analysis_engine_variants_max_count(self) -> int:
+        """Get the number of analyzer engines trimmed to an entity types set kept.
+
+        Returns:
+            The maximum number of cached engine variants (0 disables them)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_warmup_enabled(self) -> bool:
+        """Check whether engines are built and warmed up when a worker starts.
+
+        Returns:
+            True to warm the engines up on startup, False to build them lazily
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_analysis_cache_enabled(self) -> bool:
+        """Check whether text analysis results are cached.
+
+        Returns:
+            True to reuse the results of identical analyses, False otherwise
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_analysis_cache_max_entries(self) -> int:
+        """Get the maximum number of analysis results kept in cache.
+
+        Returns:
+            The maximum number of cached analyses
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_analysis_cache_max_bytes(self) -> int:
+        """Get the maximum estimated memory used by the analysis cache.
+
+        Returns:
+            The maximum size of the cached results in bytes
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_analysis_cache_ttl_seconds(self) -> float | None:
+        """Get the lifetime of a cached analysis result.
+
+        Returns:
+            The lifetime in seconds, or None for no expiration
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_analysis_cache_segmentation(self) -> SegmentationMode:
+        """Get how texts are split into separately cached segments.
+
+        Returns:
+            The segmentation mode of the analysis cache
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_structured_analysis_cache_enabled(self) -> bool:
+        """Check whether structured data analyses are cached by data structure.
+
+        Returns:
+            True to reuse the fields mapping of data with the same structure,
+            False otherwise
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_structured_analysis_cache_max_entries(self) -> int:
+        """Get the maximum number of data structures kept in cache.
+
+        Returns:
+            The maximum number of cached fields mappings
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_structured_analysis_cache_ttl_seconds(self) -> float | None:
+        """Get the lifetime of a cached fields mapping.
+
+        Returns:
+            The lifetime in seconds, or None for no expiration
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_structured_sample_size(self) -> int:
+        """Get the maximum number of values analyzed per table column.
+
+        Returns:
+            The sample size of each column
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_structured_sample_min_agreement(self) -> float:
+        """Get the share of sampled values required to map a column.
+
+        Returns:
+            The minimum share of the sampled values of a column agreeing on
+            its entity type, between 0 and 1
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_structured_sample_random_seed(self) -> int | None:
+        """Get the seed of the column sampling.
+
+        Returns:
+            The seed, or None for a different sample on each analysis
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_structured_sample_stratified(self) -> bool:
+        """Check whether columns are sampled over their distinct values.
+
+        Returns:
+            True to sample distinct values weighted by their occurrences,
+            False to sample rows
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_structured_skipped_field_kinds(self) -> list[FieldKind]:
+        """Get the kinds of fields left out of the structured data analysis.
+
+        Returns:
+            The kinds of fields (e.g. numeric, timestamp) not analyzed
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_structured_field_name_rules(self) -> dict[str, str]:
+        """Get the entity types of structured fields, by field name pattern.
+
+        Returns:
+            Entity types keyed by glob patterns (e.g. `*email*`) matched against
+            field names, or against key paths for patterns holding a dot
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_structured_free_text_min_length(self) -> int:
+        """Get the length from which a structured string value is free text.
+
+        Returns:
+            Minimum length in characters of the values making a field free text
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_stream_batch_size(self) -> int:
+        """Get the number of records de-identified together on stream routes.
+
+        Returns:
+            Number of records of a micro-batch
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_stream_max_record_bytes(self) -> int:
+        """Get the maximum size of a record on stream routes.
+
+        Returns:
+            Maximum size in bytes of an NDJSON line, above which it is rejected
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_enrichment_http_max_connections(self) -> int:
+        """Get the default maximum number of connections to an enrichment service.
+
+        Returns:
+            Maximum number of concurrent connections per service and worker
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_enrichment_http_max_keepalive_connections(self) -> int:
+        """Get the default maximum number of idle connections to a service.
+
+        Returns:
+            Maximum number of idle connections kept open per service and worker
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_enrichment_http_keepalive_expiry_seconds(self) -> float:
+        """Get the default idle time after which a connection is closed.
+
+        Returns:
+            Keep-alive expiry of idle connections in seconds
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_enrichment_http2_enabled(self) -> bool:
+        """Check whether HTTP/2 is negotiated with enrichment services by default.
+
+        Returns:
+            True if HTTP/2 is enabled, False otherwise
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_enrichment_max_concurrency(self) -> int:
+        """Get the maximum number of enrichments in flight for a request.
+
+        Returns:
+            Maximum number of entities of a request enriched concurrently
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_enrichment_cache_enabled(self) -> bool:
+        """Check whether enrichments are cached.
+
+        Returns:
+            True to reuse the enrichments of identical entities, False otherwise
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_enrichment_cache_max_entries(self) -> int:
+        """Get the maximum number of enrichments kept in cache.
+
+        Returns:
+            The maximum number of cached enrichments
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_enrichment_cache_ttl_seconds(self) -> float | None:
+        """Get the lifetime of a cached enrichment.
+
+        Returns:
+            The lifetime in seconds, or None for no expiration
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_enrichment_cache_negative_ttl_seconds(self) -> float:
+        """Get the lifetime of a cached absence of enrichment.
+
+        Returns:
+            The lifetime in seconds of the entries of entities the service has
+            no enrichment for
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_enrichment_deadline_seconds(self) -> float | None:
+        """Get the time a request may spend enriching its entities.
+
+        Returns:
+            The deadline in seconds, or None for no deadline
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_enrichment_breaker_window_size(self) -> int:
+        """Get the number of latest requests to a service the failure rate is on.
+
+        Returns:
+            Size of the sliding window of the circuit breakers
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_enrichment_breaker_min_calls(self) -> int:
+        """Get the number of requests in the window before a circuit can open.
+
+        Returns:
+            Minimum number of requests to compute the failure rate on
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_enrichment_breaker_failure_rate(self) -> float:
+        """Get the failure rate from which the circuit of a service opens.
+
+        Returns:
+            Share of failed requests in the window, between 0 and 1
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_enrichment_breaker_open_seconds(self) -> float:
+        """Get the time a circuit stays open before a probe request is sent.
+
+        Returns:
+            Open time of the circuit in seconds
+        """
+        raise NotImplementedError
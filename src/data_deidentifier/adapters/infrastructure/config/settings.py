@@ -6,10 +6,13 @@ from pydantic import BeforeValidator, Field
 from src.data_deidentifier.domain.types.anonymization_operator import (
     AnonymizationOperator,
 )
+from src.data_deidentifier.domain.types.execution_mode import ExecutionMode
+from src.data_deidentifier.domain.types.field_kind import FieldKind
 from src.data_deidentifier.domain.types.language import SupportedLanguage
 from src.data_deidentifier.domain.types.pseudonymization_method import (
     PseudonymizationMethod,
 )
+from src.data_deidentifier.domain.types.segmentation_mode import SegmentationMode
 
 from .contract import ConfigContract
 
@@ -48,6 +51,118 @@ class Settings(CoreSettings, ConfigContract):
     # {"LOCATION": {"type": "http", "url": "http://geo-service/enrich"}} # noqa: ERA001
     enrichment_configurations: dict[str, dict[str, Any]] = Field(default_factory=dict)
 
+    # spaCy model loaded for each language, e.g. {"en": "en_core_web_sm"}
+    nlp_models: dict[str, str] = Field(
+        default_factory=lambda: {"en": "en_core_web_lg"},
+    )
+
+    # Pipeline components kept loaded but skipped, e.g. ["parser"]
+    nlp_disabled_components: list[str] = Field(default_factory=list)
+
+    # Pipeline components removed from the loaded pipelines
+    nlp_excluded_components: list[str] = Field(default_factory=list)
+
+    execution_mode: Annotated[
+        ExecutionMode,
+        BeforeValidator(
+            lambda v: ExecutionMode[v.upper()] if isinstance(v, str) else v,
+        ),
+    ] = Field(
+        default=ExecutionMode.THREAD,
+    )
+
+    execution_max_workers: int | None = Field(default=None, ge=1)
+
+    execution_max_queue_size: int = Field(default=100, ge=0)
+
+    analysis_batch_size: int = Field(default=32, ge=1)
+
+    analysis_n_process: int = Field(default=1, ge=1)
+
+    analysis_chunk_size: int | None = Field(default=None, ge=1)
+
+    analysis_chunk_overlap: int = Field(default=200, ge=0)
+
+    analysis_engine_variants_max_count: int = Field(default=16, ge=0)
+
+    warmup_enabled: bool = Field(default=True)
+
+    analysis_cache_enabled: bool = Field(default=False)
+
+    analysis_cache_max_entries: int = Field(default=10_000, ge=1)
+
+    analysis_cache_max_bytes: int = Field(default=64 * 1024 * 1024, ge=1)
+
+    analysis_cache_ttl_seconds: float | None = Field(default=3600.0, gt=0)
+
+    analysis_cache_segmentation: Annotated[
+        SegmentationMode,
+        BeforeValidator(
+            lambda v: SegmentationMode[v.upper()] if isinstance(v, str) else v,
+        ),
+    ] = Field(
+        default=SegmentationMode.NONE,
+    )
+
+    structured_analysis_cache_enabled: bool = Field(default=False)
+
+    structured_analysis_cache_max_entries: int = Field(default=1000, ge=1)
+
+    structured_analysis_cache_ttl_seconds: float | None = Field(default=3600.0, gt=0)
+
+    structured_sample_size: int = Field(default=1000, ge=1)
+
+    structured_sample_min_agreement: float = Field(default=0.0, ge=0.0, le=1.0)
+
+    structured_sample_random_seed: int | None = Field(default=123)
+
+    structured_sample_stratified: bool = Field(default=False)
+
+    # Kinds of fields left out of the structured analysis, e.g. ["numeric"];
+    # timestamps (e.g. birth dates) and enum codes (which may look like names)
+    # are only left out on demand
+    structured_skipped_field_kinds: list[FieldKind] = Field(
+        default_factory=lambda: [FieldKind.NUMERIC, FieldKind.BOOLEAN, FieldKind.UUID],
+    )
+
+    # Entity types of the fields whose name matches a pattern, e.g. {"*email*":
+    # "EMAIL_ADDRESS"}; patterns with a dot match the whole key path
+    structured_field_name_rules: dict[str, str] = Field(default_factory=dict)
+
+    structured_free_text_min_length: int = Field(default=50, ge=1)
+
+    stream_batch_size: int = Field(default=64, ge=1)
+
+    stream_max_record_bytes: int = Field(default=1_048_576, ge=1)
+
+    enrichment_http_max_connections: int = Field(default=100, ge=1)
+
+    enrichment_http_max_keepalive_connections: int = Field(default=20, ge=0)
+
+    enrichment_http_keepalive_expiry_seconds: float = Field(default=30.0, ge=0)
+
+    enrichment_http2_enabled: bool = Field(default=False)
+
+    enrichment_max_concurrency: int = Field(default=16, ge=1)
+
+    enrichment_cache_enabled: bool = Field(default=False)
+
+    enrichment_cache_max_entries: int = Field(default=100_000, ge=1)
+
+    enrichment_cache_ttl_seconds: float | None = Field(default=86400.0, gt=0)
+
+    enrichment_cache_negative_ttl_seconds: float = Field(default=3600.0, gt=0)
+
+    enrichment_deadline_seconds: float | None = Field(default=5.0, gt=0)
+
+    enrichment_breaker_window_size: int = Field(default=20, ge=1)
+
+    enrichment_breaker_min_calls: int = Field(default=10, ge=1)
+
+    enrichment_breaker_failure_rate: float = Field(default=0.5, gt=0, le=1)
+
+    enrichment_breaker_open_seconds: float = Field(default=30.0, gt=0)
+
     @override
     def get_default_language(self) -> SupportedLanguage:
         return self.default_language
@@ -71,3 +186,175 @@ class Settings(CoreSettings, ConfigContract):
     @override
     def get_enrichment_configurations(self) -> dict[str, dict[str, Any]]:
         return self.enrichment_configurations
+
+    @override
+    def get_nlp_models(self) -> dict[str, str]:
+        return self.nlp_models
+
+    @override
+    def get_nlp_disabled_components(self) -> list[str]:
+        return self.nlp_disabled_components
+
+    @override
+    def get_nlp_excluded_components(self) -> list[str]:
+        return self.nlp_excluded_components
+
+    @override
+    def get_execution_mode(self) -> ExecutionMode:
+        return self.execution_mode
+
+    @override
+    def get_execution_max_workers(self) -> int | None:
+        return self.execution_max_workers
+
+    @override
+    def get_execution_max_queue_size(self) -> int:
+        return self.execution_max_queue_size
+
+    @override
+    def get_analysis_batch_size(self) -> int:
+        return self.analysis_batch_size
+
+    @override
+    def get_analysis_n_process(self) -> int:
+        return self.analysis_n_process
+
+    @override
+    def get_analysis_chunk_size(self) -> int | None:
+        return self.analysis_chunk_size
+
+    @override
+    def get_analysis_chunk_overlap(self) -> int:
+        return self.analysis_chunk_overlap
+
+    @override
+    def get_analysis_engine_variants_max_count(self) -> int:
+        return self.analysis_engine_variants_max_count
+
+    @override
+    def is_warmup_enabled(self) -> bool:
+        return self.warmup_enabled
+
+    @override
+    def is_analysis_cache_enabled(self) -> bool:
+        return self.analysis_cache_enabled
+
+    @override
+    def get_analysis_cache_max_entries(self) -> int:
+        return self.analysis_cache_max_entries
+
+    @override
+    def get_analysis_cache_max_bytes(self) -> int:
+        return self.analysis_cache_max_bytes
+
+    @override
+    def get_analysis_cache_ttl_seconds(self) -> float | None:
+        return self.analysis_cache_ttl_seconds
+
+    @override
+    def get_analysis_cache_segmentation(self) -> SegmentationMode:
+        return self.analysis_cache_segmentation
+
+    @override
+    def is_structured_analysis_cache_enabled(self) -> bool:
+        return self.structured_analysis_cache_enabled
+
+    @override
+    def get_structured_analysis_cache_max_entries(self) -> int:
+        return self.structured_analysis_cache_max_entries
+
+    @override
+    def get_structured_analysis_cache_ttl_seconds(self) -> float | None:
+        return self.structured_analysis_cache_ttl_seconds
+
+    @override
+    def get_structured_sample_size(self) -> int:
+        return self.structured_sample_size
+
+    @override
+    def get_structured_sample_min_agreement(self) -> float:
+        return self.structured_sample_min_agreement
+
+    @override
+    def get_structured_sample_random_seed(self) -> int | None:
+        return self.structured_sample_random_seed
+
+    @override
+    def is_structured_sample_stratified(self) -> bool:
+        return self.structured_sample_stratified
+
+    @override
+    def get_structured_skipped_field_kinds(self) -> list[FieldKind]:
+        return self.structured_skipped_field_kinds
+
+    @override
+    def get_structured_field_name_rules(self) -> dict[str, str]:
+        return self.structured_field_name_rules
+
+    @override
+    def get_structured_free_text_min_length(self) -> int:
+        return self.structured_free_text_min_length
+
+    @override
+    def get_stream_batch_size(self) -> int:
+        return self.stream_batch_size
+
+    @override
+    def get_stream_max_record_bytes(self) -> int:
+        return self.stream_max_record_bytes
+
+    @override
+    def get_enrichment_http_max_connections(self) -> int:
+        return self.enrichment_http_max_connections
+
+    @override
+    def get_enrichment_http_max_keepalive_connections(self) -> int:
+        return self.enrichment_http_max_keepalive_connections
+
+    @override
+    def get_enrichment_http_keepalive_expiry_seconds(self) -> float:
+        return self.enrichment_http_keepalive_expiry_seconds
+
+    @override
+    def is_enrichment_http2_enabled(self) -> bool:
+        return self.enrichment_http2_enabled
+
+    @override
+    def get_enrichment_max_concurrency(self) -> int:
+        return self.enrichment_max_concurrency
+
+    @override
+    def is_enrichment_cache_enabled(self) -> bool:
+        return self.enrichment_cache_enabled
+
+    @override
+    def get_enrichment_cache_max_entries(self) -> int:
+        return self.enrichment_cache_max_entries
+
+    @override
+    def get_enrichment_cache_ttl_seconds(self) -> float | None:
+        return self.enrichment_cache_ttl_seconds
+
+    @override
+    def get_enrichment_cache_negative_ttl_seconds(self) -> float:
+        return self.enrichment_cache_negative_ttl_seconds
+
+    @override
+    def get_enrichment_deadline_seconds(self) -> float | None:
+        return self.enrichment_deadline_seconds
+
+    @override
+    def get_enrichment_breaker_window_size(self) -> int:
+        return self.enrichment_breaker_window_size
+
+    @override
+    def get_enrichment_breaker_min_calls(self) -> int:
+        return self.enrichment_breaker_min_calls
+
+    @override
+    def get_enrichment_breaker_failure_rate(self) -> float:
+        return self.enrichment_breaker_failure_rate
+
+    @override
+    def get_enrichment_breaker_open_seconds(self) -> float:
+        return self.enrichment_breaker_open_seconds
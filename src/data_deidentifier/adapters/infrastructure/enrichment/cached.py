@@ -0,0 +1,166 @@
+import hashlib
+import json
+import threading
+import unicodedata
+from typing import Any, ClassVar, override
+
+from src.data_deidentifier.adapters.infrastructure.cache.ttl_cache import TTLCache
+from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
+from src.data_deidentifier.domain.contracts.enricher.enricher import (
+    PseudonymEnricherContract,
+)
+from src.data_deidentifier.domain.types.entity import Entity
+
+# Cached for entities the service has no enrichment for
+_NO_ENRICHMENT = ""
+
+
+class CachedPseudonymEnricher(PseudonymEnricherContract):
+    """Enricher reusing the enrichments previously fetched by another enricher.
+
+    Enrichments are kept in a cache shared by the enrichers of the worker,
+    keyed by entity type, normalized entity text and a hash of the enricher
+    configuration, so that changing the configuration of a service does not
+    serve its former answers. Entities the service has no enrichment for are
+    cached as well, for a shorter time. Failed enrichments are not cached.
+
+    Attributes:
+        _lock: Thread lock for safe cache creation.
+        _cache: Cache of enrichments, shared by the enrichers of the worker.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _cache: ClassVar[TTLCache[str, str] | None] = None
+
+    def __init__(
+        self,
+        enricher: PseudonymEnricherContract,
+        config: ConfigContract,
+    ) -> None:
+        """Initialize the cached enricher.
+
+        Args:
+            enricher: The enricher fetching the enrichments not cached
+            config: Configuration providing the bounds of the cache
+        """
+        super().__init__(params=enricher.params, logger=enricher.logger)
+
+        self.enricher = enricher
+        self.config = config
+
+        self.config_hash = hashlib.blake2b(
+            json.dumps(enricher.params, sort_keys=True, default=str).encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    @override
+    def get_enrichment(self, entity: Entity) -> str | None:
+        key = self._get_key(entity)
+        cached = self.get_cache(self.config).get(key)
+        if cached is not None:
+            return cached or None
+
+        enrichment = self.enricher.get_enrichment(entity)
+        self._store(key=key, enrichment=enrichment)
+        return enrichment
+
+    @override
+    async def get_enrichment_async(self, entity: Entity) -> str | None:
+        key = self._get_key(entity)
+        cached = self.get_cache(self.config).get(key)
+        if cached is not None:
+            return cached or None
+
+        enrichment = await self.enricher.get_enrichment_async(entity)
+        self._store(key=key, enrichment=enrichment)
+        return enrichment
+
+    @override
+    def get_max_batch_size(self) -> int:
+        return self.enricher.get_max_batch_size()
+
+    @override
+    async def get_enrichments_async(self, entities: list[Entity]) -> list[str | None]:
+        cache = self.get_cache(self.config)
+        keys = [self._get_key(entity) for entity in entities]
+        cached = [cache.get(key) for key in keys]
+
+        # Entities not cached are enriched together
+        missing = [index for index, value in enumerate(cached) if value is None]
+        fetched = (
+            await self.enricher.get_enrichments_async(
+                [entities[index] for index in missing],
+            )
+            if missing
+            else []
+        )
+
+        enrichments = [value or None for value in cached]
+        for index, enrichment in zip(missing, fetched, strict=True):
+            self._store(key=keys[index], enrichment=enrichment)
+            enrichments[index] = enrichment
+        return enrichments
+
+    @classmethod
+    def get_cache(cls, config: ConfigContract) -> TTLCache[str, str]:
+        """Get the shared cache of enrichments (thread-safe).
+
+        Args:
+            config: Configuration providing the bounds of the cache.
+
+        Returns:
+            TTLCache: The shared enrichments cache.
+        """
+        if cls._cache is None:
+            with cls._lock:
+                if cls._cache is None:
+                    cls._cache = TTLCache(
+                        max_entries=config.get_enrichment_cache_max_entries(),
+                        ttl_seconds=config.get_enrichment_cache_ttl_seconds(),
+                    )
+        return cls._cache
+
+    @classmethod
+    def get_cache_metrics(cls) -> dict[str, dict[str, Any]]:
+        """Get the usage and counters of the cache, if created.
+
+        Returns:
+            The metrics of the cache keyed by cache name, or nothing if the
+            cache has not been created.
+        """
+        if cls._cache is None:
+            return {}
+        return {"enrichment": cls._cache.get_metrics()}
+
+    def _get_key(self, entity: Entity) -> str:
+        """Get the cache key of the enrichment of an entity.
+
+        The entity text is normalized, so that variants in case, spacing or
+        Unicode form share their enrichment.
+
+        Args:
+            entity: The entity to enrich
+
+        Returns:
+            The cache key
+        """
+        text = unicodedata.normalize("NFKC", entity.text or "")
+        normalized_text = " ".join(text.split()).casefold()
+        return f"{entity.type}\x1f{self.config_hash}\x1f{normalized_text}"
+
+    def _store(self, key: str, enrichment: str | None) -> None:
+        """Cache the enrichment of an entity.
+
+        Args:
+            key: The cache key of the entity
+            enrichment: The enrichment fetched, None if there is none
+        """
+        cache = self.get_cache(self.config)
+        if enrichment:
+            cache.set(key, enrichment)
+        else:
+            cache.set(
+                key,
+                _NO_ENRICHMENT,
+                ttl_seconds=self.config.get_enrichment_cache_negative_ttl_seconds(),
+            )
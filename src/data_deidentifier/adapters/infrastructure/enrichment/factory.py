@@ -12,6 +12,7 @@ from src.data_deidentifier.domain.contracts.enricher.manager import (
 from src.data_deidentifier.domain.exceptions import PseudonymEnrichmentError
 from src.data_deidentifier.domain.types.enrichment_type import EnrichmentType
 
+from .cached import CachedPseudonymEnricher
 from .http_service import HttpPseudonymEnricher
 
 
@@ -21,6 +22,10 @@ class EnrichmentFactory(PseudonymEnrichmentManagerContract):
     This factory creates appropriate enricher instances based on the enrichment
     configuration type and parameters. It implements the EnrichmentManagerContract
     to integrate with the domain layer.
+
+    Enrichers keep no per-request state, so the enricher of each entity type
+    is created once and reused. When the enrichment cache is enabled, they
+    are wrapped to reuse the enrichments fetched before.
     """
 
     # Mapping between enrichment types and implementation classes
@@ -38,6 +43,8 @@ class EnrichmentFactory(PseudonymEnrichmentManagerContract):
         self.config = config
         self.logger = logger
 
+        self._enrichers: dict[str, PseudonymEnricherContract] = {}
+
     @override
     def get_enricher_for_entity(
         self,
@@ -55,13 +62,17 @@ class EnrichmentFactory(PseudonymEnrichmentManagerContract):
         Raises:
             PseudonymEnrichmentError: If enrichment configuration is invalid
         """
+        enricher = self._enrichers.get(entity_type)
+        if enricher is not None:
+            return enricher
+
         enrichment_configs = self.config.get_enrichment_configurations()
         if entity_type not in enrichment_configs:
             return None
 
         entity_config = enrichment_configs.get(entity_type)
         try:
-            return self.create(
+            enricher = self.create(
                 entity_type=entity_type,
                 enrichment_config=entity_config,
                 logger=self.logger,
@@ -70,6 +81,13 @@ class EnrichmentFactory(PseudonymEnrichmentManagerContract):
             self.logger.exception("Enrichment error", e)
             raise
 
+        if self.config.is_enrichment_cache_enabled():
+            enricher = CachedPseudonymEnricher(enricher=enricher, config=self.config)
+
+        # Concurrent first calls may both create it, the last one is kept
+        self._enrichers[entity_type] = enricher
+        return enricher
+
     @classmethod
     def create(
         cls,
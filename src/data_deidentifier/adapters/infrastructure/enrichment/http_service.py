@@ -1,11 +1,16 @@
 from typing import Any, override
 
+from httpx import Response
 from logger import LoggerContract
 
 from src.data_deidentifier.adapters.infrastructure.http.client import (
     BaseHttpClient,
     HttpClientError,
 )
+from src.data_deidentifier.adapters.infrastructure.http.pool import (
+    HttpClientPool,
+    HttpPoolSettings,
+)
 from src.data_deidentifier.domain.contracts.enricher.enricher import (
     PseudonymEnricherContract,
 )
@@ -29,6 +34,21 @@ class HttpPseudonymEnricher(PseudonymEnricherContract):
         PARAM_REQUEST_KEY: Parameter key for the JSON request field name.
         PARAM_RESPONSE_KEY: Parameter key for the JSON response field name.
         PARAM_HTTP_METHOD: Parameter key for the HTTP method.
+        PARAM_MAX_CONNECTIONS: Parameter key for the maximum number of
+            connections to the service.
+        PARAM_MAX_KEEPALIVE_CONNECTIONS: Parameter key for the maximum number
+            of idle connections kept open to the service.
+        PARAM_KEEPALIVE_EXPIRY: Parameter key for the idle time in seconds
+            after which a connection is closed.
+        PARAM_HTTP2: Parameter key for enabling HTTP/2.
+        PARAM_BATCH: Parameter key for enabling the batch protocol, sending
+            several entities per request.
+        PARAM_BATCH_REQUEST_KEY: Parameter key for the JSON request field
+            name holding the list of entity texts, in batch mode.
+        PARAM_BATCH_RESPONSE_KEY: Parameter key for the JSON response field
+            name holding the enrichments, in batch mode.
+        PARAM_MAX_BATCH_SIZE: Parameter key for the maximum number of entities
+            per request, in batch mode.
     """
 
     PARAM_URL = "url"
@@ -36,12 +56,25 @@ class HttpPseudonymEnricher(PseudonymEnricherContract):
     PARAM_REQUEST_KEY = "request_key"
     PARAM_RESPONSE_KEY = "response_key"
     PARAM_HTTP_METHOD = "http_method"
+    PARAM_MAX_CONNECTIONS = "max_connections"
+    PARAM_MAX_KEEPALIVE_CONNECTIONS = "max_keepalive_connections"
+    PARAM_KEEPALIVE_EXPIRY = "keepalive_expiry"
+    PARAM_HTTP2 = "http2"
+    PARAM_BATCH = "batch"
+    PARAM_BATCH_REQUEST_KEY = "batch_request_key"
+    PARAM_BATCH_RESPONSE_KEY = "batch_response_key"
+    PARAM_MAX_BATCH_SIZE = "max_batch_size"
+
+    DEFAULT_MAX_BATCH_SIZE = 100
 
     @override
     def __init__(self, params: dict[str, Any], logger: LoggerContract) -> None:
         super().__init__(params=params, logger=logger)
 
-        self.http_client = BaseHttpClient(logger)
+        self.http_client = BaseHttpClient(
+            logger=logger,
+            pool_settings=self.get_pool_settings(),
+        )
 
     @override
     def get_enrichment(self, entity: Entity) -> str | None:
@@ -52,36 +85,147 @@ class HttpPseudonymEnricher(PseudonymEnricherContract):
         self.logger.debug("Starting pseudonym enrichment via HTTP", logger_context)
 
         try:
-            response = self.http_client.request(
-                url=self.get_service_url(entity),
-                method=self.get_http_method(),
-                data=self.build_request_data(entity=entity),
-                headers=self.get_request_headers(),
-                timeout_seconds=self.get_timeout_seconds(),
+            response = self.http_client.request(**self.get_request_args(entity))
+            return self.read_enrichment(response=response, entity=entity)
+        except HttpClientError as e:
+            # Transform generic HTTP error into enrichment-specific context
+            raise PseudonymEnrichmentError from e
+        except Exception as e:
+            # Handle JSON parsing errors, etc.
+            self.logger.warning(
+                "Pseudonym enrichment processing failed",
+                {"error": str(e), **logger_context},
             )
+            raise PseudonymEnrichmentError from e
 
-            enrichment = self.parse_response_data(response_data=response.json())
-
-            if enrichment and isinstance(enrichment, str) and enrichment.strip():
-                self.logger.debug(
-                    "Pseudonym enrichment successful",
-                    {"enrichment": enrichment},
-                )
-                return enrichment
+    @override
+    async def get_enrichment_async(self, entity: Entity) -> str | None:
+        if not self.can_handle_entity(entity):
+            return None
 
-            self.logger.debug("No enrichment returned by service", logger_context)
+        logger_context = {"entity_type": entity.type}
+        self.logger.debug(
+            "Starting async pseudonym enrichment via HTTP",
+            logger_context,
+        )
 
+        try:
+            response = await self.http_client.request_async(
+                **self.get_request_args(entity),
+            )
+            return self.read_enrichment(response=response, entity=entity)
         except HttpClientError as e:
-            # Transform generic HTTP error into enrichment-specific context
             raise PseudonymEnrichmentError from e
         except Exception as e:
-            # Handle JSON parsing errors, etc.
             self.logger.warning(
                 "Pseudonym enrichment processing failed",
                 {"error": str(e), **logger_context},
             )
             raise PseudonymEnrichmentError from e
 
+    @override
+    def get_max_batch_size(self) -> int:
+        if not self.is_batch_enabled():
+            return 1
+
+        max_batch_size = self.params.get(
+            self.PARAM_MAX_BATCH_SIZE,
+            self.DEFAULT_MAX_BATCH_SIZE,
+        )
+        if not isinstance(max_batch_size, int):
+            max_batch_size = self.DEFAULT_MAX_BATCH_SIZE
+        return max(1, max_batch_size)
+
+    @override
+    async def get_enrichments_async(self, entities: list[Entity]) -> list[str | None]:
+        if not self.is_batch_enabled():
+            return await super().get_enrichments_async(entities)
+
+        handled = [entity for entity in entities if self.can_handle_entity(entity)]
+        if not handled:
+            return [None] * len(entities)
+
+        logger_context = {
+            "entity_type": handled[0].type,
+            "entities_count": len(handled),
+        }
+        self.logger.debug(
+            "Starting batch pseudonym enrichment via HTTP",
+            logger_context,
+        )
+
+        try:
+            response = await self.http_client.request_async(
+                url=self.get_service_url(handled[0]),
+                method=self.get_http_method(),
+                data=self.build_batch_request_data(entities=handled),
+                headers=self.get_request_headers(),
+                timeout_seconds=self.get_timeout_seconds(),
+            )
+            enrichments = self.parse_batch_response_data(
+                response_data=response.json(),
+                entities=handled,
+            )
+        except HttpClientError as e:
+            raise PseudonymEnrichmentError from e
+        except Exception as e:
+            self.logger.warning(
+                "Batch pseudonym enrichment processing failed",
+                {"error": str(e), **logger_context},
+            )
+            raise PseudonymEnrichmentError from e
+
+        # Enrichments of the handled entities, in order
+        remaining = iter(enrichments)
+        return [
+            self._validate_enrichment(next(remaining))
+            if self.can_handle_entity(entity)
+            else None
+            for entity in entities
+        ]
+
+    def get_request_args(self, entity: Entity) -> dict[str, Any]:
+        """Get the arguments of the HTTP request enriching an entity.
+
+        Args:
+            entity: The entity being enriched.
+
+        Returns:
+            The keyword arguments of the HTTP client request methods.
+        """
+        return {
+            "url": self.get_service_url(entity),
+            "method": self.get_http_method(),
+            "data": self.build_request_data(entity=entity),
+            "headers": self.get_request_headers(),
+            "timeout_seconds": self.get_timeout_seconds(),
+        }
+
+    def read_enrichment(self, response: Response, entity: Entity) -> str | None:
+        """Read the enrichment of an entity from the service response.
+
+        Args:
+            response: The HTTP response of the service.
+            entity: The entity being enriched.
+
+        Returns:
+            The enrichment, or None if the service returned none.
+        """
+        enrichment = self._validate_enrichment(
+            self.parse_response_data(response_data=response.json()),
+        )
+
+        if enrichment:
+            self.logger.debug(
+                "Pseudonym enrichment successful",
+                {"enrichment": enrichment},
+            )
+            return enrichment
+
+        self.logger.debug(
+            "No enrichment returned by service",
+            {"entity_type": entity.type},
+        )
         return None
 
     def can_handle_entity(self, _entity: Entity) -> bool:
@@ -130,6 +274,40 @@ class HttpPseudonymEnricher(PseudonymEnricherContract):
             timeout = BaseHttpClient.DEFAULT_TIMEOUT
         return max(1, min(timeout, 300))
 
+    def get_pool_settings(self) -> HttpPoolSettings:
+        """Get the connection pool settings of the service.
+
+        Settings missing from the enrichment configuration take their
+        configured default.
+
+        Returns:
+            The pool settings of the shared client of the service.
+        """
+        defaults = HttpClientPool.get_default_settings()
+        return HttpPoolSettings(
+            max_connections=self.params.get(
+                self.PARAM_MAX_CONNECTIONS,
+                defaults.max_connections,
+            ),
+            max_keepalive_connections=self.params.get(
+                self.PARAM_MAX_KEEPALIVE_CONNECTIONS,
+                defaults.max_keepalive_connections,
+            ),
+            keepalive_expiry_seconds=self.params.get(
+                self.PARAM_KEEPALIVE_EXPIRY,
+                defaults.keepalive_expiry_seconds,
+            ),
+            http2=self.params.get(self.PARAM_HTTP2, defaults.http2),
+        )
+
+    def is_batch_enabled(self) -> bool:
+        """Check whether the service is sent several entities per request.
+
+        Returns:
+            True if the batch protocol is enabled, False otherwise.
+        """
+        return self.params.get(self.PARAM_BATCH) is True
+
     def get_request_headers(self) -> dict[str, str]:
         """Get the HTTP headers for the enrichment request.
 
@@ -154,6 +332,22 @@ class HttpPseudonymEnricher(PseudonymEnricherContract):
         """
         return self.params.get(self.PARAM_RESPONSE_KEY, "text")
 
+    def get_batch_request_key(self) -> str:
+        """Get the JSON key for sending the entity texts in a batch request.
+
+        Returns:
+            The JSON key name (defaults to "texts").
+        """
+        return self.params.get(self.PARAM_BATCH_REQUEST_KEY, "texts")
+
+    def get_batch_response_key(self) -> str:
+        """Get the JSON key for extracting the enrichments from a batch response.
+
+        Returns:
+            The JSON key name (defaults to "results").
+        """
+        return self.params.get(self.PARAM_BATCH_RESPONSE_KEY, "results")
+
     def build_request_data(self, entity: Entity) -> dict[str, Any]:
         """Build the request data payload.
 
@@ -179,3 +373,73 @@ class HttpPseudonymEnricher(PseudonymEnricherContract):
             The extracted enrichment string, or None if not found.
         """
         return response_data.get(self.get_response_key())
+
+    def build_batch_request_data(self, entities: list[Entity]) -> dict[str, Any]:
+        """Build the request data payload of a batch.
+
+        Creates a dictionary with the list of entity texts, in order, using the
+        configured batch request key.
+
+        Args:
+            entities: The entities being enriched.
+
+        Returns:
+            Dictionary containing the request data.
+        """
+        return {self.get_batch_request_key(): [entity.text for entity in entities]}
+
+    def parse_batch_response_data(
+        self,
+        response_data: dict[str, Any],
+        entities: list[Entity],
+    ) -> list[Any]:
+        """Parse the HTTP response of a batch to extract the enrichments.
+
+        The configured batch response key holds either a list of enrichments,
+        matched to the entities by position, or an object of enrichments keyed
+        by entity text. An enrichment is a string, or an object holding it
+        under the configured response key.
+
+        Args:
+            response_data: The JSON response data from the service.
+            entities: The entities of the batch, in the request order.
+
+        Returns:
+            The enrichment of each entity, in order, None where not found.
+
+        Raises:
+            TypeError: If the response holds no list or object of enrichments.
+            ValueError: If the list of enrichments does not match the batch.
+        """
+        results = response_data.get(self.get_batch_response_key())
+
+        if isinstance(results, list):
+            if len(results) != len(entities):
+                msg = (
+                    f"Batch response holds {len(results)} enrichments "
+                    f"for {len(entities)} entities"
+                )
+                raise ValueError(msg)
+        elif isinstance(results, dict):
+            results = [results.get(entity.text) for entity in entities]
+        else:
+            raise TypeError("Batch response holds no list or object of enrichments")
+
+        return [
+            result.get(self.get_response_key()) if isinstance(result, dict) else result
+            for result in results
+        ]
+
+    @staticmethod
+    def _validate_enrichment(enrichment: Any) -> str | None:  # noqa: ANN401
+        """Keep an enrichment only if it is a non-blank string.
+
+        Args:
+            enrichment: The enrichment returned by the service.
+
+        Returns:
+            The enrichment, or None if it is not usable.
+        """
+        if enrichment and isinstance(enrichment, str) and enrichment.strip():
+            return enrichment
+        return None
@@ -0,0 +1,155 @@
+import asyncio
+from collections.abc import Collection, Iterable, Mapping
+
+from src.data_deidentifier.adapters.infrastructure.http.pool import HttpClientPool
+from src.data_deidentifier.domain.contracts.enricher.enricher import (
+    PseudonymEnricherContract,
+)
+from src.data_deidentifier.domain.contracts.enricher.manager import (
+    PseudonymEnrichmentManagerContract,
+)
+from src.data_deidentifier.domain.exceptions import PseudonymEnrichmentError
+from src.data_deidentifier.domain.types.entity import Entity
+
+# Entity type and entity text
+type EnrichmentKey = tuple[str, str]
+
+
+class EnrichmentPrefetcher:
+    """Enriches the distinct entities of a request concurrently.
+
+    Enriching while pseudonymizing sends one request at a time, so that the
+    enrichment latency adds up with the number of entities. Once the entities
+    are detected, the distinct ones are enriched concurrently instead, with a
+    bounded number of requests in flight, and the pseudonymization reads the
+    results from the returned lookup table. Entities of an enricher accepting
+    several entities per call are sent in batches of its maximum size.
+
+    The whole pre-pass is bounded by a deadline, so that a slow service
+    delays a request by that much at most: entities not enriched by then are
+    pseudonymized without enrichment.
+    """
+
+    @classmethod
+    def prefetch(  # noqa: PLR0913
+        cls,
+        entities: Iterable[Entity],
+        enrichment_manager: PseudonymEnrichmentManagerContract,
+        enrichable_types: Collection[str],
+        max_concurrency: int,
+        deadline_seconds: float | None = None,
+        known: Mapping[EnrichmentKey, str | None] | None = None,
+    ) -> dict[EnrichmentKey, str | None]:
+        """Enrich the distinct entities not enriched yet.
+
+        Failed enrichments, or batches, and those not done by the deadline are
+        recorded as None, as when enriching one by one.
+
+        Args:
+            entities: The detected entities
+            enrichment_manager: Provides the enricher of each entity type
+            enrichable_types: Entity types having an enrichment configuration
+            max_concurrency: Maximum number of enrichment calls in flight
+            deadline_seconds: Time after which the enrichments still in
+                progress are given up (None means no deadline)
+            known: Enrichments already fetched for the request, not fetched again
+
+        Returns:
+            The enrichments, keyed by entity type and text
+        """
+        enrichments = dict(known or {})
+
+        pending: dict[EnrichmentKey, Entity] = {}
+        for entity in entities:
+            if entity.type not in enrichable_types or not entity.text:
+                continue
+            key = (entity.type, entity.text)
+            if key not in enrichments:
+                pending.setdefault(key, entity)
+
+        if not pending:
+            return enrichments
+
+        enrichers: dict[str, PseudonymEnricherContract | None] = {}
+        for entity_type in {entity_type for entity_type, _ in pending}:
+            try:
+                enrichers[entity_type] = enrichment_manager.get_enricher_for_entity(
+                    entity_type,
+                )
+            except PseudonymEnrichmentError:
+                enrichers[entity_type] = None
+
+        enrichments.update(
+            HttpClientPool.run(
+                cls._enrich_all(
+                    entities=pending,
+                    enrichers=enrichers,
+                    max_concurrency=max_concurrency,
+                    deadline_seconds=deadline_seconds,
+                ),
+            ),
+        )
+        return enrichments
+
+    @classmethod
+    async def _enrich_all(
+        cls,
+        entities: Mapping[EnrichmentKey, Entity],
+        enrichers: Mapping[str, PseudonymEnricherContract | None],
+        max_concurrency: int,
+        deadline_seconds: float | None,
+    ) -> dict[EnrichmentKey, str | None]:
+        """Enrich entities concurrently, by batches, until the deadline.
+
+        Args:
+            entities: The entities to enrich, by key
+            enrichers: The enricher of each entity type, if any
+            max_concurrency: Maximum number of enrichment calls in flight
+            deadline_seconds: Time after which the enrichments still in
+                progress are cancelled (None means no deadline)
+
+        Returns:
+            The enrichments, by key
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def enrich(
+            enricher: PseudonymEnricherContract,
+            batch: list[EnrichmentKey],
+        ) -> list[str | None]:
+            async with semaphore:
+                try:
+                    return await enricher.get_enrichments_async(
+                        [entities[key] for key in batch],
+                    )
+                except PseudonymEnrichmentError:
+                    return [None] * len(batch)
+
+        batches: list[tuple[PseudonymEnricherContract, list[EnrichmentKey]]] = []
+        for entity_type, enricher in enrichers.items():
+            if enricher is None:
+                continue
+            keys = [key for key in entities if key[0] == entity_type]
+            batch_size = max(1, enricher.get_max_batch_size())
+            batches.extend(
+                (enricher, keys[start : start + batch_size])
+                for start in range(0, len(keys), batch_size)
+            )
+
+        enrichments: dict[EnrichmentKey, str | None] = dict.fromkeys(entities)
+        tasks = {
+            asyncio.create_task(enrich(enricher=enricher, batch=batch)): batch
+            for enricher, batch in batches
+        }
+        if not tasks:
+            return enrichments
+
+        done, pending = await asyncio.wait(tasks, timeout=deadline_seconds)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+        for task in done:
+            enrichments.update(zip(tasks[task], task.result(), strict=True))
+        return enrichments
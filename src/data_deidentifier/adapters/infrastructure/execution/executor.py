@@ -0,0 +1,222 @@
+import asyncio
+import functools
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from logger import LoggerContract
+
+from src.data_deidentifier.domain.exceptions import DataDeidentifierError
+from src.data_deidentifier.domain.types.execution_mode import ExecutionMode
+
+
+class ExecutorOverloadedError(DataDeidentifierError):
+    """Raised when the execution queue is full and a task cannot be accepted."""
+
+
+@dataclass
+class ExecutionMetrics:
+    """Counters describing the activity of a task executor.
+
+    Attributes:
+        submitted: Number of tasks accepted by the executor
+        completed: Number of tasks that finished successfully
+        failed: Number of tasks that raised an exception
+        rejected: Number of tasks refused because the queue was full
+        max_queue_depth: Highest number of tasks seen waiting for a worker
+        total_wait_seconds: Cumulated time tasks spent waiting for a worker
+        max_wait_seconds: Longest time a task spent waiting for a worker
+        total_run_seconds: Cumulated time tasks spent running
+    """
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    max_queue_depth: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    total_run_seconds: float = 0.0
+
+
+def _timed_call(
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> tuple[float, float, Any]:
+    """Run a callable and report when it started and how long it ran.
+
+    Defined at module level so that it can be pickled for process pools.
+
+    Args:
+        func: The callable to run
+        args: Positional arguments for the callable
+        kwargs: Keyword arguments for the callable
+
+    Returns:
+        The wall-clock start time, the run duration and the callable result
+    """
+    started_at = time.time()
+    result = func(*args, **kwargs)
+    return started_at, time.time() - started_at, result
+
+
+class TaskExecutor:
+    """Bounded pool running CPU-bound work outside the asyncio event loop.
+
+    Analysis and anonymization are synchronous and can take seconds on long
+    inputs. Dispatching them through this executor keeps the event loop free to
+    serve other requests while a pool worker does the work.
+
+    The number of pending tasks is bounded by `max_workers + max_queue_size`:
+    once reached, new tasks are rejected instead of piling up behind slow ones.
+
+    All bookkeeping happens on the event loop thread, so metrics need no locking
+    and behave the same way for thread and process pools.
+    """
+
+    def __init__(
+        self,
+        logger: LoggerContract,
+        mode: ExecutionMode = ExecutionMode.THREAD,
+        max_workers: int | None = None,
+        max_queue_size: int = 100,
+    ) -> None:
+        """Initialize the executor and its underlying pool.
+
+        Args:
+            logger: Logger instance
+            mode: Kind of pool to use
+            max_workers: Number of pool workers (defaults to the number of CPUs)
+            max_queue_size: Number of tasks allowed to wait for a free worker
+        """
+        self.logger = logger
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue_size = max_queue_size
+
+        self._pool = self._create_pool()
+        self._pending = 0
+        self._metrics = ExecutionMetrics()
+
+        self.logger.debug(
+            "Task executor initialized",
+            {
+                "mode": self.mode.value,
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+            },
+        )
+
+    def _create_pool(self) -> Executor:
+        """Create the pool matching the configured execution mode.
+
+        Returns:
+            The underlying concurrent.futures executor
+        """
+        if self.mode == ExecutionMode.PROCESS:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="deidentifier",
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Get the number of accepted tasks still waiting for a free worker.
+
+        Returns:
+            The current queue depth
+        """
+        return max(0, self._pending - self.max_workers)
+
+    async def run[**P, T](
+        self,
+        func: Callable[P, T],
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Run a callable in the pool and wait for its result.
+
+        Args:
+            func: The callable to run. Must be picklable in process mode.
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            The value returned by the callable
+
+        Raises:
+            ExecutorOverloadedError: If too many tasks are already pending
+        """
+        if self._pending >= self.max_workers + self.max_queue_size:
+            self._metrics.rejected += 1
+            self.logger.warning(
+                "Task rejected, execution queue is full",
+                {"pending": self._pending, "max_queue_size": self.max_queue_size},
+            )
+            raise ExecutorOverloadedError("Server is busy, please retry later")
+
+        self._pending += 1
+        self._metrics.submitted += 1
+        self._metrics.max_queue_depth = max(
+            self._metrics.max_queue_depth,
+            self.queue_depth,
+        )
+
+        submitted_at = time.time()
+        loop = asyncio.get_running_loop()
+
+        try:
+            started_at, run_seconds, result = await loop.run_in_executor(
+                self._pool,
+                functools.partial(_timed_call, func, args, kwargs),
+            )
+        except Exception:
+            self._metrics.failed += 1
+            raise
+        finally:
+            self._pending -= 1
+
+        wait_seconds = max(0.0, started_at - submitted_at)
+        self._metrics.completed += 1
+        self._metrics.total_wait_seconds += wait_seconds
+        self._metrics.max_wait_seconds = max(
+            self._metrics.max_wait_seconds,
+            wait_seconds,
+        )
+        self._metrics.total_run_seconds += run_seconds
+
+        return result
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get a snapshot of the executor metrics.
+
+        Returns:
+            Configuration, live gauges and cumulated counters of the executor
+        """
+        completed = self._metrics.completed
+        return {
+            "mode": self.mode.value,
+            "max_workers": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            "pending": self._pending,
+            "queue_depth": self.queue_depth,
+            "avg_wait_seconds": (
+                self._metrics.total_wait_seconds / completed if completed else 0.0
+            ),
+            "avg_run_seconds": (
+                self._metrics.total_run_seconds / completed if completed else 0.0
+            ),
+            **asdict(self._metrics),
+        }
+
+    def shutdown(self) -> None:
+        """Shut the pool down, waiting for running tasks to finish."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self.logger.debug("Task executor shut down")
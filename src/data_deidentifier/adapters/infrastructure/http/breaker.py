@@ -0,0 +1,219 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum, auto
+from typing import Any, ClassVar
+from urllib.parse import urlsplit
+
+from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = auto()  # Requests are sent
+    OPEN = auto()  # Requests are rejected right away
+    HALF_OPEN = auto()  # A probe request is sent to check if the service is back
+
+
+@dataclass(frozen=True)
+class CircuitBreakerSettings:
+    """Settings of the circuit breaker of a service.
+
+    Attributes:
+        window_size: Number of latest requests the failure rate is computed on
+        min_calls: Number of requests in the window before the circuit can open
+        failure_rate: Failure rate from which the circuit opens
+        open_seconds: Time the circuit stays open before a probe is sent
+    """
+
+    window_size: int = 20
+    min_calls: int = 10
+    failure_rate: float = 0.5
+    open_seconds: float = 30.0
+
+
+class CircuitBreaker:
+    """Stops sending requests to a failing service for a while.
+
+    The outcomes of the latest requests are kept in a sliding window. Once
+    enough of them failed, the circuit opens and requests are rejected without
+    being sent. After `open_seconds`, a single probe request is let through:
+    the circuit closes if it succeeds, and opens again if it fails.
+    """
+
+    def __init__(self, settings: CircuitBreakerSettings) -> None:
+        """Initialize the circuit breaker, closed.
+
+        Args:
+            settings: Settings of the circuit breaker
+        """
+        self.settings = settings
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=settings.window_size)
+        self._opened_at = 0.0
+        self._probing = False
+        self._opened_count = 0
+        self._rejected_count = 0
+
+    def allow_request(self) -> bool:
+        """Check whether a request can be sent, and count it if not.
+
+        Returns:
+            False if the circuit is open, or half-open with its probe in
+            flight, True otherwise
+        """
+        with self._lock:
+            if self._state == CircuitState.OPEN:
+                if time.monotonic() - self._opened_at < self.settings.open_seconds:
+                    self._rejected_count += 1
+                    return False
+                self._state = CircuitState.HALF_OPEN
+
+            if self._state == CircuitState.HALF_OPEN:
+                if self._probing:
+                    self._rejected_count += 1
+                    return False
+                self._probing = True
+
+            return True
+
+    def record(self, success: bool) -> None:  # noqa: FBT001
+        """Record the outcome of a request allowed by `allow_request`.
+
+        Args:
+            success: Whether the service answered properly
+        """
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                if success:
+                    self._state = CircuitState.CLOSED
+                    self._outcomes.clear()
+                    self._probing = False
+                else:
+                    self._open()
+                return
+
+            # Requests sent before the circuit opened
+            if self._state == CircuitState.OPEN:
+                return
+
+            self._outcomes.append(success)
+            if (
+                len(self._outcomes) >= self.settings.min_calls
+                and self._get_failure_rate() >= self.settings.failure_rate
+            ):
+                self._open()
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get the state and counters of the circuit.
+
+        Returns:
+            State, failure rate over the window, and how many times the circuit
+            opened and requests were rejected
+        """
+        with self._lock:
+            return {
+                "state": self._state.value,
+                "window_calls": len(self._outcomes),
+                "failure_rate": self._get_failure_rate() if self._outcomes else None,
+                "opened": self._opened_count,
+                "rejected": self._rejected_count,
+            }
+
+    def _open(self) -> None:
+        """Open the circuit; the lock must be held by the caller."""
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._probing = False
+        self._opened_count += 1
+
+    def _get_failure_rate(self) -> float:
+        """Get the failure rate over the window; the lock must be held by the caller.
+
+        Returns:
+            The share of failed requests in the window
+        """
+        return self._outcomes.count(False) / len(self._outcomes)
+
+
+class CircuitBreakerRegistry:
+    """Worker-wide holder of the circuit breakers of the services.
+
+    One circuit breaker is created per service, i.e. per URL origin, and
+    shared by every request of the worker to that service.
+
+    Attributes:
+        _lock: Thread lock for safe breaker creation.
+        _config: Configuration providing the breaker settings, set by
+            `configure`.
+        _breakers: Circuit breakers keyed by service origin.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _config: ClassVar[ConfigContract | None] = None
+    _breakers: ClassVar[dict[str, CircuitBreaker]] = {}
+
+    @classmethod
+    def configure(cls, config: ConfigContract) -> None:
+        """Set the configuration used to create the circuit breakers.
+
+        Args:
+            config: Configuration providing the breaker settings
+        """
+        cls._config = config
+
+    @classmethod
+    def get_breaker(cls, url: str) -> CircuitBreaker:
+        """Get the circuit breaker of the service serving a URL (thread-safe).
+
+        Args:
+            url: URL of the request to send
+
+        Returns:
+            The circuit breaker of the service
+        """
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+
+        breaker = cls._breakers.get(origin)
+        if breaker is not None:
+            return breaker
+
+        with cls._lock:
+            if origin not in cls._breakers:
+                cls._breakers[origin] = CircuitBreaker(settings=cls._get_settings())
+            return cls._breakers[origin]
+
+    @classmethod
+    def get_metrics(cls) -> dict[str, dict[str, Any]]:
+        """Get the state and counters of the circuit breakers created so far.
+
+        Returns:
+            The metrics of each circuit breaker, keyed by service origin
+        """
+        return {
+            origin: breaker.get_metrics()
+            for origin, breaker in list(cls._breakers.items())
+        }
+
+    @classmethod
+    def _get_settings(cls) -> CircuitBreakerSettings:
+        """Get the settings of new circuit breakers.
+
+        Returns:
+            The configured settings, or the built-in ones if not configured
+        """
+        if cls._config is None:
+            return CircuitBreakerSettings()
+
+        return CircuitBreakerSettings(
+            window_size=cls._config.get_enrichment_breaker_window_size(),
+            min_calls=cls._config.get_enrichment_breaker_min_calls(),
+            failure_rate=cls._config.get_enrichment_breaker_failure_rate(),
+            open_seconds=cls._config.get_enrichment_breaker_open_seconds(),
+        )
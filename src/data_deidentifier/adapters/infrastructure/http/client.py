@@ -1,6 +1,5 @@
 from typing import Any
 
-import httpx
 from fastapi import status
 from httpx import HTTPError, HTTPStatusError, Response
 from logger import LoggerContract
@@ -11,6 +10,9 @@ from tenacity import (
     wait_exponential,
 )
 
+from .breaker import CircuitBreaker, CircuitBreakerRegistry
+from .pool import HttpClientPool, HttpPoolSettings
+
 
 class HttpClientError(Exception):
     """Generic HTTP client error for BaseHttpClient.
@@ -21,27 +23,40 @@ class HttpClientError(Exception):
     """
 
 
+class HttpCircuitOpenError(HttpClientError):
+    """Raised instead of sending a request to a service whose circuit is open."""
+
+
 class BaseHttpClient:
     """Base HTTP client with retry logic and exponential backoff.
 
     Provides common HTTP request handling with automatic retries for server errors,
-    exponential backoff, and comprehensive logging.
+    exponential backoff, and comprehensive logging. Requests go through the
+    shared, connection-pooled client of their service, and are rejected right
+    away while the circuit breaker of their service is open.
     """
 
     DEFAULT_TIMEOUT = 10
 
-    def __init__(self, logger: LoggerContract) -> None:
+    def __init__(
+        self,
+        logger: LoggerContract,
+        pool_settings: HttpPoolSettings | None = None,
+    ) -> None:
         """Initialize the HTTP client.
 
         Args:
             logger: Logger instance for recording HTTP operations and errors
+            pool_settings: Connection pool settings of the services requested
+                (None means the configured defaults)
         """
         self.logger = logger
+        self.pool_settings = pool_settings
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=5),
-        retry=retry_if_exception(lambda e: BaseHttpClient._should_retry(e)),
+        retry=retry_if_exception(lambda e: BaseHttpClient._should_retry(e)),  # noqa: PLW0108
         reraise=True,
     )
     def request(
@@ -68,6 +83,7 @@ class BaseHttpClient:
             Response: The HTTP response from the service.
 
         Raises:
+            HttpCircuitOpenError: If the circuit of the service is open.
             HttpClientError: If the request fails after all retries or
                 returns a non-2xx status code.
 
@@ -75,38 +91,201 @@ class BaseHttpClient:
             Only server errors (5xx) are retried. Client errors (4xx) indicate
             invalid requests and are not retried.
         """
-        logger_context = {
-            "url": url,
-            "method": method,
-            "timeout_seconds": timeout_seconds,
-        }
+        logger_context = self._get_logger_context(
+            url=url,
+            method=method,
+            timeout_seconds=timeout_seconds,
+        )
         self.logger.debug("Making HTTP request", logger_context)
 
+        breaker = self._get_breaker(url=url, logger_context=logger_context)
+        service_failed = True
         try:
-            with httpx.Client() as client:
-                response = client.request(
-                    method=method,
+            client = HttpClientPool.get_client(url=url, settings=self.pool_settings)
+            response = client.request(
+                **self._get_request_args(
                     url=url,
-                    json=data if method in ("POST", "PUT", "PATCH") else None,
-                    params=data if method == "GET" else None,
+                    method=method,
+                    data=data,
                     headers=headers,
-                    timeout=timeout_seconds,
-                )
-                response.raise_for_status()
+                    timeout_seconds=timeout_seconds,
+                ),
+            )
+            service_failed = (
+                response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+            response.raise_for_status()
         except HTTPError as e:
             msg = "HTTP error occurred"
             self.logger.exception(msg, e, logger_context)
             raise HttpClientError(msg) from e
         else:
-            self.logger.debug(
-                "HTTP request successful",
-                {
-                    "url": url,
-                    "status_code": response.status_code,
-                    "response_size": len(response.text),
-                },
+            self._log_response(url=url, response=response)
+            return response
+        finally:
+            # Errors, timeouts and cancellations count as failures
+            breaker.record(success=not service_failed)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=5),
+        retry=retry_if_exception(lambda e: BaseHttpClient._should_retry(e)),  # noqa: PLW0108
+        reraise=True,
+    )
+    async def request_async(
+        self,
+        url: str,
+        method: str,
+        data: dict[str, Any],
+        headers: dict[str, str] | None = None,
+        timeout_seconds: int = DEFAULT_TIMEOUT,
+    ) -> Response:
+        """Make an HTTP request with retry logic, without blocking the event loop.
+
+        Same as `request`, through the shared async client of the service. Must
+        run on the event loop of the client pool (see `HttpClientPool.run`).
+
+        Args:
+            url: Complete URL for the request
+            method: HTTP method to use (GET, POST, PUT, etc.)
+            data: Request payload data
+            headers: Optional HTTP headers to include in the request
+            timeout_seconds: Request timeout in seconds
+
+        Returns:
+            Response: The HTTP response from the service.
+
+        Raises:
+            HttpCircuitOpenError: If the circuit of the service is open.
+            HttpClientError: If the request fails after all retries or
+                returns a non-2xx status code.
+        """
+        logger_context = self._get_logger_context(
+            url=url,
+            method=method,
+            timeout_seconds=timeout_seconds,
+        )
+        self.logger.debug("Making async HTTP request", logger_context)
+
+        breaker = self._get_breaker(url=url, logger_context=logger_context)
+        service_failed = True
+        try:
+            client = HttpClientPool.get_async_client(
+                url=url,
+                settings=self.pool_settings,
+            )
+            response = await client.request(
+                **self._get_request_args(
+                    url=url,
+                    method=method,
+                    data=data,
+                    headers=headers,
+                    timeout_seconds=timeout_seconds,
+                ),
             )
+            service_failed = (
+                response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+            response.raise_for_status()
+        except HTTPError as e:
+            msg = "HTTP error occurred"
+            self.logger.exception(msg, e, logger_context)
+            raise HttpClientError(msg) from e
+        else:
+            self._log_response(url=url, response=response)
             return response
+        finally:
+            # Errors, timeouts and cancellations count as failures
+            breaker.record(success=not service_failed)
+
+    def _get_breaker(self, url: str, logger_context: dict[str, Any]) -> CircuitBreaker:
+        """Get the circuit breaker of the service, checking that it lets a request in.
+
+        Args:
+            url: Complete URL for the request
+            logger_context: Logging context of the request
+
+        Returns:
+            The circuit breaker, to record the outcome of the request with
+
+        Raises:
+            HttpCircuitOpenError: If the circuit of the service is open.
+        """
+        breaker = CircuitBreakerRegistry.get_breaker(url)
+        if not breaker.allow_request():
+            self.logger.debug("HTTP request rejected, circuit open", logger_context)
+            raise HttpCircuitOpenError("Circuit open for the service")
+        return breaker
+
+    @staticmethod
+    def _get_logger_context(
+        url: str,
+        method: str,
+        timeout_seconds: int,
+    ) -> dict[str, Any]:
+        """Build the logging context of a request.
+
+        Args:
+            url: Complete URL for the request
+            method: HTTP method
+            timeout_seconds: Request timeout in seconds
+
+        Returns:
+            The logging context
+        """
+        return {
+            "url": url,
+            "method": method,
+            "timeout_seconds": timeout_seconds,
+        }
+
+    @staticmethod
+    def _get_request_args(
+        url: str,
+        method: str,
+        data: dict[str, Any],
+        headers: dict[str, str] | None,
+        timeout_seconds: int,
+    ) -> dict[str, Any]:
+        """Build the arguments of a request sent by an httpx client.
+
+        Data is sent as a JSON body for POST, PUT and PATCH requests, and as
+        query parameters for GET requests.
+
+        Args:
+            url: Complete URL for the request
+            method: HTTP method
+            data: Request payload data
+            headers: Optional HTTP headers
+            timeout_seconds: Request timeout in seconds
+
+        Returns:
+            The keyword arguments of `request`
+        """
+        return {
+            "method": method,
+            "url": url,
+            "json": data if method in ("POST", "PUT", "PATCH") else None,
+            "params": data if method == "GET" else None,
+            "headers": headers,
+            "timeout": timeout_seconds,
+        }
+
+    def _log_response(self, url: str, response: Response) -> None:
+        """Log a successful response.
+
+        Args:
+            url: URL of the request
+            response: The response received
+        """
+        self.logger.debug(
+            "HTTP request successful",
+            {
+                "url": url,
+                "status_code": response.status_code,
+                "response_size": len(response.text),
+            },
+        )
 
     @classmethod
     def _should_retry(cls, exception: BaseException) -> bool:
@@ -0,0 +1,279 @@
+import asyncio
+import threading
+from collections.abc import Coroutine
+from dataclasses import dataclass
+from typing import Any, ClassVar
+from urllib.parse import urlsplit
+
+import httpx
+from logger import LoggerContract
+
+from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
+
+
+@dataclass(frozen=True)
+class HttpPoolSettings:
+    """Connection pool settings of the client of a service.
+
+    Attributes:
+        max_connections: Maximum number of concurrent connections
+        max_keepalive_connections: Maximum number of idle connections kept open
+        keepalive_expiry_seconds: Time after which an idle connection is closed
+        http2: Whether to negotiate HTTP/2 with the service
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30.0
+    http2: bool = False
+
+
+class HttpClientPool:
+    """Worker-wide holder of long-lived, connection-pooled HTTP clients.
+
+    One client is created per service, i.e. per URL origin, with the pool
+    settings of the first caller, and reused by every later request to that
+    service, so that connections are kept alive instead of paying a TCP and TLS
+    handshake per request. Clients hold no per-request state and are safe to
+    share between threads.
+
+    Async clients, used to send requests concurrently, are bound to the event
+    loop they were created in: they live on a dedicated event loop thread,
+    started on first use, to which synchronous code submits coroutines with
+    `run`.
+
+    Attributes:
+        _lock: Thread lock for safe client and event loop creation.
+        _config: Configuration providing the default pool settings, set by
+         `configure`.
+        _logger: Logger, set by `configure`.
+        _clients: Clients keyed by service origin.
+        _async_clients: Async clients keyed by service origin, only used from
+            the event loop thread.
+        _loop: Event loop running the async requests.
+        _loop_thread: Thread running the event loop.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _config: ClassVar[ConfigContract | None] = None
+    _logger: ClassVar[LoggerContract | None] = None
+    _clients: ClassVar[dict[str, httpx.Client]] = {}
+    _async_clients: ClassVar[dict[str, httpx.AsyncClient]] = {}
+    _loop: ClassVar[asyncio.AbstractEventLoop | None] = None
+    _loop_thread: ClassVar[threading.Thread | None] = None
+
+    @classmethod
+    def configure(cls, config: ConfigContract, logger: LoggerContract) -> None:
+        """Set the configuration and logger used to create the clients.
+
+        Args:
+            config: Configuration providing the default pool settings
+            logger: Logger for logging events
+        """
+        cls._config = config
+        cls._logger = logger
+
+    @classmethod
+    def get_default_settings(cls) -> HttpPoolSettings:
+        """Get the pool settings of services not overriding them.
+
+        Returns:
+            The configured pool settings, or the built-in ones if not configured
+        """
+        if cls._config is None:
+            return HttpPoolSettings()
+
+        return HttpPoolSettings(
+            max_connections=cls._config.get_enrichment_http_max_connections(),
+            max_keepalive_connections=(
+                cls._config.get_enrichment_http_max_keepalive_connections()
+            ),
+            keepalive_expiry_seconds=(
+                cls._config.get_enrichment_http_keepalive_expiry_seconds()
+            ),
+            http2=cls._config.is_enrichment_http2_enabled(),
+        )
+
+    @classmethod
+    def get_client(
+        cls,
+        url: str,
+        settings: HttpPoolSettings | None = None,
+    ) -> httpx.Client:
+        """Get the shared client of the service serving a URL (thread-safe).
+
+        Args:
+            url: URL of the request to send
+            settings: Pool settings of the service (None means the defaults),
+                only used when its client is created
+
+        Returns:
+            The shared client of the service
+        """
+        origin = cls._get_origin(url)
+
+        client = cls._clients.get(origin)
+        if client is not None:
+            return client
+
+        with cls._lock:
+            if origin not in cls._clients:
+                cls._clients[origin] = cls._create_client(
+                    origin=origin,
+                    settings=settings or cls.get_default_settings(),
+                )
+            return cls._clients[origin]
+
+    @classmethod
+    def get_async_client(
+        cls,
+        url: str,
+        settings: HttpPoolSettings | None = None,
+    ) -> httpx.AsyncClient:
+        """Get the shared async client of the service serving a URL.
+
+        Must be called from the event loop thread, i.e. from a coroutine
+        submitted with `run`.
+
+        Args:
+            url: URL of the request to send
+            settings: Pool settings of the service (None means the defaults),
+                only used when its client is created
+
+        Returns:
+            The shared async client of the service
+        """
+        origin = cls._get_origin(url)
+
+        client = cls._async_clients.get(origin)
+        if client is None:
+            client = cls._async_clients[origin] = cls._create_client(
+                origin=origin,
+                settings=settings or cls.get_default_settings(),
+                client_class=httpx.AsyncClient,
+            )
+        return client
+
+    @classmethod
+    def run[T](cls, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the event loop thread and wait for its result.
+
+        Args:
+            coroutine: The coroutine to run, which may use the async clients
+
+        Returns:
+            The result of the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, cls._get_loop()).result()
+
+    @classmethod
+    def close(cls) -> None:
+        """Close the clients and their connections, when the worker shuts down."""
+        with cls._lock:
+            clients = list(cls._clients.values())
+            cls._clients.clear()
+            loop, loop_thread = cls._loop, cls._loop_thread
+            cls._loop = cls._loop_thread = None
+
+        for client in clients:
+            client.close()
+
+        if loop is not None and loop_thread is not None and loop_thread.is_alive():
+            asyncio.run_coroutine_threadsafe(cls._close_async_clients(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join()
+        cls._async_clients.clear()
+
+    @classmethod
+    async def _close_async_clients(cls) -> None:
+        """Close the async clients, from the event loop thread."""
+        clients = list(cls._async_clients.values())
+        cls._async_clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    @classmethod
+    def _get_loop(cls) -> asyncio.AbstractEventLoop:
+        """Get the event loop running the async requests, starting it if needed.
+
+        The thread is checked rather than the loop alone, as it does not
+        survive a fork into a pool process.
+
+        Returns:
+            The running event loop
+        """
+        loop, loop_thread = cls._loop, cls._loop_thread
+        if loop is not None and loop_thread is not None and loop_thread.is_alive():
+            return loop
+
+        with cls._lock:
+            if cls._loop_thread is None or not cls._loop_thread.is_alive():
+                # Clients of a loop from before a fork cannot be used
+                cls._async_clients.clear()
+                cls._loop = asyncio.new_event_loop()
+                cls._loop_thread = threading.Thread(
+                    target=cls._loop.run_forever,
+                    name="http-client-pool",
+                    daemon=True,
+                )
+                cls._loop_thread.start()
+            return cls._loop
+
+    @staticmethod
+    def _get_origin(url: str) -> str:
+        """Get the origin identifying the service serving a URL.
+
+        Args:
+            url: URL of a request
+
+        Returns:
+            The scheme, host and port of the URL
+        """
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    @classmethod
+    def _create_client[C: (httpx.Client, httpx.AsyncClient)](
+        cls,
+        origin: str,
+        settings: HttpPoolSettings,
+        client_class: type[C] = httpx.Client,
+    ) -> C:
+        """Create the client of a service.
+
+        Args:
+            origin: Scheme, host and port of the service
+            settings: Pool settings of the service
+            client_class: Class of the client to create, sync or async
+
+        Returns:
+            The new client
+        """
+        limits = httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry_seconds,
+        )
+
+        try:
+            client = client_class(limits=limits, http2=settings.http2)
+        except ImportError:
+            # HTTP/2 support needs the optional `h2` package (httpx[http2])
+            if cls._logger is not None:
+                cls._logger.warning(
+                    "HTTP/2 is not available, falling back to HTTP/1.1",
+                    {"service": origin},
+                )
+            client = client_class(limits=limits)
+
+        if cls._logger is not None:
+            cls._logger.debug(
+                "HTTP client created",
+                {
+                    "service": origin,
+                    "http2": settings.http2,
+                    "async": client_class is httpx.AsyncClient,
+                },
+            )
+
+        return client
@@ -0,0 +1,45 @@
+import os
+from pathlib import Path
+
+
+class ProcessMemoryInspector:
+    """Reads the memory footprint of the current process from procfs.
+
+    Distinguishes the pages the process shares with others (e.g. the models
+    inherited from a preloading gunicorn master) from the pages only it uses.
+    Only available on Linux; other platforms report no data.
+    """
+
+    SMAPS_ROLLUP_PATH = Path("/proc/self/smaps_rollup")
+
+    # smaps_rollup fields (in kB) summed into each reported figure
+    _SHARED_FIELDS = ("Shared_Clean", "Shared_Dirty")
+    _UNIQUE_FIELDS = ("Private_Clean", "Private_Dirty")
+
+    @classmethod
+    def get_usage(cls) -> dict[str, int] | None:
+        """Get the memory usage of the current process.
+
+        Returns:
+            The pid and the resident, proportional, shared and unique set sizes
+            in bytes, or None if procfs is not available
+        """
+        try:
+            content = cls.SMAPS_ROLLUP_PATH.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+        fields_kb: dict[str, int] = {}
+        for line in content.splitlines():
+            name, _, value = line.partition(":")
+            parts = value.split()
+            if len(parts) == 2 and parts[1] == "kB":  # noqa: PLR2004
+                fields_kb[name.strip()] = int(parts[0])
+
+        return {
+            "pid": os.getpid(),
+            "rss_bytes": fields_kb.get("Rss", 0) * 1024,
+            "pss_bytes": fields_kb.get("Pss", 0) * 1024,
+            "shared_bytes": sum(fields_kb.get(f, 0) for f in cls._SHARED_FIELDS) * 1024,
+            "unique_bytes": sum(fields_kb.get(f, 0) for f in cls._UNIQUE_FIELDS) * 1024,
+        }
@@ -0,0 +1,57 @@
+import hashlib
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+
+class StructureFingerprint:
+    """Computes fingerprints identifying the structure of JSON documents.
+
+    Two documents share a fingerprint when they hold the same key paths with
+    values of the same types, whatever the values themselves and the lengths
+    of their lists.
+    """
+
+    LIST_SUFFIX = "[]"
+
+    @classmethod
+    def compute(cls, data: Mapping[str, Any], language: str) -> str:
+        """Compute the fingerprint of a document analyzed in a language.
+
+        Args:
+            data: The JSON document
+            language: Language code the document is analyzed in
+
+        Returns:
+            A hex digest of the sorted key paths and value types, and the language
+        """
+        shape: set[tuple[str, str]] = set()
+        cls._collect(value=data, path="", shape=shape)
+
+        digest = hashlib.sha256(language.encode())
+        for path, type_name in sorted(shape):
+            digest.update(f"\0{path}\0{type_name}".encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def _collect(
+        cls,
+        value: Any,  # noqa: ANN401
+        path: str,
+        shape: set[tuple[str, str]],
+    ) -> None:
+        """Add the key paths and value types found under a value to a shape.
+
+        Args:
+            value: The value to walk
+            path: Key path of the value in the document
+            shape: The (key path, type name) pairs collected so far
+        """
+        if isinstance(value, Mapping) and value:
+            for key, item in value.items():
+                item_path = f"{path}.{key}" if path else str(key)
+                cls._collect(value=item, path=item_path, shape=shape)
+        elif isinstance(value, Sequence) and not isinstance(value, str) and value:
+            for item in value:
+                cls._collect(value=item, path=path + cls.LIST_SUFFIX, shape=shape)
+        else:
+            shape.add((path, type(value).__name__))
@@ -0,0 +1,130 @@
+import re
+from typing import ClassVar
+
+from src.data_deidentifier.domain.types.segmentation_mode import SegmentationMode
+
+
+class TextSegmenter:
+    """Splits texts into sentences, paragraphs or chunks, keeping their positions.
+
+    Segments are located with lightweight separator patterns rather than the
+    NLP pipeline, since the point of segmenting is to avoid running it.
+    """
+
+    _SEPARATORS: ClassVar[dict[SegmentationMode, re.Pattern[str]]] = {
+        # Blank lines, or whitespace following a sentence-ending punctuation
+        SegmentationMode.SENTENCE: re.compile(r"\n\s*\n|(?<=[.!?])\s+"),
+        SegmentationMode.PARAGRAPH: re.compile(r"\n\s*\n"),
+    }
+    _WHITESPACE: ClassVar[re.Pattern[str]] = re.compile(r"\s+")
+
+    @classmethod
+    def split(cls, text: str, mode: SegmentationMode) -> list[tuple[int, int]]:
+        """Split a text into segments.
+
+        Args:
+            text: Text to split
+            mode: How to split the text
+
+        Returns:
+            The start and end positions of each non-empty segment, in order
+        """
+        if mode == SegmentationMode.NONE:
+            return [(0, len(text))] if text else []
+
+        segments = []
+        start = 0
+        for separator in cls._SEPARATORS[mode].finditer(text):
+            if separator.start() > start:
+                segments.append((start, separator.start()))
+            start = separator.end()
+
+        if start < len(text):
+            segments.append((start, len(text)))
+
+        return segments
+
+    @classmethod
+    def split_into_chunks(
+        cls,
+        text: str,
+        chunk_size: int,
+        overlap: int,
+    ) -> list[tuple[int, int]]:
+        """Group the sentences of a text into overlapping chunks.
+
+        Chunks hold as many whole sentences as fit in `chunk_size` characters,
+        and each chunk starts with the trailing sentences of the previous one
+        that fit in `overlap` characters. Sentences longer than a chunk are
+        split at whitespace.
+
+        Args:
+            text: Text to split
+            chunk_size: Maximum length of a chunk in characters
+            overlap: Maximum length shared by two consecutive chunks
+
+        Returns:
+            The start and end positions of each chunk, in order
+        """
+        sentences = [
+            piece
+            for sentence in cls.split(text=text, mode=SegmentationMode.SENTENCE)
+            for piece in cls._split_oversized(text, sentence, chunk_size)
+        ]
+
+        chunks = []
+        first = 0
+        while first < len(sentences):
+            last = first
+            while (
+                last + 1 < len(sentences)
+                and sentences[last + 1][1] - sentences[first][0] <= chunk_size
+            ):
+                last += 1
+
+            chunk_end = sentences[last][1]
+            chunks.append((sentences[first][0], chunk_end))
+            if last == len(sentences) - 1:
+                break
+
+            # Step back over the sentences fitting in the overlap
+            next_first = last + 1
+            while (
+                next_first - 1 > first
+                and chunk_end - sentences[next_first - 1][0] <= overlap
+            ):
+                next_first -= 1
+            first = next_first
+
+        return chunks
+
+    @classmethod
+    def _split_oversized(
+        cls,
+        text: str,
+        span: tuple[int, int],
+        max_length: int,
+    ) -> list[tuple[int, int]]:
+        """Split a segment longer than `max_length` at whitespace.
+
+        Args:
+            text: Text containing the segment
+            span: Start and end positions of the segment
+            max_length: Maximum length of a piece in characters
+
+        Returns:
+            The start and end positions of each piece of the segment
+        """
+        start, end = span
+        pieces = []
+        while end - start > max_length:
+            limit = start + max_length
+            separators = list(cls._WHITESPACE.finditer(text, start + 1, limit))
+            if not separators:
+                pieces.append((start, limit))
+                start = limit
+                continue
+            pieces.append((start, separators[-1].start()))
+            start = separators[-1].end()
+        pieces.append((start, end))
+        return pieces
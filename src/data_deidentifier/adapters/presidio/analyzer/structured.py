@@ -1,13 +1,27 @@
+import fnmatch
+from collections.abc import Mapping
+from typing import Any
+
+import pandas as pd
 from logger import LoggerContract
 from presidio_structured import StructuredAnalysis
 from presidio_structured.data.data_processors import DataProcessorBase
 
+from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
+from src.data_deidentifier.adapters.presidio.analyzer.fingerprint import (
+    StructureFingerprint,
+)
+from src.data_deidentifier.adapters.presidio.analyzer.structured_types.sampling import (
+    ColumnSampling,
+)
 from src.data_deidentifier.adapters.presidio.engines import PresidioEngineFactory
 from src.data_deidentifier.adapters.presidio.exceptions import (
     StructuredDataAnalysisError,
 )
 from src.data_deidentifier.domain.types.language import SupportedLanguage
-from src.data_deidentifier.domain.types.structured_data import StructuredData
+from src.data_deidentifier.domain.types.structured_analysis_options import (
+    StructuredAnalysisOptions,
+)
 
 
 class PresidioStructuredDataAnalyzer:
@@ -16,12 +30,14 @@ class PresidioStructuredDataAnalyzer:
     This class uses the Presidio Analyzer to detect PII entities in structured data.
     """
 
-    def __init__(self, logger: LoggerContract) -> None:
+    def __init__(self, config: ConfigContract, logger: LoggerContract) -> None:
         """Initialize the Presidio-structured analyzer.
 
         Args:
+            config: Configuration contract
             logger: Logger for logging events
         """
+        self.config = config
         self.logger = logger
 
         self.analyzer_factory = (
@@ -32,26 +48,65 @@ class PresidioStructuredDataAnalyzer:
 
         self.logger.debug("Presidio Structured Analyzer initialized successfully")
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the shared analyzer factory for pickling into pool processes.
+
+        Returns:
+            The instance state without the engine
+        """
+        state = self.__dict__.copy()
+        del state["analyzer_factory"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the instance state and re-acquire the process-wide analyzer factory.
+
+        Args:
+            state: The instance state produced by `__getstate__`
+        """
+        self.__dict__.update(state)
+        self.analyzer_factory = (
+            PresidioEngineFactory.get_structured_data_analyzer_factory(
+                logger=self.logger,
+            )
+        )
+
     def analyze(
         self,
-        data: StructuredData,
+        data: Mapping[str, Any] | pd.DataFrame,
         language: SupportedLanguage,
         entity_types: list[str] | None = None,
-    ) -> tuple[StructuredAnalysis, DataProcessorBase]:
+        analysis_options: StructuredAnalysisOptions | None = None,
+        free_text_fields: frozenset[str] = frozenset(),
+    ) -> tuple[StructuredAnalysis, DataProcessorBase, dict[str, Any]]:
         """Analyze structured data to detect PII entities.
 
+        Fields named in the hints of the request, then fields matching the
+        configured field name rules, are mapped to their entity type without
+        being analyzed; only the remaining fields go through the NLP analysis.
+
+        When the structured analysis cache is enabled, JSON documents sharing
+        the structure of a recently analyzed one reuse its fields mapping
+        instead of being analyzed again.
+
         Args:
-            data: Structured data to analyze
+            data: JSON document or DataFrame to analyze
             language: Language code of the text
             entity_types: Types of entities to detect (None means all supported types)
+            analysis_options: Optional per-request options of the analysis
+            free_text_fields: Fields anonymized at span level by the caller,
+                left out of the analysis unless hinted or matched by a rule
 
         Returns:
             StructuredAnalysis: List of detected fields
             DataProcessorBase: DataProcessor instance for this analyzer's data type
+            dict: Details of how the analysis ran (e.g. structure cache hit,
+                fields mapped by hints or rules)
 
         Raises:
             StructuredDataAnalysisError: If analysis fails
         """
+        analysis_options = analysis_options or StructuredAnalysisOptions()
         analyzer = self.analyzer_factory.get_analyzer(data=data)
 
         language = language.lower()
@@ -63,16 +118,77 @@ class PresidioStructuredDataAnalyzer:
         }
         self.logger.debug("Starting structured data analysis", logger_context)
 
-        try:
-            # Use the analyzer to process the data
-            presidio_results = analyzer.analyze(
-                data=data,
-                language=language,
+        field_names = analyzer.get_field_names(data=data)
+        hint_mapping = {
+            field_name: entity_type
+            for field_name, entity_type in (analysis_options.field_hints or {}).items()
+            if field_name in field_names
+        }
+        rule_mapping = self._match_field_name_rules(
+            field_names=[name for name in field_names if name not in hint_mapping],
+        )
+
+        left_out_fields = free_text_fields.difference(hint_mapping, rule_mapping)
+
+        analysis_details: dict[str, Any] = {
+            "hinted_fields": sorted(hint_mapping),
+            "rule_mapped_fields": sorted(rule_mapping),
+        }
+        structure_cache = None
+        cache_key = ""
+        if self.config.is_structured_analysis_cache_enabled() and isinstance(
+            data,
+            Mapping,
+        ):
+            structure_cache = PresidioEngineFactory.get_structured_analysis_cache(
+                config=self.config,
             )
-        except Exception as e:
-            msg = "Unexpected error during structured data analysis"
-            self.logger.exception(msg, e, logger_context)
-            raise StructuredDataAnalysisError(msg) from e
+            cache_key = StructureFingerprint.compute(data=data, language=language)
+            analysis_details["structure_cache_hit"] = False
+
+        cached_mapping = (
+            structure_cache.get(cache_key)
+            if structure_cache is not None and not analysis_options.bypass_cache
+            else None
+        )
+
+        if cached_mapping is not None:
+            presidio_results = StructuredAnalysis(
+                entity_mapping={
+                    field_name: entity_type
+                    for field_name, entity_type in cached_mapping.items()
+                    if field_name not in left_out_fields
+                },
+            )
+            analysis_details["structure_cache_hit"] = True
+        else:
+            try:
+                # Use the analyzer to process the fields of unknown entity type
+                presidio_results, type_details = analyzer.analyze(
+                    data=data,
+                    language=language,
+                    sampling=self._get_column_sampling(options=analysis_options),
+                    skipped_kinds=frozenset(
+                        self.config.get_structured_skipped_field_kinds(),
+                    ),
+                    excluded_fields=left_out_fields.union(hint_mapping, rule_mapping),
+                )
+            except Exception as e:
+                msg = "Unexpected error during structured data analysis"
+                self.logger.exception(msg, e, logger_context)
+                raise StructuredDataAnalysisError(msg) from e
+
+            analysis_details.update(type_details)
+            presidio_results.entity_mapping = {
+                **presidio_results.entity_mapping,
+                **rule_mapping,
+            }
+
+            # Cache the unfiltered mapping, so that it serves any entity types.
+            # Hinted and free-text fields were not analyzed, so the mapping is
+            # only complete without them.
+            if structure_cache is not None and not hint_mapping and not left_out_fields:
+                structure_cache.set(cache_key, dict(presidio_results.entity_mapping))
 
         # Filter by entity types if specified
         if entity_types:
@@ -82,9 +198,80 @@ class PresidioStructuredDataAnalyzer:
                 if entity_type in entity_types
             }
 
+        # Hints are explicit requests of the caller, so they are always honored
+        presidio_results.entity_mapping.update(hint_mapping)
+
         self.logger.info(
             "Structured analysis completed successfully",
-            {"fields_mapped": len(presidio_results.entity_mapping), **logger_context},
+            {
+                "fields_mapped": len(presidio_results.entity_mapping),
+                **analysis_details,
+                **logger_context,
+            },
         )
 
-        return presidio_results, analyzer.get_data_processor()
+        return presidio_results, analyzer.get_data_processor(), analysis_details
+
+    def _get_column_sampling(
+        self,
+        options: StructuredAnalysisOptions,
+    ) -> ColumnSampling:
+        """Get the sampling settings of an analysis, defaulting to the configured ones.
+
+        Args:
+            options: The per-request options of the analysis
+
+        Returns:
+            The sampling settings of table columns
+        """
+        return ColumnSampling(
+            sample_size=options.sample_size or self.config.get_structured_sample_size(),
+            min_agreement=(
+                options.min_agreement
+                if options.min_agreement is not None
+                else self.config.get_structured_sample_min_agreement()
+            ),
+            random_seed=(
+                options.random_seed
+                if options.random_seed is not None
+                else self.config.get_structured_sample_random_seed()
+            ),
+            stratified=(
+                options.stratified_sampling
+                if options.stratified_sampling is not None
+                else self.config.is_structured_sample_stratified()
+            ),
+        )
+
+    def _match_field_name_rules(self, field_names: list[str]) -> dict[str, str]:
+        """Map fields to entity types with the configured field name rules.
+
+        Patterns are matched case-insensitively against the last segment of
+        the field key path, or against the whole path for patterns holding a
+        dot. The first matching rule wins.
+
+        Args:
+            field_names: Names of the fields to match
+
+        Returns:
+            The entity type of each field matching a rule
+        """
+        rules = [
+            (pattern.lower(), entity_type.upper())
+            for pattern, entity_type in (
+                self.config.get_structured_field_name_rules().items()
+            )
+        ]
+        if not rules:
+            return {}
+
+        mapping = {}
+        for field_name in field_names:
+            path = field_name.lower()
+            name = path.rsplit(".", 1)[-1]
+            for pattern, entity_type in rules:
+                if fnmatch.fnmatchcase(path if "." in pattern else name, pattern):
+                    mapping[field_name] = entity_type
+                    break
+
+        return mapping
@@ -1,3 +1,5 @@
+from collections import defaultdict
+from collections.abc import Mapping
 from typing import Any, override
 
 from presidio_structured import (
@@ -9,8 +11,10 @@ from presidio_structured.data.data_processors import (
     JsonDataProcessor,
 )
 
+from src.data_deidentifier.domain.types.field_kind import FieldKind
 from src.data_deidentifier.domain.types.language import SupportedLanguage
 
+from .sampling import ColumnSampling
 from .structured_type import StructuredTypeAnalyzer
 
 
@@ -19,6 +23,11 @@ class JsonAnalyzer(StructuredTypeAnalyzer):
 
     This class implements analysis for JSON-formatted data (Python dictionaries)
     using Presidio's JsonAnalysisBuilder.
+
+    Leaves are grouped by key path, values of arrays sharing the path of their
+    array, and the key paths whose values cannot hold text entities or whose
+    entity type is already known are removed from the document before it is
+    analyzed.
     """
 
     @override
@@ -26,15 +35,111 @@ class JsonAnalyzer(StructuredTypeAnalyzer):
         return isinstance(data, dict)
 
     @override
-    def analyze(self, data: Any, language: SupportedLanguage) -> StructuredAnalysis:
+    def analyze(
+        self,
+        data: Any,
+        language: SupportedLanguage,
+        sampling: ColumnSampling,
+        skipped_kinds: frozenset[FieldKind],
+        excluded_fields: frozenset[str],
+    ) -> tuple[StructuredAnalysis, dict[str, Any]]:
         self.logger.debug("Analyzing JSON data", {"nb_keys": len(data)})
 
-        analyzer = JsonAnalysisBuilder()
-        return analyzer.generate_analysis(
-            data=data,
+        leaves: defaultdict[str, list[Any]] = defaultdict(list)
+        self._collect_leaves(value=data, path="", leaves=leaves)
+
+        skipped_fields = {}
+        for path, values in leaves.items():
+            if path in excluded_fields:
+                continue
+            present = [value for value in values if value is not None]
+            kind = self._classify_values(
+                distinct_values=list(dict.fromkeys(present)),
+                occurrences=len(present),
+                skipped_kinds=skipped_kinds,
+            )
+            if kind is not None:
+                skipped_fields[path] = kind
+
+        analysis_details = {"skipped_fields": skipped_fields}
+        left_out = excluded_fields.union(skipped_fields)
+        if leaves and left_out.issuperset(leaves):
+            return StructuredAnalysis(entity_mapping={}), analysis_details
+
+        analyzer = JsonAnalysisBuilder(analyzer=self.analyzer_engine)
+        analysis = analyzer.generate_analysis(
+            data=self._without_paths(
+                value=data,
+                path="",
+                paths=left_out,
+            ),
             language=language,
         )
+        return analysis, analysis_details
+
+    @override
+    def get_field_names(self, data: Any) -> list[str]:
+        leaves: defaultdict[str, list[Any]] = defaultdict(list)
+        self._collect_leaves(value=data, path="", leaves=leaves)
+        return list(leaves)
 
     @override
     def get_data_processor(self) -> DataProcessorBase:
         return JsonDataProcessor()
+
+    @classmethod
+    def _collect_leaves(
+        cls,
+        value: Any,  # noqa: ANN401
+        path: str,
+        leaves: defaultdict[str, list[Any]],
+    ) -> None:
+        """Group the leaf values found under a value by key path.
+
+        Args:
+            value: The value to walk
+            path: Key path of the value in the document
+            leaves: The leaf values collected so far, by key path
+        """
+        if isinstance(value, Mapping):
+            for key, item in value.items():
+                item_path = f"{path}.{key}" if path else str(key)
+                cls._collect_leaves(value=item, path=item_path, leaves=leaves)
+        elif isinstance(value, list):
+            for item in value:
+                cls._collect_leaves(value=item, path=path, leaves=leaves)
+        else:
+            leaves[path].append(value)
+
+    @classmethod
+    def _without_paths(
+        cls,
+        value: Any,  # noqa: ANN401
+        path: str,
+        paths: frozenset[str],
+    ) -> Any:  # noqa: ANN401
+        """Copy a value without the leaves found at some key paths.
+
+        Args:
+            value: The value to copy
+            path: Key path of the value in the document
+            paths: Key paths of the leaves to leave out
+
+        Returns:
+            The copy of the value
+        """
+        if isinstance(value, Mapping):
+            copy = {}
+            for key, item in value.items():
+                item_path = f"{path}.{key}" if path else str(key)
+                if item_path in paths and not isinstance(item, Mapping):
+                    continue
+                copy[key] = cls._without_paths(value=item, path=item_path, paths=paths)
+            return copy
+
+        if isinstance(value, list):
+            return [
+                cls._without_paths(value=item, path=path, paths=paths) for item in value
+            ]
+
+        return value
@@ -1,25 +1,37 @@
+from collections import Counter
+from dataclasses import asdict
 from typing import Any, override
 
 import pandas as pd
-from presidio_structured import (
-    PandasAnalysisBuilder,
-    StructuredAnalysis,
-)
+from presidio_analyzer import BatchAnalyzerEngine
+from presidio_structured import StructuredAnalysis
 from presidio_structured.data.data_processors import (
     DataProcessorBase,
     PandasDataProcessor,
 )
 
+from src.data_deidentifier.domain.types.field_kind import FieldKind
 from src.data_deidentifier.domain.types.language import SupportedLanguage
 
+from .sampling import ColumnSampler, ColumnSampling
 from .structured_type import StructuredTypeAnalyzer
 
 
 class DataFrameAnalyzer(StructuredTypeAnalyzer):
     """Analyzer for pandas DataFrame data.
 
-    This class implements analysis for pandas DataFrame objects using
-    Presidio's PandasAnalysisBuilder.
+    Each column is mapped to a single entity type, voted by the values of a
+    sample of the column: the entity type with the highest score in each
+    value gets the value's vote, and the column is mapped to the most voted
+    type if its share of the votes reaches the minimum agreement. The
+    analysis time of a table thus depends on its number of columns and the
+    sample size, not on its number of rows.
+
+    The votes are computed here rather than by Presidio's PandasAnalysisBuilder,
+    which neither takes a sampling seed nor reports how much the values agreed.
+
+    Columns whose dtype or values cannot hold text entities are skipped
+    without being sampled.
     """
 
     @override
@@ -31,14 +43,114 @@ class DataFrameAnalyzer(StructuredTypeAnalyzer):
         self,
         data: Any,
         language: SupportedLanguage,
-    ) -> StructuredAnalysis:
+        sampling: ColumnSampling,
+        skipped_kinds: frozenset[FieldKind],
+        excluded_fields: frozenset[str],
+    ) -> tuple[StructuredAnalysis, dict[str, Any]]:
         self.logger.debug("Analyzing DataFrame", {"nb_rows": len(data)})
 
-        analyzer = PandasAnalysisBuilder()
-        return analyzer.generate_analysis(
-            df=data,
-            language=language,
-        )
+        batch_analyzer = BatchAnalyzerEngine(analyzer_engine=self.analyzer_engine)
+
+        entity_mapping = {}
+        columns_details = {}
+        skipped_fields = {}
+        for column in data.columns:
+            if str(column) in excluded_fields:
+                continue
+
+            kind = self._classify_column(
+                values=data[column],
+                skipped_kinds=skipped_kinds,
+            )
+            if kind is not None:
+                skipped_fields[str(column)] = kind
+                continue
+
+            values, weights = ColumnSampler.sample(
+                values=data[column],
+                sampling=sampling,
+            )
+
+            votes: Counter[str] = Counter()
+            values_results = batch_analyzer.analyze_iterator(
+                texts=values,
+                language=language,
+            )
+            for value_results, weight in zip(values_results, weights, strict=True):
+                if value_results:
+                    best_result = max(value_results, key=lambda result: result.score)
+                    votes[best_result.entity_type] += weight
+
+            if not votes:
+                continue
+
+            entity_type, entity_votes = votes.most_common(1)[0]
+            agreement = entity_votes / sum(weights)
+            columns_details[str(column)] = {
+                "entity_type": entity_type,
+                "agreement": round(agreement, 3),
+                "sampled_values": len(values),
+            }
+            if agreement >= sampling.min_agreement:
+                entity_mapping[column] = entity_type
+
+        analysis_details = {
+            "sampling": {
+                "rows": len(data),
+                **asdict(sampling),
+                "columns": columns_details,
+            },
+            "skipped_fields": skipped_fields,
+        }
+        return StructuredAnalysis(entity_mapping=entity_mapping), analysis_details
+
+    def _classify_column(
+        self,
+        values: pd.Series,
+        skipped_kinds: frozenset[FieldKind],
+    ) -> FieldKind | None:
+        """Classify a column by its dtype, or by profiling its values if untyped.
+
+        Tables are received in object columns, so the dtype is inferred on a
+        copy of the column, leaving the values to anonymize untouched.
+
+        Args:
+            values: The values of the column
+            skipped_kinds: Kinds of fields to look for
+
+        Returns:
+            The kind of the column if it is one of the skipped kinds,
+            None if the column may hold text to analyze
+        """
+        values = values.infer_objects()
+        if pd.api.types.is_bool_dtype(values):
+            kind = FieldKind.BOOLEAN
+        elif pd.api.types.is_datetime64_any_dtype(values):
+            kind = FieldKind.TIMESTAMP
+        elif pd.api.types.is_numeric_dtype(values):
+            present = values.dropna()
+            identifiers = (present % 1 == 0) & (
+                present.abs() >= 10 ** (self.IDENTIFIER_MIN_DIGITS - 1)
+            )
+            kind = None if identifiers.any() else FieldKind.NUMERIC
+        else:
+            present = values.dropna()
+            try:
+                distinct_values = present.value_counts().index.tolist()
+            except TypeError:
+                # Unhashable values, e.g. nested lists or objects
+                return None
+            return self._classify_values(
+                distinct_values=distinct_values,
+                occurrences=len(present),
+                skipped_kinds=skipped_kinds,
+            )
+
+        return kind if kind in skipped_kinds else None
+
+    @override
+    def get_field_names(self, data: Any) -> list[str]:
+        return [str(column) for column in data.columns]
 
     @override
     def get_data_processor(self) -> DataProcessorBase:
@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class ColumnSampling:
+    """Settings of the sampled analysis of table columns.
+
+    Attributes:
+        sample_size: Maximum number of values analyzed per column
+        min_agreement: Minimum share of the sampled values agreeing on an
+            entity type for the column to be mapped to it
+        random_seed: Seed of the sampling (None for a random sample)
+        stratified: Sample the distinct values of a column, weighted by their
+            number of occurrences, instead of its rows
+    """
+
+    sample_size: int
+    min_agreement: float
+    random_seed: int | None
+    stratified: bool
+
+
+class ColumnSampler:
+    """Draws the values of a column whose analysis decides its entity type."""
+
+    @staticmethod
+    def sample(
+        values: pd.Series,
+        sampling: ColumnSampling,
+    ) -> tuple[list[str], list[int]]:
+        """Sample the non-missing values of a column.
+
+        A row sample lets frequent values dominate and analyzes repeated values
+        once per occurrence. A stratified sample draws among distinct values
+        instead, so that each of them is analyzed at most once, and weights
+        each drawn value by its number of occurrences so that votes still
+        reflect the share of rows holding it.
+
+        Args:
+            values: The values of the column
+            sampling: The sampling settings
+
+        Returns:
+            The sampled values as strings, and the weight of each one's vote
+        """
+        values = values.dropna().astype(str)
+
+        if sampling.stratified:
+            counts = values.value_counts()
+            if len(counts) > sampling.sample_size:
+                counts = counts.sample(
+                    n=sampling.sample_size,
+                    random_state=sampling.random_seed,
+                )
+            return counts.index.tolist(), counts.tolist()
+
+        if len(values) > sampling.sample_size:
+            values = values.sample(
+                n=sampling.sample_size,
+                random_state=sampling.random_seed,
+            )
+        return values.tolist(), [1] * len(values)
@@ -1,12 +1,21 @@
+import datetime as dt
+import re
+import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any, ClassVar
 
 from logger import LoggerContract
+from presidio_analyzer import AnalyzerEngine
 from presidio_structured import StructuredAnalysis
 from presidio_structured.data.data_processors import DataProcessorBase
 
+from src.data_deidentifier.domain.types.field_kind import FieldKind
 from src.data_deidentifier.domain.types.language import SupportedLanguage
 from src.data_deidentifier.domain.types.structured_data import StructuredData
 
+from .sampling import ColumnSampling
+
 
 class StructuredTypeAnalyzer(ABC):
     """Base abstract class for structured data analyzers.
@@ -14,15 +23,49 @@ class StructuredTypeAnalyzer(ABC):
     Defines the interface that all data type-specific analyzers must implement.
     It provides mechanisms to determine if analyzer can handle
     a particular data type and to perform PII entity analysis on that data.
+
+    It also provides a cheap pre-filter classifying fields by the type and
+    profile of their values, so that fields which cannot hold PII entities
+    detected in text (numbers, flags, identifiers, dates, codes) are left out
+    of the analysis.
+
+    Attributes:
+        IDENTIFIER_MIN_DIGITS: Digits from which an integer may be an
+            identifier detected by a recognizer (e.g. a phone number).
+        ENUM_MAX_DISTINCT: Maximum number of distinct values of an enum field.
+        ENUM_MIN_OCCURRENCES: Minimum average occurrences of each distinct
+            value of an enum field.
     """
 
-    def __init__(self, logger: LoggerContract) -> None:
+    IDENTIFIER_MIN_DIGITS: ClassVar[int] = 7
+    ENUM_MAX_DISTINCT: ClassVar[int] = 20
+    ENUM_MIN_OCCURRENCES: ClassVar[int] = 10
+
+    _UUID_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+        re.IGNORECASE,
+    )
+    # ISO 8601 dates, with an optional time and time zone
+    _TIMESTAMP_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"\d{4}-\d{2}-\d{2}"
+        r"(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?",
+    )
+    # Upper case codes (e.g. IN_PROGRESS, FR-75) or lower case compound codes
+    # (e.g. in_progress) holding a digit or an underscore, but not words such
+    # as names or cities (e.g. PARIS, JEAN-PIERRE)
+    _ENUM_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"(?=.*[\d_])(?:[A-Z0-9]+(?:[_\-][A-Z0-9]+)*|[a-z0-9]+(?:[_\-][a-z0-9]+)+)",
+    )
+
+    def __init__(self, logger: LoggerContract, analyzer_engine: AnalyzerEngine) -> None:
         """Initialize the structured type analyzer.
 
         Args:
             logger: Logger instance for logging events.
+            analyzer_engine: Shared analyzer engine used to detect entities.
         """
         self.logger = logger
+        self.analyzer_engine = analyzer_engine
 
     @abstractmethod
     def can_handle(self, data: StructuredData) -> bool:
@@ -41,15 +84,35 @@ class StructuredTypeAnalyzer(ABC):
         self,
         data: StructuredData,
         language: SupportedLanguage,
-    ) -> StructuredAnalysis:
+        sampling: ColumnSampling,
+        skipped_kinds: frozenset[FieldKind],
+        excluded_fields: frozenset[str],
+    ) -> tuple[StructuredAnalysis, dict[str, Any]]:
         """Analyze structured data to detect PII entities.
 
         Args:
             data: The structured data to analyze.
             language: Language code of the data content.
+            sampling: Settings of the sampled analysis of table columns.
+            skipped_kinds: Kinds of fields left out of the analysis.
+            excluded_fields: Fields whose entity type is already known, left
+                out of the analysis.
 
         Returns:
-            StructuredAnalysis object containing the analysis results.
+            StructuredAnalysis object containing the analysis results,
+            and details of how the analysis ran.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_field_names(self, data: StructuredData) -> list[str]:
+        """Get the names of the fields of the data, as used in entity mappings.
+
+        Args:
+            data: The structured data.
+
+        Returns:
+            The field names (key paths for nested data).
         """
         raise NotImplementedError
 
@@ -61,3 +124,86 @@ class StructuredTypeAnalyzer(ABC):
             DataProcessor instance for this analyzer's data type.
         """
         raise NotImplementedError
+
+    def _classify_values(
+        self,
+        distinct_values: Sequence[Any],
+        occurrences: int,
+        skipped_kinds: frozenset[FieldKind],
+    ) -> FieldKind | None:
+        """Classify a field by profiling its distinct non-missing values.
+
+        Args:
+            distinct_values: The distinct values of the field
+            occurrences: The number of non-missing values of the field
+            skipped_kinds: Kinds of fields to look for
+
+        Returns:
+            The kind of the field if it is one of the skipped kinds,
+            None if the field may hold text to analyze
+        """
+        if not distinct_values or not skipped_kinds:
+            return None
+
+        if all(isinstance(value, bool) for value in distinct_values):
+            kind = FieldKind.BOOLEAN
+        elif all(
+            isinstance(value, int | float) and not isinstance(value, bool)
+            for value in distinct_values
+        ):
+            kind = (
+                None
+                if any(self._may_be_identifier(value) for value in distinct_values)
+                else FieldKind.NUMERIC
+            )
+        elif all(isinstance(value, dt.date | dt.time) for value in distinct_values):
+            kind = FieldKind.TIMESTAMP
+        elif all(isinstance(value, uuid.UUID) for value in distinct_values):
+            kind = FieldKind.UUID
+        elif all(isinstance(value, str) for value in distinct_values):
+            kind = self._classify_strings(distinct_values, occurrences)
+        else:
+            kind = None
+
+        return kind if kind in skipped_kinds else None
+
+    def _classify_strings(
+        self,
+        distinct_values: Sequence[str],
+        occurrences: int,
+    ) -> FieldKind | None:
+        """Classify a field of strings by their character classes and cardinality.
+
+        Args:
+            distinct_values: The distinct values of the field
+            occurrences: The number of non-missing values of the field
+
+        Returns:
+            The kind of the field, None if it may hold text to analyze
+        """
+        if all(self._UUID_PATTERN.fullmatch(value) for value in distinct_values):
+            return FieldKind.UUID
+
+        if all(self._TIMESTAMP_PATTERN.fullmatch(value) for value in distinct_values):
+            return FieldKind.TIMESTAMP
+
+        if (
+            len(distinct_values) <= self.ENUM_MAX_DISTINCT
+            and occurrences >= self.ENUM_MIN_OCCURRENCES * len(distinct_values)
+            and all(self._ENUM_PATTERN.fullmatch(value) for value in distinct_values)
+        ):
+            return FieldKind.ENUM
+
+        return None
+
+    def _may_be_identifier(self, value: float) -> bool:
+        """Check whether a number may be an identifier detected by a recognizer.
+
+        Args:
+            value: The number
+
+        Returns:
+            True for integral numbers with enough digits, e.g. phone numbers
+        """
+        is_integral = isinstance(value, int) or value.is_integer()
+        return is_integral and abs(value) >= 10 ** (self.IDENTIFIER_MIN_DIGITS - 1)
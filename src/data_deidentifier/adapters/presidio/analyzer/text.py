@@ -1,33 +1,80 @@
+import copy
+import hashlib
+from typing import Any, ClassVar
+
 from logger import LoggerContract
-from presidio_analyzer import RecognizerResult
+from presidio_analyzer import (
+    AnalyzerEngine,
+    BatchAnalyzerEngine,
+    EntityRecognizer,
+    PatternRecognizer,
+    RecognizerResult,
+)
+from presidio_analyzer.nlp_engine import NlpArtifacts
+from presidio_analyzer.predefined_recognizers import PhoneRecognizer
 
+from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
+from src.data_deidentifier.adapters.presidio.analyzer.segmenter import TextSegmenter
 from src.data_deidentifier.adapters.presidio.engines import PresidioEngineFactory
 from src.data_deidentifier.adapters.presidio.exceptions import TextAnalysisError
 from src.data_deidentifier.domain.types.language import SupportedLanguage
 
 
 class PresidioTextAnalyzer:
-    """Uses the Presidio Analyzer to detect PII entities in text."""
+    """Uses the Presidio Analyzer to detect PII entities in text.
+
+    When every requested entity type is detected by recognizers that do not
+    rely on the NLP pipeline, those recognizers run directly on the text and
+    the spaCy pass is skipped (pattern path), only tokenizing the text for the
+    context enhancement of the scores.
+    """
 
-    def __init__(self, logger: LoggerContract) -> None:
+    # Recognizers that detect entities without the NLP artifacts
+    PATTERN_RECOGNIZERS: ClassVar[tuple[type[EntityRecognizer], ...]] = (
+        PatternRecognizer,
+        PhoneRecognizer,
+    )
+
+    def __init__(self, config: ConfigContract, logger: LoggerContract) -> None:
         """Initialize the Presidio text analyzer.
 
         Args:
+            config: Configuration contract
             logger: Logger for logging events
         """
+        self.config = config
         self.logger = logger
 
         self.presidio_analyzer = PresidioEngineFactory.get_analyzer_engine()
 
         self.logger.debug("Presidio Analyzer initialized successfully")
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the shared analyzer engine for pickling into pool processes.
+
+        Returns:
+            The instance state without the engine
+        """
+        state = self.__dict__.copy()
+        del state["presidio_analyzer"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the instance state and re-acquire the process-wide analyzer engine.
+
+        Args:
+            state: The instance state produced by `__getstate__`
+        """
+        self.__dict__.update(state)
+        self.presidio_analyzer = PresidioEngineFactory.get_analyzer_engine()
+
     def analyze(
         self,
         text: str,
         language: SupportedLanguage,
         min_score: float,
         entity_types: list[str] | None = None,
-    ) -> list[RecognizerResult]:
+    ) -> tuple[list[RecognizerResult], dict[str, Any]]:
         """Analyze text to detect PII entities.
 
         Args:
@@ -37,7 +84,10 @@ class PresidioTextAnalyzer:
             entity_types: Types of entities to detect (None means all supported types)
 
         Returns:
-            List of detected entities
+            A tuple containing:
+                - List of detected entities
+                - Details of how the analysis ran: its path (`pattern` when
+                  the NLP pipeline was skipped, `nlp` otherwise) and cache hits
 
         Raises:
             TextAnalysisError: If analysis fails
@@ -52,22 +102,498 @@ class PresidioTextAnalyzer:
         }
         self.logger.debug("Starting text analysis", logger_context)
 
-        try:
-            # Analyze text
-            presidio_results = self.presidio_analyzer.analyze(
+        analysis_details: dict[str, Any] = {
+            "path": "pattern"
+            if self._is_pattern_only(language=language, entity_types=entity_types)
+            else "nlp",
+        }
+
+        if self.config.is_analysis_cache_enabled():
+            presidio_results, cache_details = self._analyze_with_cache(
                 text=text,
                 language=language,
+                min_score=min_score,
+                entity_types=entity_types,
+            )
+            analysis_details.update(cache_details)
+        else:
+            [presidio_results] = self._analyze_texts(
+                texts=[text],
+                language=language,
+                min_score=min_score,
+                entity_types=entity_types,
+            )
+
+        self.logger.info(
+            "Analysis completed successfully",
+            {
+                "entities_found": len(presidio_results),
+                **analysis_details,
+                **logger_context,
+            },
+        )
+
+        return presidio_results, analysis_details
+
+    def analyze_batch(
+        self,
+        texts: list[str],
+        language: SupportedLanguage,
+        min_score: float,
+        entity_types: list[str] | None = None,
+    ) -> list[list[RecognizerResult]]:
+        """Analyze several texts in a single batched NLP pass.
+
+        The texts go through the NLP pipeline together (spaCy `nlp.pipe`),
+        which amortizes the per-call overhead over the whole batch.
+
+        Args:
+            texts: Texts to analyze
+            language: Language code of the texts
+            min_score: Minimum confidence score threshold
+            entity_types: Types of entities to detect (None means all supported types)
+
+        Returns:
+            One list of detected entities per text, in the input order
+
+        Raises:
+            TextAnalysisError: If analysis fails
+        """
+        language = language.lower()
+
+        logger_context = {
+            "texts_count": len(texts),
+            "language": language,
+            "min_score": min_score,
+            "entity_types": entity_types,
+            "batch_size": self.config.get_analysis_batch_size(),
+            "n_process": self.config.get_analysis_n_process(),
+        }
+        self.logger.debug("Starting batch text analysis", logger_context)
+
+        batch_analyzer = self._get_batch_analyzer_engine(entity_types=entity_types)
+
+        try:
+            if self._is_pattern_only(language=language, entity_types=entity_types):
+                presidio_results = [
+                    self._analyze_with_patterns(
+                        text=text,
+                        language=language,
+                        min_score=min_score,
+                        entity_types=entity_types,
+                    )
+                    for text in texts
+                ]
+            else:
+                presidio_results = batch_analyzer.analyze_iterator(
+                    texts=texts,
+                    language=language,
+                    batch_size=self.config.get_analysis_batch_size(),
+                    n_process=self.config.get_analysis_n_process(),
+                    score_threshold=min_score,
+                    entities=entity_types,
+                )
+        except Exception as e:
+            msg = "Unexpected error during batch entity recognition"
+            self.logger.exception(msg, e, logger_context)
+            raise TextAnalysisError(msg) from e
+
+        self.logger.info(
+            "Batch analysis completed successfully",
+            {
+                "entities_found": sum(len(results) for results in presidio_results),
+                **logger_context,
+            },
+        )
+
+        return presidio_results
+
+    def _analyze_with_cache(
+        self,
+        text: str,
+        language: str,
+        min_score: float,
+        entity_types: list[str] | None,
+    ) -> tuple[list[RecognizerResult], dict[str, Any]]:
+        """Analyze text, reusing the cached results of its segments.
+
+        The text is split according to the configured segmentation (or kept
+        whole), only the segments missing from the cache are analyzed, and the
+        results of every segment are shifted back to their position in the text.
+
+        Args:
+            text: Text to analyze
+            language: Language code of the text
+            min_score: Minimum confidence score threshold
+            entity_types: Types of entities to detect (None means all supported types)
+
+        Returns:
+            A tuple containing:
+                - List of detected entities, positioned in the text
+                - Segments count and cache hit rate of the analysis
+
+        Raises:
+            TextAnalysisError: If analysis fails
+        """
+        analysis_cache = PresidioEngineFactory.get_analysis_cache(config=self.config)
+        segmentation = self.config.get_analysis_cache_segmentation()
+
+        segments = TextSegmenter.split(text=text, mode=segmentation)
+        cache_keys = [
+            self._get_cache_key(
+                text=text[start:end],
+                language=language,
+                min_score=min_score,
+                entity_types=entity_types,
+            )
+            for start, end in segments
+        ]
+
+        # Look each distinct segment up, collecting the ones to analyze
+        segment_results: dict[str, list[RecognizerResult]] = {}
+        missing_segments: dict[str, str] = {}
+        for cache_key, (start, end) in zip(cache_keys, segments, strict=True):
+            if cache_key in segment_results or cache_key in missing_segments:
+                continue
+            cached_results = analysis_cache.get(cache_key)
+            if cached_results is None:
+                missing_segments[cache_key] = text[start:end]
+            else:
+                segment_results[cache_key] = cached_results
+
+        if missing_segments:
+            analyzed_results = self._analyze_texts(
+                texts=list(missing_segments.values()),
+                language=language,
+                min_score=min_score,
+                entity_types=entity_types,
+            )
+            for cache_key, results in zip(
+                missing_segments,
+                analyzed_results,
+                strict=True,
+            ):
+                analysis_cache.set(cache_key, results)
+                segment_results[cache_key] = results
+
+        # Copies shifted to the text coordinates: cached results are never
+        # handed out, as the anonymizer may adjust the spans it is given
+        presidio_results = []
+        for cache_key, (start, _) in zip(cache_keys, segments, strict=True):
+            for result in segment_results[cache_key]:
+                shifted_result = copy.copy(result)
+                shifted_result.start += start
+                shifted_result.end += start
+                presidio_results.append(shifted_result)
+
+        cached_segments = sum(key not in missing_segments for key in cache_keys)
+
+        return presidio_results, {
+            "segmentation": segmentation.value,
+            "segments": len(segments),
+            "cached_segments": cached_segments,
+            "cache_hit_rate": cached_segments / len(segments) if segments else None,
+        }
+
+    def _analyze_texts(
+        self,
+        texts: list[str],
+        language: str,
+        min_score: float,
+        entity_types: list[str] | None,
+    ) -> list[list[RecognizerResult]]:
+        """Run the analyzer engine over texts, batching them when there are several.
+
+        Texts only searched for pattern-based entities skip the NLP pipeline,
+        and a single text longer than the configured chunk size is analyzed in
+        chunks.
+
+        Args:
+            texts: Texts to analyze
+            language: Language code of the texts
+            min_score: Minimum confidence score threshold
+            entity_types: Types of entities to detect (None means all supported types)
+
+        Returns:
+            One list of detected entities per text, in the input order
+
+        Raises:
+            TextAnalysisError: If analysis fails
+        """
+        chunk_size = self.config.get_analysis_chunk_size()
+
+        try:
+            if self._is_pattern_only(language=language, entity_types=entity_types):
+                return [
+                    self._analyze_with_patterns(
+                        text=text,
+                        language=language,
+                        min_score=min_score,
+                        entity_types=entity_types,
+                    )
+                    for text in texts
+                ]
+
+            if (
+                len(texts) == 1
+                and chunk_size is not None
+                and len(texts[0]) > chunk_size
+            ):
+                return [
+                    self._analyze_in_chunks(
+                        text=texts[0],
+                        language=language,
+                        min_score=min_score,
+                        entity_types=entity_types,
+                        chunk_size=chunk_size,
+                    ),
+                ]
+
+            if len(texts) == 1:
+                return [
+                    self._get_analyzer_engine(entity_types=entity_types).analyze(
+                        text=texts[0],
+                        language=language,
+                        score_threshold=min_score,
+                        entities=entity_types,
+                    ),
+                ]
+
+            batch_analyzer = self._get_batch_analyzer_engine(entity_types=entity_types)
+            return batch_analyzer.analyze_iterator(
+                texts=texts,
+                language=language,
+                batch_size=self.config.get_analysis_batch_size(),
                 score_threshold=min_score,
                 entities=entity_types,
             )
         except Exception as e:
             msg = "Unexpected error during entity recognition"
-            self.logger.exception(msg, e, logger_context)
+            self.logger.exception(
+                msg,
+                e,
+                {"texts_count": len(texts), "language": language},
+            )
             raise TextAnalysisError(msg) from e
 
-        self.logger.info(
-            "Analysis completed successfully",
-            {"entities_found": len(presidio_results), **logger_context},
+    def _get_analyzer_engine(self, entity_types: list[str] | None) -> AnalyzerEngine:
+        """Get the analyzer engine holding only the recognizers of some entity types.
+
+        Args:
+            entity_types: Types of entities to detect (None means all supported types)
+
+        Returns:
+            The trimmed analyzer engine, or the shared one if no variant applies
+        """
+        return PresidioEngineFactory.get_trimmed_analyzer_engine(
+            entity_types=entity_types,
+            max_variants=self.config.get_analysis_engine_variants_max_count(),
         )
 
+    def _get_batch_analyzer_engine(
+        self,
+        entity_types: list[str] | None,
+    ) -> BatchAnalyzerEngine:
+        """Get a batch analyzer wrapping the engine of some entity types.
+
+        Args:
+            entity_types: Types of entities to detect (None means all supported types)
+
+        Returns:
+            A batch analyzer engine around the trimmed analyzer engine
+        """
+        return BatchAnalyzerEngine(
+            analyzer_engine=self._get_analyzer_engine(entity_types=entity_types),
+        )
+
+    def _is_pattern_only(
+        self,
+        language: str,
+        entity_types: list[str] | None,
+    ) -> bool:
+        """Check whether the requested entity types can skip the NLP pipeline.
+
+        Args:
+            language: Language code of the text
+            entity_types: Types of entities to detect (None means all supported types)
+
+        Returns:
+            True if every recognizer of the requested types is pattern-based
+        """
+        if not entity_types:
+            return False
+
+        analyzer_engine = self._get_analyzer_engine(entity_types=entity_types)
+        try:
+            recognizers = analyzer_engine.registry.get_recognizers(
+                language=language,
+                entities=entity_types,
+            )
+        except ValueError:
+            return False
+
+        return bool(recognizers) and all(
+            isinstance(recognizer, self.PATTERN_RECOGNIZERS)
+            for recognizer in recognizers
+        )
+
+    def _analyze_with_patterns(
+        self,
+        text: str,
+        language: str,
+        min_score: float,
+        entity_types: list[str],
+    ) -> list[RecognizerResult]:
+        """Run the pattern-based recognizers directly, without the NLP pipeline.
+
+        Mirrors `AnalyzerEngine.analyze`, context enhancement included, minus
+        the NLP pass: the text is only tokenized, and the lowercased tokens
+        stand in for the lemmas around each entity. Context words are matched
+        as substrings of the surrounding words, so a word matching its lemma
+        also matches its inflected form, and scores raised by context words
+        (e.g. "phone" before a number) are the same as on the NLP path.
+
+        Args:
+            text: Text to analyze
+            language: Language code of the text
+            min_score: Minimum confidence score threshold
+            entity_types: Types of entities to detect
+
+        Returns:
+            List of detected entities
+        """
+        analyzer_engine = self._get_analyzer_engine(entity_types=entity_types)
+        recognizers = analyzer_engine.registry.get_recognizers(
+            language=language,
+            entities=entity_types,
+        )
+
+        nlp_engine = analyzer_engine.nlp_engine
+        tokens = nlp_engine.get_nlp(language).make_doc(text)
+        nlp_artifacts = NlpArtifacts(
+            entities=[],
+            tokens=tokens,
+            tokens_indices=[token.idx for token in tokens],
+            lemmas=[token.lower_ for token in tokens],
+            nlp_engine=nlp_engine,
+            language=language,
+        )
+
+        results = []
+        for recognizer in recognizers:
+            recognizer_results = recognizer.analyze(
+                text=text,
+                entities=entity_types,
+                nlp_artifacts=nlp_artifacts,
+            )
+            if recognizer_results:
+                results.extend(
+                    recognizer.enhance_using_context(
+                        text=text,
+                        raw_recognizer_results=recognizer_results,
+                        other_raw_recognizer_results=[],
+                        nlp_artifacts=nlp_artifacts,
+                    ),
+                )
+
+        results = analyzer_engine.context_aware_enhancer.enhance_using_context(
+            text=text,
+            raw_results=results,
+            nlp_artifacts=nlp_artifacts,
+            recognizers=recognizers,
+        )
+        results = EntityRecognizer.remove_duplicates(results)
+
+        return [result for result in results if result.score >= min_score]
+
+    def _analyze_in_chunks(
+        self,
+        text: str,
+        language: str,
+        min_score: float,
+        entity_types: list[str] | None,
+        chunk_size: int,
+    ) -> list[RecognizerResult]:
+        """Analyze a long text as overlapping chunks, in a single batched pass.
+
+        The chunks go through the batch engine, spread over `analysis_n_process`
+        NLP processes. The overlap gives every entity close to a seam its
+        context in at least one chunk: each chunk only keeps the entities
+        starting in its own region, which extends to the middle of its overlaps
+        with the neighbouring chunks, so that entities are reported once.
+
+        Args:
+            text: Text to analyze
+            language: Language code of the text
+            min_score: Minimum confidence score threshold
+            entity_types: Types of entities to detect (None means all supported types)
+            chunk_size: Maximum length of a chunk in characters
+
+        Returns:
+            List of detected entities, positioned in the text
+        """
+        chunks = TextSegmenter.split_into_chunks(
+            text=text,
+            chunk_size=chunk_size,
+            overlap=self.config.get_analysis_chunk_overlap(),
+        )
+        self.logger.debug(
+            "Analyzing text in chunks",
+            {"text_length": len(text), "chunks_count": len(chunks)},
+        )
+
+        batch_analyzer = self._get_batch_analyzer_engine(entity_types=entity_types)
+        chunks_results = batch_analyzer.analyze_iterator(
+            texts=[text[start:end] for start, end in chunks],
+            language=language,
+            batch_size=self.config.get_analysis_batch_size(),
+            n_process=self.config.get_analysis_n_process(),
+            score_threshold=min_score,
+            entities=entity_types,
+        )
+
+        presidio_results = []
+        for index, ((start, end), chunk_results) in enumerate(
+            zip(chunks, chunks_results, strict=True),
+        ):
+            region_start = (start + chunks[index - 1][1]) // 2 if index > 0 else 0
+            region_end = (
+                (chunks[index + 1][0] + end) // 2
+                if index < len(chunks) - 1
+                else len(text)
+            )
+            for result in chunk_results:
+                result.start += start
+                result.end += start
+                if region_start <= result.start < region_end:
+                    presidio_results.append(result)
+
         return presidio_results
+
+    @staticmethod
+    def _get_cache_key(
+        text: str,
+        language: str,
+        min_score: float,
+        entity_types: list[str] | None,
+    ) -> str:
+        """Build the cache key identifying an analysis.
+
+        The text is hashed so that the cache does not keep the texts themselves.
+
+        Args:
+            text: Text to analyze
+            language: Language code of the text
+            min_score: Minimum confidence score threshold
+            entity_types: Types of entities to detect (None means all supported types)
+
+        Returns:
+            The cache key of the analysis
+        """
+        text_hash = hashlib.sha256(text.encode()).hexdigest()
+        entities = (
+            ",".join(sorted({entity.upper() for entity in entity_types}))
+            if entity_types
+            else "*"
+        )
+        return f"{text_hash}:{language}:{min_score}:{entities}"
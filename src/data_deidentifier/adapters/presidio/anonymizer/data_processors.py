@@ -0,0 +1,157 @@
+from collections.abc import Callable
+from typing import Any, override
+
+import numpy as np
+import pandas as pd
+from presidio_structured.data.data_processors import (
+    DataProcessorBase,
+    JsonDataProcessor,
+    PandasDataProcessor,
+)
+
+# Inferred dtypes of object columns whose equal values all share a type
+_SINGLE_TYPE_DTYPES = frozenset({"string", "bytes", "date", "datetime", "time"})
+
+
+class MemoizedOperator:
+    """Operator callable computing its result once per distinct value.
+
+    Values are told apart by type as well as by value, so that e.g. `1` and
+    `True`, which are equal in Python, are still operated on separately.
+    Unhashable values are operated on every time.
+    """
+
+    def __init__(self, operator_callable: Callable[[Any], Any]) -> None:
+        """Initialize the memoized operator.
+
+        Args:
+            operator_callable: The operator callable to memoize
+        """
+        self.operator_callable = operator_callable
+        self._results: dict[tuple[type, Any], Any] = {}
+
+    def __call__(self, value: Any) -> Any:  # noqa: ANN401
+        """Operate on a value, reusing the result computed for an equal one.
+
+        Args:
+            value: The value to operate on
+
+        Returns:
+            The operated value
+        """
+        key = (type(value), value)
+        try:
+            if key in self._results:
+                return self._results[key]
+        except TypeError:
+            return self.operator_callable(value)
+
+        result = self._results[key] = self.operator_callable(value)
+        return result
+
+
+class DeduplicatingPandasDataProcessor(PandasDataProcessor):
+    """Pandas data processor operating once per distinct value of each column.
+
+    Columns are factorized into the codes of their distinct values, the
+    operator runs on each distinct value in order of first appearance, and the
+    results are mapped back to the rows through the codes. The output is the
+    same as operating cell by cell, as long as the operator returns the same
+    result for equal values.
+    """
+
+    @override
+    def _process(
+        self,
+        data: pd.DataFrame,
+        key_to_operator_mapping: dict[str, Callable[[Any], Any]],
+    ) -> pd.DataFrame:
+        if not isinstance(data, pd.DataFrame):
+            raise TypeError("Data must be a pandas DataFrame")
+
+        for key, operator_callable in key_to_operator_mapping.items():
+            data[key] = self._operate_on_column(
+                values=data[key],
+                operator_callable=operator_callable,
+            )
+
+        return data
+
+    @staticmethod
+    def _operate_on_column(
+        values: pd.Series,
+        operator_callable: Callable[[Any], Any],
+    ) -> np.ndarray:
+        """Operate on each distinct value of a column.
+
+        Args:
+            values: The values of the column
+            operator_callable: The operator to apply
+
+        Returns:
+            The operated values, in the rows order
+        """
+        if values.dtype == object and (
+            pd.api.types.infer_dtype(values, skipna=True) not in _SINGLE_TYPE_DTYPES
+        ):
+            # Mixed types may hold equal values of different types (e.g. 1 and
+            # True), which factorizing would merge, or unhashable values
+            memoized_operator = MemoizedOperator(operator_callable)
+            results = [memoized_operator(value) for value in values]
+            return np.array(results, dtype=object)
+
+        codes, uniques = pd.factorize(values)
+
+        # The last slot, picked by the -1 code of missing values, is filled below
+        distinct_results = np.empty(len(uniques) + 1, dtype=object)
+        distinct_results[:-1] = [operator_callable(value) for value in uniques.tolist()]
+
+        results = distinct_results[codes]
+        for position in np.flatnonzero(codes == -1):
+            results[position] = operator_callable(values.iloc[position])
+
+        return results
+
+
+class DeduplicatingJsonDataProcessor(JsonDataProcessor):
+    """JSON data processor operating once per distinct value of each key path.
+
+    Values repeated under a key path, typically across the elements of an
+    array, are operated on once and the result is reused for the others.
+    """
+
+    @override
+    def _process(
+        self,
+        data: dict | list,
+        key_to_operator_mapping: dict[str, Callable[[Any], Any]],
+    ) -> dict | list:
+        # Nested calls on array elements receive the already memoized operators
+        memoized_mapping = {
+            key: (
+                operator_callable
+                if isinstance(operator_callable, MemoizedOperator)
+                else MemoizedOperator(operator_callable)
+            )
+            for key, operator_callable in key_to_operator_mapping.items()
+        }
+        return super()._process(data, memoized_mapping)
+
+
+_DEDUPLICATING_PROCESSORS: dict[type[DataProcessorBase], type[DataProcessorBase]] = {
+    PandasDataProcessor: DeduplicatingPandasDataProcessor,
+    JsonDataProcessor: DeduplicatingJsonDataProcessor,
+}
+
+
+def get_deduplicating_processor(processor: DataProcessorBase) -> DataProcessorBase:
+    """Get the processor operating once per distinct value on the same data type.
+
+    Args:
+        processor: The data processor of the analyzed data type
+
+    Returns:
+        Its deduplicating counterpart, or the processor itself if it has none
+    """
+    deduplicating_processor = _DEDUPLICATING_PROCESSORS.get(type(processor))
+    return deduplicating_processor() if deduplicating_processor else processor
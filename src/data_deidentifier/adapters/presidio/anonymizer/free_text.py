@@ -0,0 +1,111 @@
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from src.data_deidentifier.domain.types.structured_data import StructuredData
+from src.data_deidentifier.domain.types.tabular_data import TabularData
+
+
+class FreeTextFields:
+    """Locates and rewrites the free-text string values of structured data.
+
+    Fields are named as in entity mappings: column names for tables, and key
+    paths for JSON documents, the items of an array sharing the path of their
+    array.
+    """
+
+    @classmethod
+    def find(cls, data: StructuredData, min_length: int) -> frozenset[str]:
+        """Find the fields holding a string value of at least `min_length` characters.
+
+        Args:
+            data: The structured data
+            min_length: Minimum length of a free-text value
+
+        Returns:
+            The names of the free-text fields
+        """
+        fields: set[str] = set()
+
+        def collect(field_name: str, value: str) -> str:
+            if len(value) >= min_length:
+                fields.add(field_name)
+            return value
+
+        cls.map_strings(data=data, fields=None, function=collect)
+        return frozenset(fields)
+
+    @classmethod
+    def map_strings(
+        cls,
+        data: StructuredData,
+        fields: frozenset[str] | None,
+        function: Callable[[str, str], str],
+    ) -> StructuredData:
+        """Copy structured data, applying a function to the strings of some fields.
+
+        Args:
+            data: The structured data
+            fields: Names of the fields to apply the function to (None means all)
+            function: Called with the field name and the string value, returns
+                the value to put in the copy
+
+        Returns:
+            The copy of the data
+        """
+        if isinstance(data, TabularData):
+            return TabularData(
+                columns=data.columns,
+                rows=[
+                    [
+                        function(column, value)
+                        if isinstance(value, str)
+                        and (fields is None or column in fields)
+                        else value
+                        for column, value in zip(data.columns, row, strict=True)
+                    ]
+                    for row in data.rows
+                ],
+            )
+
+        return cls._map_value(value=data, path="", fields=fields, function=function)
+
+    @classmethod
+    def _map_value(
+        cls,
+        value: Any,  # noqa: ANN401
+        path: str,
+        fields: frozenset[str] | None,
+        function: Callable[[str, str], str],
+    ) -> Any:  # noqa: ANN401
+        """Copy a JSON value, applying a function to the strings of some fields.
+
+        Args:
+            value: The value to copy
+            path: Key path of the value in the document
+            fields: Names of the fields to apply the function to (None means all)
+            function: Called with the field name and the string value
+
+        Returns:
+            The copy of the value
+        """
+        if isinstance(value, Mapping):
+            return {
+                key: cls._map_value(
+                    value=item,
+                    path=f"{path}.{key}" if path else str(key),
+                    fields=fields,
+                    function=function,
+                )
+                for key, item in value.items()
+            }
+
+        if isinstance(value, list):
+            return [
+                cls._map_value(value=item, path=path, fields=fields, function=function)
+                for item in value
+            ]
+
+        if isinstance(value, str) and (fields is None or path in fields):
+            return function(path, value)
+
+        return value
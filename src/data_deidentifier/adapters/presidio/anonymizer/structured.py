@@ -1,24 +1,45 @@
-from typing import Any, override
+from collections import Counter
+from typing import Any, ClassVar, override
 
 from logger import LoggerContract
 from presidio_anonymizer.entities import OperatorConfig
 
+from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
 from src.data_deidentifier.adapters.presidio.analyzer.structured import (
     PresidioStructuredDataAnalyzer,
 )
+from src.data_deidentifier.adapters.presidio.anonymizer.data_processors import (
+    get_deduplicating_processor,
+)
+from src.data_deidentifier.adapters.presidio.anonymizer.free_text import (
+    FreeTextFields,
+)
+from src.data_deidentifier.adapters.presidio.anonymizer.text import (
+    PresidioTextAnonymizer,
+)
 from src.data_deidentifier.adapters.presidio.engines import PresidioEngineFactory
 from src.data_deidentifier.adapters.presidio.exceptions import (
     StructuredDataAnalysisError,
 )
 from src.data_deidentifier.adapters.presidio.mapper import PresidioStructuredDataMapper
+from src.data_deidentifier.adapters.presidio.pseudonymizer.custom_operator import (
+    PseudonymizeOperator,
+)
 from src.data_deidentifier.domain.contracts.anonymizer.structured import (
     StructuredDataAnonymizerContract,
 )
-from src.data_deidentifier.domain.exceptions import StructuredDataAnonymizationError
+from src.data_deidentifier.domain.exceptions import (
+    StructuredDataAnonymizationError,
+    TextAnonymizationError,
+)
 from src.data_deidentifier.domain.types.anonymization_operator import (
     AnonymizationOperator,
 )
+from src.data_deidentifier.domain.types.entity import Entity
 from src.data_deidentifier.domain.types.language import SupportedLanguage
+from src.data_deidentifier.domain.types.structured_analysis_options import (
+    StructuredAnalysisOptions,
+)
 from src.data_deidentifier.domain.types.structured_anonymization_result import (
     StructuredDataAnonymizationResult,
 )
@@ -26,17 +47,45 @@ from src.data_deidentifier.domain.types.structured_data import StructuredData
 
 
 class PresidioStructuredDataAnonymizer(StructuredDataAnonymizerContract):
-    """Implementation of the data anonymizer contract using Presidio-structured."""
+    """Implementation of the data anonymizer contract using Presidio-structured.
+
+    In free-text mode, fields holding long strings (e.g. comments) are not
+    mapped to a single entity type: their values are analyzed together in one
+    batched NLP pass, then anonymized span by span like texts.
+
+    Attributes:
+        NON_DETERMINISTIC_OPERATORS: Operators whose output differs between
+            calls on the same value (e.g. encryption with a random IV), which
+            are applied to every value instead of once per distinct value.
+        SALTED_OPERATORS: Operators drawing a random salt on every call unless
+            given one in their `salt` parameter.
+    """
 
-    def __init__(self, logger: LoggerContract) -> None:
+    NON_DETERMINISTIC_OPERATORS: ClassVar[frozenset[AnonymizationOperator]] = frozenset(
+        {AnonymizationOperator.ENCRYPT},
+    )
+    SALTED_OPERATORS: ClassVar[frozenset[AnonymizationOperator]] = frozenset(
+        {AnonymizationOperator.HASH},
+    )
+
+    def __init__(self, config: ConfigContract, logger: LoggerContract) -> None:
         """Initialize the Presidio-structured anonymizer.
 
         Args:
+            config: Configuration contract
             logger: Logger for logging events
         """
+        self.config = config
         self.logger = logger
 
-        self.analyzer = PresidioStructuredDataAnalyzer(logger=self.logger)
+        self.analyzer = PresidioStructuredDataAnalyzer(
+            config=self.config,
+            logger=self.logger,
+        )
+        self.text_anonymizer = PresidioTextAnonymizer(
+            config=self.config,
+            logger=self.logger,
+        )
 
         self.logger.debug("Presidio Structured Anonymizer initialized successfully")
 
@@ -48,13 +97,30 @@ class PresidioStructuredDataAnonymizer(StructuredDataAnonymizerContract):
         language: SupportedLanguage,
         entity_types: list[str] | None = None,
         operator_params: dict[str, Any] | None = None,
+        analysis_options: StructuredAnalysisOptions | None = None,
     ) -> StructuredDataAnonymizationResult:
+        analysis_options = analysis_options or StructuredAnalysisOptions()
+        free_text_fields = (
+            FreeTextFields.find(
+                data=data,
+                min_length=analysis_options.free_text_min_length
+                or self.config.get_structured_free_text_min_length(),
+            )
+            if analysis_options.free_text
+            else frozenset()
+        )
+
+        # Tables are processed by Presidio as DataFrames
+        presidio_data = PresidioStructuredDataMapper.domain_data_to_presidio(data=data)
+
         try:
             # Use the analyzer to process the data
-            analyzer_results, data_processor = self.analyzer.analyze(
-                data=data,
+            analyzer_results, data_processor, analysis_details = self.analyzer.analyze(
+                data=presidio_data,
                 language=language,
                 entity_types=entity_types,
+                analysis_options=analysis_options,
+                free_text_fields=free_text_fields,
             )
         except StructuredDataAnalysisError as e:
             raise StructuredDataAnonymizationError(
@@ -67,12 +133,26 @@ class PresidioStructuredDataAnonymizer(StructuredDataAnonymizerContract):
         )
 
         logger_context = {
-            "data_type": str(type(data)),
+            "data_type": str(type(presidio_data)),
             "fields_count": len(fields),
             "operator": operator.value,
         }
         self.logger.debug("Starting structured data anonymization", logger_context)
 
+        if operator == AnonymizationOperator.PSEUDONYMIZE and operator_params:
+            # Values of the mapped fields are enriched together, ahead
+            operator_params = PseudonymizeOperator.with_enrichments(
+                params=operator_params,
+                entities=self._get_mapped_entities(
+                    data=data,
+                    entity_mapping=analyzer_results.entity_mapping,
+                ),
+            )
+
+        # Operate once per distinct value, unless the operator output is random
+        if self._is_deterministic(operator=operator, operator_params=operator_params):
+            data_processor = get_deduplicating_processor(processor=data_processor)
+
         # Get the appropriate data processor for this data type
         engine = PresidioEngineFactory.get_structured_data_anonymizer_engine(
             processor=data_processor,
@@ -84,7 +164,7 @@ class PresidioStructuredDataAnonymizer(StructuredDataAnonymizerContract):
         operators = {
             field.entity_type: OperatorConfig(
                 operator_name=operator,
-                params={**operator_params, "entity_type": field.entity_type},
+                params={**(operator_params or {}), "entity_type": field.entity_type},
             )
             for field in fields
         }
@@ -92,7 +172,7 @@ class PresidioStructuredDataAnonymizer(StructuredDataAnonymizerContract):
         try:
             # Anonymize the structured data
             anonymized_data = engine.anonymize(
-                data=data,
+                data=presidio_data,
                 structured_analysis=analyzer_results,
                 operators=operators,
             )
@@ -101,12 +181,176 @@ class PresidioStructuredDataAnonymizer(StructuredDataAnonymizerContract):
             self.logger.exception(msg, e, logger_context)
             raise StructuredDataAnonymizationError(msg) from e
 
+        anonymized_domain_data = PresidioStructuredDataMapper.presidio_data_to_domain(
+            data=anonymized_data,
+        )
+
+        # Free-text fields mapped by hints or rules were anonymized as a whole
+        free_text_fields = free_text_fields.difference(
+            analyzer_results.entity_mapping,
+        )
+        if free_text_fields:
+            anonymized_domain_data, analysis_details["free_text"] = (
+                self._anonymize_free_text(
+                    data=anonymized_domain_data,
+                    fields=free_text_fields,
+                    operator=operator,
+                    language=language,
+                    entity_types=entity_types,
+                    operator_params=operator_params,
+                )
+            )
+
         self.logger.info(
             "Structured data anonymization completed successfully",
             logger_context,
         )
 
         return StructuredDataAnonymizationResult(
-            anonymized_data=anonymized_data,
+            anonymized_data=anonymized_domain_data,
             detected_fields=fields,
+            analysis_details=analysis_details,
         )
+
+    @classmethod
+    def _is_deterministic(
+        cls,
+        operator: AnonymizationOperator,
+        operator_params: dict[str, Any] | None,
+    ) -> bool:
+        """Check whether an operator gives the same output for the same value.
+
+        Args:
+            operator: Anonymization method
+            operator_params: Parameters of the operator
+
+        Returns:
+            False for random operators, and for salted operators without a
+            fixed salt, True otherwise
+        """
+        if operator in cls.NON_DETERMINISTIC_OPERATORS:
+            return False
+        if operator in cls.SALTED_OPERATORS:
+            return bool(operator_params and operator_params.get("salt"))
+        return True
+
+    @staticmethod
+    def _get_mapped_entities(
+        data: StructuredData,
+        entity_mapping: dict[str, str],
+    ) -> list[Entity]:
+        """Get the entities held by the string values of the mapped fields.
+
+        Args:
+            data: The structured data
+            entity_mapping: Entity type of each mapped field
+
+        Returns:
+            An entity per string value of the mapped fields
+        """
+        entities: list[Entity] = []
+
+        def collect(field_name: str, value: str) -> str:
+            entities.append(
+                Entity(
+                    type=entity_mapping[field_name],
+                    start=0,
+                    end=len(value),
+                    score=1.0,
+                    text=value,
+                ),
+            )
+            return value
+
+        FreeTextFields.map_strings(
+            data=data,
+            fields=frozenset(entity_mapping),
+            function=collect,
+        )
+        return entities
+
+    def _anonymize_free_text(  # noqa: PLR0913
+        self,
+        data: StructuredData,
+        fields: frozenset[str],
+        operator: AnonymizationOperator,
+        language: SupportedLanguage,
+        entity_types: list[str] | None,
+        operator_params: dict[str, Any] | None,
+    ) -> tuple[StructuredData, dict[str, Any]]:
+        """Anonymize the entities found in the string values of free-text fields.
+
+        The values go through the NLP pipeline together, once per distinct
+        value unless the operator output is random, and each value is
+        anonymized at the span level of its entities.
+
+        Args:
+            data: The structured data, anonymized field by field
+            fields: Names of the free-text fields
+            operator: Anonymization method
+            language: Language code of the data
+            entity_types: Types of entities to detect (None means all supported types)
+            operator_params: Optional parameters for the operator
+
+        Returns:
+            The data with its free-text values anonymized, and the details of
+            the free-text pass (fields, values analyzed, entities found by type)
+
+        Raises:
+            StructuredDataAnonymizationError: If the analysis or anonymization fails
+        """
+        values: list[str] = []
+
+        def collect(_: str, value: str) -> str:
+            values.append(value)
+            return value
+
+        FreeTextFields.map_strings(data=data, fields=fields, function=collect)
+
+        deduplicated = self._is_deterministic(
+            operator=operator,
+            operator_params=operator_params,
+        )
+        texts = list(dict.fromkeys(values)) if deduplicated else values
+
+        try:
+            results = self.text_anonymizer.anonymize_batch(
+                texts=texts,
+                operator=operator,
+                language=language,
+                min_score=self.config.get_default_minimum_score(),
+                entity_types=entity_types,
+                operator_params=operator_params,
+            )
+        except TextAnonymizationError as e:
+            raise StructuredDataAnonymizationError(
+                "Anonymization of free-text fields failed",
+            ) from e
+
+        # Values are walked in the same order as when they were collected
+        anonymized_texts = [result.anonymized_text for result in results]
+        if deduplicated:
+            lookup = dict(zip(texts, anonymized_texts, strict=True))
+            anonymized_data = FreeTextFields.map_strings(
+                data=data,
+                fields=fields,
+                function=lambda _, value: lookup[value],
+            )
+        else:
+            remaining = iter(anonymized_texts)
+            anonymized_data = FreeTextFields.map_strings(
+                data=data,
+                fields=fields,
+                function=lambda _, __: next(remaining),
+            )
+
+        entities = Counter(
+            entity.type for result in results for entity in result.detected_entities
+        )
+
+        return anonymized_data, {
+            "fields": sorted(fields),
+            "values": len(values),
+            "analyzed_values": len(texts),
+            "entities": dict(entities),
+        }
@@ -1,12 +1,17 @@
 from typing import Any, override
 
 from logger import LoggerContract
+from presidio_analyzer import RecognizerResult
 from presidio_anonymizer.entities import OperatorConfig
 
+from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
 from src.data_deidentifier.adapters.presidio.analyzer.text import PresidioTextAnalyzer
 from src.data_deidentifier.adapters.presidio.engines import PresidioEngineFactory
 from src.data_deidentifier.adapters.presidio.exceptions import TextAnalysisError
 from src.data_deidentifier.adapters.presidio.mapper import PresidioEntityMapper
+from src.data_deidentifier.adapters.presidio.pseudonymizer.custom_operator import (
+    PseudonymizeOperator,
+)
 from src.data_deidentifier.domain.contracts.anonymizer.text import (
     TextAnonymizerContract,
 )
@@ -23,19 +28,40 @@ from src.data_deidentifier.domain.types.text_anonymization_result import (
 class PresidioTextAnonymizer(TextAnonymizerContract):
     """Implementation of anonymizer contract using Microsoft Presidio."""
 
-    def __init__(self, logger: LoggerContract) -> None:
+    def __init__(self, config: ConfigContract, logger: LoggerContract) -> None:
         """Initialize the Presidio text anonymizer.
 
         Args:
+            config: Configuration contract
             logger: Logger for logging events
         """
+        self.config = config
         self.logger = logger
 
         self.presidio_anonymizer = PresidioEngineFactory.get_text_anonymizer_engine()
-        self.analyzer = PresidioTextAnalyzer(logger=self.logger)
+        self.analyzer = PresidioTextAnalyzer(config=self.config, logger=self.logger)
 
         self.logger.debug("Presidio Anonymizer initialized successfully")
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the shared anonymizer engine for pickling into pool processes.
+
+        Returns:
+            The instance state without the engine
+        """
+        state = self.__dict__.copy()
+        del state["presidio_anonymizer"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the instance state and re-acquire the process-wide anonymizer engine.
+
+        Args:
+            state: The instance state produced by `__getstate__`
+        """
+        self.__dict__.update(state)
+        self.presidio_anonymizer = PresidioEngineFactory.get_text_anonymizer_engine()
+
     @override
     def anonymize(
         self,
@@ -48,7 +74,7 @@ class PresidioTextAnonymizer(TextAnonymizerContract):
     ) -> TextAnonymizationResult:
         # Analyze to detect PII entities in text
         try:
-            analyzer_results = self.analyzer.analyze(
+            analyzer_results, analysis_details = self.analyzer.analyze(
                 text=text,
                 language=language,
                 min_score=min_score,
@@ -57,10 +83,115 @@ class PresidioTextAnonymizer(TextAnonymizerContract):
         except TextAnalysisError as e:
             raise TextAnonymizationError("Anonymization failed during analysis") from e
 
+        return self._anonymize_analyzed_text(
+            text=text,
+            analyzer_results=analyzer_results,
+            operator=operator,
+            operator_params=self._prepare_operator_params(
+                operator=operator,
+                operator_params=operator_params,
+                analyzed_texts=[(text, analyzer_results)],
+            ),
+            analysis_details=analysis_details,
+        )
+
+    @override
+    def anonymize_batch(
+        self,
+        texts: list[str],
+        operator: AnonymizationOperator,
+        language: SupportedLanguage,
+        min_score: float,
+        entity_types: list[str] | None = None,
+        operator_params: dict[str, Any] | None = None,
+    ) -> list[TextAnonymizationResult]:
+        # Analyze all texts in one batched pass
+        try:
+            batch_results = self.analyzer.analyze_batch(
+                texts=texts,
+                language=language,
+                min_score=min_score,
+                entity_types=entity_types,
+            )
+        except TextAnalysisError as e:
+            raise TextAnonymizationError("Anonymization failed during analysis") from e
+
+        # Entities of all the texts are enriched together
+        operator_params = self._prepare_operator_params(
+            operator=operator,
+            operator_params=operator_params,
+            analyzed_texts=list(zip(texts, batch_results, strict=True)),
+        )
+
+        return [
+            self._anonymize_analyzed_text(
+                text=text,
+                analyzer_results=analyzer_results,
+                operator=operator,
+                operator_params=operator_params,
+            )
+            for text, analyzer_results in zip(texts, batch_results, strict=True)
+        ]
+
+    def _prepare_operator_params(
+        self,
+        operator: AnonymizationOperator,
+        operator_params: dict[str, Any] | None,
+        analyzed_texts: list[tuple[str, list[RecognizerResult]]],
+    ) -> dict[str, Any] | None:
+        """Complete the operator parameters with what depends on the entities.
+
+        Pseudonymization gets the enrichments of the detected entities,
+        fetched concurrently ahead instead of one by one while operating.
+
+        Args:
+            operator: Anonymization method
+            operator_params: Optional parameters for the operator
+            analyzed_texts: The texts with the entities detected in them
+
+        Returns:
+            The operator parameters to anonymize the texts with
+        """
+        if operator != AnonymizationOperator.PSEUDONYMIZE or not operator_params:
+            return operator_params
+
+        return PseudonymizeOperator.with_enrichments(
+            params=operator_params,
+            entities=(
+                PresidioEntityMapper.presidio_result_to_domain(result=result, text=text)
+                for text, analyzer_results in analyzed_texts
+                for result in analyzer_results
+            ),
+        )
+
+    def _anonymize_analyzed_text(
+        self,
+        text: str,
+        analyzer_results: list[RecognizerResult],
+        operator: AnonymizationOperator,
+        operator_params: dict[str, Any] | None = None,
+        analysis_details: dict[str, Any] | None = None,
+    ) -> TextAnonymizationResult:
+        """Anonymize a text whose entities have already been detected.
+
+        Args:
+            text: Original text containing PII entities
+            analyzer_results: Entities detected in the text
+            operator: Anonymization method
+            operator_params: Optional parameters for the operator
+            analysis_details: Optional details of how the analysis ran
+
+        Returns:
+            An AnonymizationResult containing the anonymized text and metadata
+
+        Raises:
+            TextAnonymizationError: If anonymization fails
+        """
         if not text or not analyzer_results:
             return TextAnonymizationResult(
                 anonymized_text=text,
                 detected_entities=[],
+                analysis_details=analysis_details or {},
             )
 
         logger_context = {
@@ -101,4 +232,5 @@ class PresidioTextAnonymizer(TextAnonymizerContract):
         return TextAnonymizationResult(
             anonymized_text=presidio_results.text,
             detected_entities=entities,
+            analysis_details=analysis_details or {},
         )
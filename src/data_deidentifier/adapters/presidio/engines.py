@@ -1,13 +1,23 @@
+import sys
 import threading
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from logger import LoggerContract
-from presidio_analyzer import AnalyzerEngine
+from presidio_analyzer import (
+    AnalyzerEngine,
+    BatchAnalyzerEngine,
+    RecognizerRegistry,
+    RecognizerResult,
+)
+from presidio_analyzer.nlp_engine import NlpEngine, NlpEngineProvider
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.operators.operators_factory import ANONYMIZERS
 from presidio_structured import StructuredEngine
 from presidio_structured.data.data_processors import DataProcessorBase
 
+from src.data_deidentifier.adapters.infrastructure.cache.ttl_cache import TTLCache
+from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
+
 from .analyzer.structured_types.factory import (
     StructuredDataAnalyzerFactory,
 )
@@ -24,18 +34,42 @@ class PresidioEngineFactory:
 
     Attributes:
         _lock: Thread lock for safe singleton creation.
+        _config: Configuration of the NLP engine, set by `configure`.
         _text_analyzer_engine: Cached instance of the text analyzer engine.
+        _batch_analyzer_engine: Cached batch wrapper around the analyzer engine.
+        _trimmed_analyzer_engines: Cache of analyzer engines restricted to the
+         recognizers of an entity types set, keyed by that set.
         _text_anonymizer_engine: Cached instance of the text anonymizer engine.
         _structured_data_factory: Cached factory for structured data analyzers.
         _structured_data_engines: Cache of structured anonymizer engines
          keyed by processor name.
+        _analysis_cache: Cache of text analysis results, when enabled.
+        _structured_analysis_cache: Cache of structured data fields mappings
+         keyed by data structure, when enabled.
     """
 
     _lock: ClassVar[threading.Lock] = threading.Lock()
+    _config: ClassVar[ConfigContract | None] = None
     _analyzer_engine: ClassVar[AnalyzerEngine | None] = None
+    _batch_analyzer_engine: ClassVar[BatchAnalyzerEngine | None] = None
+    _trimmed_analyzer_engines: ClassVar[dict[frozenset[str], AnalyzerEngine]] = {}
     _text_anonymizer_engine: ClassVar[AnonymizerEngine | None] = None
     _structured_data_factory: ClassVar[StructuredDataAnalyzerFactory | None] = None
     _structured_data_engines: ClassVar[dict[str, StructuredEngine]] = {}
+    _analysis_cache: ClassVar[TTLCache[str, list[RecognizerResult]] | None] = None
+    _structured_analysis_cache: ClassVar[TTLCache[str, dict[str, str]] | None] = None
+
+    @classmethod
+    def configure(cls, config: ConfigContract) -> None:
+        """Set the configuration used to build the NLP engine.
+
+        Must be called before the first engine is built, i.e. when the
+        application starts; Presidio's default NLP engine is used otherwise.
+
+        Args:
+            config: Configuration providing the NLP models and components.
+        """
+        cls._config = config
 
     @classmethod
     def get_analyzer_engine(cls) -> AnalyzerEngine:
@@ -50,9 +84,118 @@ class PresidioEngineFactory:
         if cls._analyzer_engine is None:
             with cls._lock:
                 if cls._analyzer_engine is None:
-                    cls._analyzer_engine = AnalyzerEngine()
+                    if cls._config is None:
+                        cls._analyzer_engine = AnalyzerEngine()
+                    else:
+                        cls._analyzer_engine = AnalyzerEngine(
+                            nlp_engine=cls._create_nlp_engine(cls._config),
+                            supported_languages=list(cls._config.get_nlp_models()),
+                        )
         return cls._analyzer_engine
 
+    @staticmethod
+    def _create_nlp_engine(config: ConfigContract) -> NlpEngine:
+        """Build the spaCy NLP engine with the configured models and components.
+
+        Excluded components are removed from the pipelines, freeing their
+        memory. Disabled components stay loaded but are skipped when
+        processing texts.
+
+        Args:
+            config: Configuration providing the NLP models and components.
+
+        Returns:
+            NlpEngine: The loaded NLP engine.
+        """
+        nlp_engine = NlpEngineProvider(
+            nlp_configuration={
+                "nlp_engine_name": "spacy",
+                "models": [
+                    {"lang_code": language, "model_name": model_name}
+                    for language, model_name in config.get_nlp_models().items()
+                ],
+            },
+        ).create_engine()
+
+        for pipeline in nlp_engine.nlp.values():
+            for component in config.get_nlp_excluded_components():
+                if component in pipeline.component_names:
+                    pipeline.remove_pipe(component)
+            for component in config.get_nlp_disabled_components():
+                if component in pipeline.pipe_names:
+                    pipeline.disable_pipe(component)
+
+        return nlp_engine
+
+    @classmethod
+    def get_batch_analyzer_engine(cls) -> BatchAnalyzerEngine:
+        """Get a shared instance of the batch analyzer engine (thread-safe).
+
+        The batch engine wraps the shared analyzer engine and runs the NLP
+        pipeline over many texts at once (spaCy `nlp.pipe`).
+
+        Returns:
+            BatchAnalyzerEngine: The shared batch analyzer engine.
+        """
+        if cls._batch_analyzer_engine is None:
+            analyzer_engine = cls.get_analyzer_engine()
+            with cls._lock:
+                if cls._batch_analyzer_engine is None:
+                    cls._batch_analyzer_engine = BatchAnalyzerEngine(
+                        analyzer_engine=analyzer_engine,
+                    )
+        return cls._batch_analyzer_engine
+
+    @classmethod
+    def get_trimmed_analyzer_engine(
+        cls,
+        entity_types: list[str] | None,
+        max_variants: int,
+    ) -> AnalyzerEngine:
+        """Get an analyzer engine restricted to some entity types (thread-safe).
+
+        The variant only holds the recognizers supporting the requested entity
+        types, so that the others are never looked up nor run. It shares the
+        NLP engine and the recognizer instances of the shared analyzer engine,
+        which keeps variants cheap. At most `max_variants` variants are cached;
+        beyond that, or when no entity type is given, the shared analyzer
+        engine is returned.
+
+        Args:
+            entity_types: Entity types the engine must detect.
+            max_variants: Maximum number of variants kept in cache.
+
+        Returns:
+            AnalyzerEngine: The analyzer engine for these entity types.
+        """
+        analyzer_engine = cls.get_analyzer_engine()
+        if not entity_types:
+            return analyzer_engine
+
+        key = frozenset(entity.upper() for entity in entity_types)
+
+        if key not in cls._trimmed_analyzer_engines:
+            with cls._lock:
+                if key not in cls._trimmed_analyzer_engines:
+                    if len(cls._trimmed_analyzer_engines) >= max_variants:
+                        return analyzer_engine
+
+                    registry = RecognizerRegistry(
+                        recognizers=[
+                            recognizer
+                            for recognizer in analyzer_engine.registry.recognizers
+                            if key.intersection(recognizer.supported_entities)
+                        ],
+                        supported_languages=analyzer_engine.supported_languages,
+                    )
+                    cls._trimmed_analyzer_engines[key] = AnalyzerEngine(
+                        registry=registry,
+                        nlp_engine=analyzer_engine.nlp_engine,
+                        supported_languages=analyzer_engine.supported_languages,
+                    )
+
+        return cls._trimmed_analyzer_engines[key]
+
     @classmethod
     def get_text_anonymizer_engine(cls) -> AnonymizerEngine:
         """Get a shared instance of the text anonymizer engine (thread-safe).
@@ -87,9 +230,13 @@ class PresidioEngineFactory:
             StructuredDataAnalyzerFactory: The shared factory for data analyzers.
         """
         if cls._structured_data_factory is None:
+            analyzer_engine = cls.get_analyzer_engine()
             with cls._lock:
                 if cls._structured_data_factory is None:
-                    cls._structured_data_factory = StructuredDataAnalyzerFactory(logger)
+                    cls._structured_data_factory = StructuredDataAnalyzerFactory(
+                        logger=logger,
+                        analyzer_engine=analyzer_engine,
+                    )
         return cls._structured_data_factory
 
     @classmethod
@@ -127,3 +274,79 @@ class PresidioEngineFactory:
                     )
 
         return cls._structured_data_engines[key]
+
+    @classmethod
+    def get_analysis_cache(
+        cls,
+        config: ConfigContract,
+    ) -> TTLCache[str, list[RecognizerResult]]:
+        """Get the shared cache of text analysis results (thread-safe).
+
+        Args:
+            config: Configuration providing the bounds of the cache.
+
+        Returns:
+            TTLCache: The shared analysis results cache.
+        """
+        if cls._analysis_cache is None:
+            with cls._lock:
+                if cls._analysis_cache is None:
+                    cls._analysis_cache = TTLCache(
+                        max_entries=config.get_analysis_cache_max_entries(),
+                        max_bytes=config.get_analysis_cache_max_bytes(),
+                        ttl_seconds=config.get_analysis_cache_ttl_seconds(),
+                        sizeof=_estimate_results_size,
+                    )
+        return cls._analysis_cache
+
+    @classmethod
+    def get_structured_analysis_cache(
+        cls,
+        config: ConfigContract,
+    ) -> TTLCache[str, dict[str, str]]:
+        """Get the shared cache of structured data fields mappings (thread-safe).
+
+        Args:
+            config: Configuration providing the bounds of the cache.
+
+        Returns:
+            TTLCache: The shared fields mappings cache.
+        """
+        if cls._structured_analysis_cache is None:
+            with cls._lock:
+                if cls._structured_analysis_cache is None:
+                    cls._structured_analysis_cache = TTLCache(
+                        max_entries=config.get_structured_analysis_cache_max_entries(),
+                        ttl_seconds=config.get_structured_analysis_cache_ttl_seconds(),
+                    )
+        return cls._structured_analysis_cache
+
+    @classmethod
+    def get_caches_metrics(cls) -> dict[str, dict[str, Any]]:
+        """Get the usage and counters of the caches created so far.
+
+        Returns:
+            The metrics of each created cache, keyed by cache name.
+        """
+        metrics = {}
+        if cls._analysis_cache is not None:
+            metrics["analysis"] = cls._analysis_cache.get_metrics()
+        if cls._structured_analysis_cache is not None:
+            metrics["structured_analysis"] = (
+                cls._structured_analysis_cache.get_metrics()
+            )
+        return metrics
+
+
+def _estimate_results_size(results: list[RecognizerResult]) -> int:
+    """Estimate the memory used by a list of recognizer results.
+
+    Args:
+        results: The recognizer results
+
+    Returns:
+        The approximate size in bytes of the list and its results
+    """
+    return sys.getsizeof(results) + sum(
+        sys.getsizeof(result) + sys.getsizeof(result.__dict__) for result in results
+    )
@@ -1,3 +1,7 @@
+from collections.abc import Mapping
+from typing import Any
+
+import pandas as pd
 from presidio_analyzer import RecognizerResult
 from presidio_structured import StructuredAnalysis as PresidioStructuredAnalysis
 
@@ -5,6 +9,8 @@ from src.data_deidentifier.domain.types.entity import Entity
 from src.data_deidentifier.domain.types.structured_anonymization_result import (
     StructuredDataAnalysisField,
 )
+from src.data_deidentifier.domain.types.structured_data import StructuredData
+from src.data_deidentifier.domain.types.tabular_data import TabularData
 
 
 class PresidioEntityMapper:
@@ -59,3 +65,45 @@ class PresidioStructuredDataMapper:
             )
             for field_name, entity_type in analysis.entity_mapping.items()
         ]
+
+    @staticmethod
+    def domain_data_to_presidio(
+        data: StructuredData,
+    ) -> Mapping[str, Any] | pd.DataFrame:
+        """Convert domain structured data to the format processed by Presidio.
+
+        Tables keep their values as received, in object columns: inferring
+        dtypes would turn integers into floats in columns with missing values,
+        and large identifiers into rounded floats, in the columns not operated.
+
+        Args:
+            data: The domain structured data
+
+        Returns:
+            A DataFrame for tabular data, the JSON document otherwise
+        """
+        if isinstance(data, TabularData):
+            return pd.DataFrame(data.rows, columns=data.columns, dtype=object)
+        return data
+
+    @staticmethod
+    def presidio_data_to_domain(
+        data: Mapping[str, Any] | pd.DataFrame,
+    ) -> StructuredData:
+        """Convert structured data processed by Presidio back to domain data.
+
+        Args:
+            data: A DataFrame or a JSON document
+
+        Returns:
+            Tabular data for a DataFrame, the JSON document otherwise
+        """
+        if not isinstance(data, pd.DataFrame):
+            return data
+
+        # Missing values become None, and numpy scalars Python ones, for JSON
+        values = data.astype(object).where(data.notna(), None)
+        return TabularData(
+            columns=[str(column) for column in data.columns],
+            rows=values.to_numpy().tolist(),
+        )
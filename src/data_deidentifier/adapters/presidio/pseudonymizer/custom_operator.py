@@ -1,7 +1,11 @@
-from typing import TYPE_CHECKING, override
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, override
 
 from presidio_anonymizer.operators import Operator, OperatorType
 
+from src.data_deidentifier.adapters.infrastructure.enrichment.prefetch import (
+    EnrichmentPrefetcher,
+)
 from src.data_deidentifier.domain.exceptions import PseudonymEnrichmentError
 from src.data_deidentifier.domain.types.anonymization_operator import (
     AnonymizationOperator,
@@ -31,6 +35,10 @@ class PseudonymizeOperator(Operator):
     Attributes:
         PARAM_METHOD: Parameter key for the pseudonymization method.
         PARAM_ENRICHER: Parameter key for the optional pseudonym enricher.
+        PARAM_CONFIG: Parameter key for the configuration.
+        PARAM_ENRICHMENTS: Parameter key for the enrichments fetched ahead of
+            the pseudonymization, by entity type and text (see
+            `with_enrichments`).
 
     Examples:
         Input text: "John lives in London"
@@ -40,6 +48,49 @@ class PseudonymizeOperator(Operator):
     PARAM_METHOD: str = "method"
     PARAM_ENRICHER: str = "enricher"
     PARAM_CONFIG: str = "config"
+    PARAM_ENRICHMENTS: str = "enrichments"
+
+    @classmethod
+    def with_enrichments(
+        cls,
+        params: dict[str, Any],
+        entities: Iterable[Entity],
+    ) -> dict[str, Any]:
+        """Add the enrichments of the detected entities to the operator parameters.
+
+        The distinct entities are enriched concurrently, so that a request
+        waits about one enrichment round-trip rather than one per entity, and
+        no longer than the enrichment deadline.
+        Enrichments already in the parameters are kept and not fetched again.
+
+        Args:
+            params: The operator parameters
+            entities: The entities to be pseudonymized
+
+        Returns:
+            The parameters with the enrichments, or unchanged if enrichment is
+            not configured
+        """
+        config: ConfigContract | None = params.get(cls.PARAM_CONFIG)
+        enricher: PseudonymEnrichmentManagerContract | None = params.get(
+            cls.PARAM_ENRICHER,
+        )
+        if not enricher or not config:
+            return params
+
+        enrichable_types = config.get_enrichment_configurations()
+        if not enrichable_types:
+            return params
+
+        enrichments = EnrichmentPrefetcher.prefetch(
+            entities=entities,
+            enrichment_manager=enricher,
+            enrichable_types=enrichable_types,
+            max_concurrency=config.get_enrichment_max_concurrency(),
+            deadline_seconds=config.get_enrichment_deadline_seconds(),
+            known=params.get(cls.PARAM_ENRICHMENTS),
+        )
+        return {**params, cls.PARAM_ENRICHMENTS: enrichments}
 
     @override
     def operate(self, text: str, params: dict | None = None) -> str:
@@ -108,6 +159,12 @@ class PseudonymizeOperator(Operator):
         if not enrichable_types or entity.type not in enrichable_types:
             return None
 
+        # Use the enrichment fetched ahead, if any
+        enrichments = params.get(self.PARAM_ENRICHMENTS) or {}
+        key = (entity.type, entity.text)
+        if key in enrichments:
+            return enrichments[key]
+
         try:
             # Get method for this entity type
             enrichment_method = enricher.get_enricher_for_entity(entity.type)
@@ -23,6 +23,9 @@ from src.data_deidentifier.domain.types.anonymization_operator import (
     AnonymizationOperator,
 )
 from src.data_deidentifier.domain.types.language import SupportedLanguage
+from src.data_deidentifier.domain.types.structured_analysis_options import (
+    StructuredAnalysisOptions,
+)
 from src.data_deidentifier.domain.types.structured_data import StructuredData
 from src.data_deidentifier.domain.types.structured_pseudonymization_result import (
     StructuredDataPseudonymizationResult,
@@ -44,7 +47,10 @@ class PresidioStructuredDataPseudonymizer(StructuredDataPseudonymizerContract):
         self.config = config
         self.logger = logger
 
-        self.anonymizer = PresidioStructuredDataAnonymizer(logger=self.logger)
+        self.anonymizer = PresidioStructuredDataAnonymizer(
+            config=self.config,
+            logger=self.logger,
+        )
 
         self.logger.debug("Presidio data Pseudonymizer initialized successfully")
 
@@ -56,6 +62,7 @@ class PresidioStructuredDataPseudonymizer(StructuredDataPseudonymizerContract):
         language: SupportedLanguage,
         entity_types: list[str] | None = None,
         pseudonym_enricher: PseudonymEnrichmentManagerContract | None = None,
+        analysis_options: StructuredAnalysisOptions | None = None,
     ) -> StructuredDataPseudonymizationResult:
         logger_context = {
             "method": type(method),
@@ -74,6 +81,7 @@ class PresidioStructuredDataPseudonymizer(StructuredDataPseudonymizerContract):
                     PseudonymizeOperator.PARAM_ENRICHER: pseudonym_enricher,
                     PseudonymizeOperator.PARAM_CONFIG: self.config,
                 },
+                analysis_options=analysis_options,
             )
         except StructuredDataAnonymizationError as e:
             raise StructuredDataPseudonymizationError(
@@ -86,4 +94,5 @@ class PresidioStructuredDataPseudonymizer(StructuredDataPseudonymizerContract):
         return StructuredDataPseudonymizationResult(
             pseudonymized_data=anonymization_result.anonymized_data,
             detected_fields=anonymization_result.detected_fields,
+            analysis_details=anonymization_result.analysis_details,
         )
@@ -1,4 +1,4 @@
-from typing import override
+from typing import Any, override
 
 from logger import LoggerContract
 
@@ -43,7 +43,7 @@ class PresidioTextPseudonymizer(TextPseudonymizerContract):
         self.config = config
         self.logger = logger
 
-        self.anonymizer = PresidioTextAnonymizer(logger=self.logger)
+        self.anonymizer = PresidioTextAnonymizer(config=self.config, logger=self.logger)
 
         self.logger.debug("Presidio text Pseudonymizer initialized successfully")
 
@@ -70,11 +70,10 @@ class PresidioTextPseudonymizer(TextPseudonymizerContract):
                 language=language,
                 min_score=min_score,
                 entity_types=entity_types,
-                operator_params={
-                    PseudonymizeOperator.PARAM_METHOD: method,
-                    PseudonymizeOperator.PARAM_ENRICHER: pseudonym_enricher,
-                    PseudonymizeOperator.PARAM_CONFIG: self.config,
-                },
+                operator_params=self._get_operator_params(
+                    method=method,
+                    pseudonym_enricher=pseudonym_enricher,
+                ),
             )
         except TextAnonymizationError as e:
             raise TextPseudonymizationError(
@@ -87,4 +86,73 @@ class PresidioTextPseudonymizer(TextPseudonymizerContract):
         return TextPseudonymizationResult(
             pseudonymized_text=anonymization_result.anonymized_text,
             detected_entities=anonymization_result.detected_entities,
+            analysis_details=anonymization_result.analysis_details,
         )
+
+    @override
+    def pseudonymize_batch(
+        self,
+        texts: list[str],
+        method: PseudonymizationMethodContract,
+        language: SupportedLanguage,
+        min_score: float,
+        entity_types: list[str] | None = None,
+        pseudonym_enricher: PseudonymEnrichmentManagerContract | None = None,
+    ) -> list[TextPseudonymizationResult]:
+        logger_context = {
+            "method": type(method).__name__,
+            "texts_count": len(texts),
+        }
+        self.logger.debug("Starting batch text pseudonymization", logger_context)
+
+        # Delegate to anonymizer with our custom operator
+        try:
+            anonymization_results = self.anonymizer.anonymize_batch(
+                texts=texts,
+                operator=AnonymizationOperator.PSEUDONYMIZE,
+                language=language,
+                min_score=min_score,
+                entity_types=entity_types,
+                operator_params=self._get_operator_params(
+                    method=method,
+                    pseudonym_enricher=pseudonym_enricher,
+                ),
+            )
+        except TextAnonymizationError as e:
+            raise TextPseudonymizationError(
+                "Pseudonymization failed during anonymization",
+            ) from e
+
+        self.logger.info(
+            "Batch text pseudonymization completed successfully",
+            logger_context,
+        )
+
+        # Adapt the results
+        return [
+            TextPseudonymizationResult(
+                pseudonymized_text=anonymization_result.anonymized_text,
+                detected_entities=anonymization_result.detected_entities,
+            )
+            for anonymization_result in anonymization_results
+        ]
+
+    def _get_operator_params(
+        self,
+        method: PseudonymizationMethodContract,
+        pseudonym_enricher: PseudonymEnrichmentManagerContract | None,
+    ) -> dict[str, Any]:
+        """Build the parameters of the pseudonymization operator.
+
+        Args:
+            method: Pseudonymization method instance
+            pseudonym_enricher: Optional enrichment service
+
+        Returns:
+            The parameters expected by PseudonymizeOperator
+        """
+        return {
+            PseudonymizeOperator.PARAM_METHOD: method,
+            PseudonymizeOperator.PARAM_ENRICHER: pseudonym_enricher,
+            PseudonymizeOperator.PARAM_CONFIG: self.config,
+        }
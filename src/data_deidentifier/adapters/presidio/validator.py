@@ -1,3 +1,5 @@
+from typing import Any
+
 from logger import LoggerContract
 
 from src.data_deidentifier.adapters.presidio.engines import PresidioEngineFactory
@@ -19,6 +21,25 @@ class PresidioValidator(EntityTypeValidatorContract):
         self.analyzer_engine = PresidioEngineFactory.get_analyzer_engine()
         self._supported_entities = None  # Lazy loading
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the shared analyzer engine for pickling into pool processes.
+
+        Returns:
+            The instance state without the engine
+        """
+        state = self.__dict__.copy()
+        del state["analyzer_engine"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the instance state and re-acquire the process-wide analyzer engine.
+
+        Args:
+            state: The instance state produced by `__getstate__`
+        """
+        self.__dict__.update(state)
+        self.analyzer_engine = PresidioEngineFactory.get_analyzer_engine()
+
     @property
     def supported_entities(self) -> set[str]:
         """Get the supported entity types.
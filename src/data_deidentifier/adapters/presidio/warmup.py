@@ -0,0 +1,156 @@
+import threading
+import time
+from typing import Any
+
+from logger import LoggerContract
+from presidio_structured.data.data_processors import PandasDataProcessor
+
+from src.data_deidentifier.adapters.infrastructure.config.contract import ConfigContract
+from src.data_deidentifier.adapters.presidio.engines import PresidioEngineFactory
+from src.data_deidentifier.domain.contracts.anonymizer.structured import (
+    StructuredDataAnonymizerContract,
+)
+from src.data_deidentifier.domain.contracts.anonymizer.text import (
+    TextAnonymizerContract,
+)
+from src.data_deidentifier.domain.contracts.validator import EntityTypeValidatorContract
+from src.data_deidentifier.domain.types.anonymization_operator import (
+    AnonymizationOperator,
+)
+from src.data_deidentifier.domain.types.structured_analysis_options import (
+    StructuredAnalysisOptions,
+)
+
+
+class PresidioEngineWarmer:
+    """Builds the Presidio engines up front and exercises them once.
+
+    Engines are otherwise created lazily by PresidioEngineFactory, which makes
+    the first request of every worker pay for loading the NLP models. The
+    warmer builds them eagerly and runs a short synthetic workload through
+    the shared adapters of the worker, so that the first real request hits
+    fully initialized engines and adapters.
+
+    The warmer also acts as the readiness state of the worker: it only reports
+    ready once the warm-up has completed successfully.
+    """
+
+    SAMPLE_TEXT = (
+        "John Smith lives in London. "
+        "Reach him at john.smith@example.com or +44 20 7946 0958."
+    )
+    SAMPLE_DATA: dict[str, Any] = {  # noqa: RUF012
+        "user": {
+            "name": "John Smith",
+            "email": "john.smith@example.com",
+            "city": "London",
+        },
+    }
+
+    def __init__(self, config: ConfigContract, logger: LoggerContract) -> None:
+        """Initialize the engine warmer.
+
+        Args:
+            config: Configuration contract
+            logger: Logger for logging events
+        """
+        self.config = config
+        self.logger = logger
+
+        self._ready = threading.Event()
+        self._duration_seconds: float | None = None
+        self._error: str | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Check whether the warm-up has completed successfully.
+
+        Returns:
+            True if the engines are built and warmed up, False otherwise
+        """
+        return self._ready.is_set()
+
+    def mark_ready(self) -> None:
+        """Report the worker as ready without warming the engines up."""
+        self._ready.set()
+
+    def warm_up(
+        self,
+        validator: EntityTypeValidatorContract,
+        text_anonymizer: TextAnonymizerContract,
+        structured_anonymizer: StructuredDataAnonymizerContract,
+    ) -> None:
+        """Build every Presidio engine and run a synthetic workload through them.
+
+        Errors are logged and leave the warmer not ready, so that a worker that
+        cannot load its models never receives traffic.
+
+        Args:
+            validator: The shared validator, whose supported entity types are
+                loaded
+            text_anonymizer: The shared text anonymizer to exercise
+            structured_anonymizer: The shared structured data anonymizer to
+                exercise
+        """
+        language = self.config.get_default_language()
+        self.logger.info("Starting engines warm-up", {"language": language})
+        started_at = time.perf_counter()
+
+        try:
+            PresidioEngineFactory.get_analyzer_engine()
+            PresidioEngineFactory.get_batch_analyzer_engine()
+            PresidioEngineFactory.get_trimmed_analyzer_engine(
+                entity_types=self.config.get_default_entity_types(),
+                max_variants=self.config.get_analysis_engine_variants_max_count(),
+            )
+            PresidioEngineFactory.get_text_anonymizer_engine()
+            PresidioEngineFactory.get_structured_data_analyzer_factory(
+                logger=self.logger,
+            )
+            PresidioEngineFactory.get_structured_data_anonymizer_engine(
+                processor=PandasDataProcessor(),
+            )
+
+            # Loads the supported entity types cached by the validator
+            validator.validate_entity_types(entity_types=["PERSON"])
+
+            text_anonymizer.anonymize(
+                text=self.SAMPLE_TEXT,
+                operator=AnonymizationOperator.REPLACE,
+                language=language,
+                min_score=self.config.get_default_minimum_score(),
+                entity_types=self.config.get_default_entity_types() or None,
+            )
+
+            # Also builds the JSON structured engine
+            structured_anonymizer.anonymize(
+                data=self.SAMPLE_DATA,
+                operator=AnonymizationOperator.REPLACE,
+                language=language,
+                operator_params={},
+                analysis_options=StructuredAnalysisOptions(bypass_cache=True),
+            )
+        except Exception as e:
+            self._error = str(e)
+            self.logger.exception("Engines warm-up failed", e)
+            return
+
+        self._duration_seconds = time.perf_counter() - started_at
+        self._ready.set()
+
+        self.logger.info(
+            "Engines warm-up completed successfully",
+            {"duration_seconds": round(self._duration_seconds, 3)},
+        )
+
+    def get_status(self) -> dict[str, Any]:
+        """Get the readiness details of the worker.
+
+        Returns:
+            Whether the worker is ready, the warm-up duration and its error if any
+        """
+        return {
+            "ready": self.is_ready,
+            "warmup_duration_seconds": self._duration_seconds,
+            "warmup_error": self._error,
+        }
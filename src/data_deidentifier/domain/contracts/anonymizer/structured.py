@@ -5,6 +5,9 @@ from src.data_deidentifier.domain.types.anonymization_operator import (
     AnonymizationOperator,
 )
 from src.data_deidentifier.domain.types.language import SupportedLanguage
+from src.data_deidentifier.domain.types.structured_analysis_options import (
+    StructuredAnalysisOptions,
+)
 from src.data_deidentifier.domain.types.structured_anonymization_result import (
     StructuredDataAnonymizationResult,
 )
@@ -15,13 +18,14 @@ class StructuredDataAnonymizerContract(ABC):
     """Abstract base class defining the structured anonymizer interface."""
 
     @abstractmethod
-    def anonymize(
+    def anonymize(  # noqa: PLR0913
         self,
         data: StructuredData,
         operator: AnonymizationOperator,
         language: SupportedLanguage,
         entity_types: list[str] | None = None,
         operator_params: dict[str, Any] | None = None,
+        analysis_options: StructuredAnalysisOptions | None = None,
     ) -> StructuredDataAnonymizationResult:
         """Anonymize PII entities in structured data.
 
@@ -31,6 +35,7 @@ class StructuredDataAnonymizerContract(ABC):
             language: Language code of the data content
             entity_types: Types of entities to detect (None means all supported types)
             operator_params: Optional parameters for the operator
+            analysis_options: Optional per-request options of the analysis
 
         Returns:
             A StructuredDataAnonymizationResult containing anonymized data and metadata
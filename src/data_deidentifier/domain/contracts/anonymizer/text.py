@@ -40,3 +40,31 @@ class TextAnonymizerContract(ABC):
             AnonymizationError: If anonymization fails
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def anonymize_batch(  # noqa: PLR0913
+        self,
+        texts: list[str],
+        operator: AnonymizationOperator,
+        language: SupportedLanguage,
+        min_score: float,
+        entity_types: list[str] | None = None,
+        operator_params: dict[str, Any] | None = None,
+    ) -> list[TextAnonymizationResult]:
+        """Anonymize PII entities in several texts sharing the same settings.
+
+        Args:
+            texts: Original texts containing PII entities
+            operator: Anonymization method
+            language: Language code of the texts
+            min_score: Minimum confidence score threshold
+            entity_types: Types of entities to detect (None means all supported types)
+            operator_params: Optional parameters for the operator
+
+        Returns:
+            One AnonymizationResult per text, in the input order
+
+        Raises:
+            AnonymizationError: If anonymization fails
+        """
+        raise NotImplementedError
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -41,3 +42,48 @@ class PseudonymEnricherContract(ABC):
             PseudonymEnrichmentError: If an error while enriching occurs.
         """
         raise NotImplementedError
+
+    async def get_enrichment_async(self, entity: Entity) -> str | None:
+        """Get enrichment information for a detected entity, concurrently.
+
+        Used to enrich many entities at once. Enrichers calling a remote
+        service should override it to send the request asynchronously; by
+        default, `get_enrichment` runs in a thread.
+
+        Args:
+            entity: The detected PII entity to enrich.
+
+        Returns:
+            str | None: Enrichment information as a string if available.
+
+        Raises:
+            PseudonymEnrichmentError: If an error while enriching occurs.
+        """
+        return await asyncio.to_thread(self.get_enrichment, entity)
+
+    def get_max_batch_size(self) -> int:
+        """Get the maximum number of entities enriched together.
+
+        Returns:
+            The maximum number of entities passed to `get_enrichments_async`
+            at once, 1 for enrichers enriching entities one by one
+        """
+        return 1
+
+    async def get_enrichments_async(self, entities: list[Entity]) -> list[str | None]:
+        """Get enrichment information for several entities at once.
+
+        Enrichers whose service accepts several entities per call should
+        override it, along with `get_max_batch_size`; by default, entities are
+        enriched one by one.
+
+        Args:
+            entities: The entities to enrich, at most `get_max_batch_size()`.
+
+        Returns:
+            list[str | None]: The enrichment of each entity, in order.
+
+        Raises:
+            PseudonymEnrichmentError: If an error while enriching occurs.
+        """
+        return [await self.get_enrichment_async(entity) for entity in entities]
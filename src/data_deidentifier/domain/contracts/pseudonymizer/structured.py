@@ -7,6 +7,9 @@ from src.data_deidentifier.domain.contracts.pseudonymizer.method import (
     PseudonymizationMethodContract,
 )
 from src.data_deidentifier.domain.types.language import SupportedLanguage
+from src.data_deidentifier.domain.types.structured_analysis_options import (
+    StructuredAnalysisOptions,
+)
 from src.data_deidentifier.domain.types.structured_data import StructuredData
 from src.data_deidentifier.domain.types.structured_pseudonymization_result import (
     StructuredDataPseudonymizationResult,
@@ -17,13 +20,14 @@ class StructuredDataPseudonymizerContract(ABC):
     """Abstract base class defining the structured data pseudonymizer interface."""
 
     @abstractmethod
-    def pseudonymize(
+    def pseudonymize(  # noqa: PLR0913
         self,
         data: StructuredData,
         method: PseudonymizationMethodContract,
         language: SupportedLanguage,
         entity_types: list[str] | None = None,
         pseudonym_enricher: PseudonymEnrichmentManagerContract | None = None,
+        analysis_options: StructuredAnalysisOptions | None = None,
     ) -> StructuredDataPseudonymizationResult:
         """Pseudonymize PII entities in structured data.
 
@@ -34,6 +38,7 @@ class StructuredDataPseudonymizerContract(ABC):
             entity_types: Types of entities to detect (None means all supported types)
             pseudonym_enricher: Optional enrichment service for adding contextual
                 information to pseudonyms found in structured data
+            analysis_options: Optional per-request options of the analysis
 
         Returns:
             A StructuredDataPseudonymizationResult
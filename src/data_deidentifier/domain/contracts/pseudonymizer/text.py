@@ -43,3 +43,35 @@ class TextPseudonymizerContract(ABC):
             TextPseudonymizationError: If pseudonymization fails
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def pseudonymize_batch(  # noqa: PLR0913
+        self,
+        texts: list[str],
+        method: PseudonymizationMethodContract,
+        language: SupportedLanguage,
+        min_score: float,
+        entity_types: list[str] | None = None,
+        pseudonym_enricher: PseudonymEnrichmentManagerContract | None = None,
+    ) -> list[TextPseudonymizationResult]:
+        """Pseudonymize PII entities in several texts sharing the same settings.
+
+        The same method instance is used for every text, so an entity gets the
+        same pseudonym wherever it appears in the batch.
+
+        Args:
+            texts: Original texts containing PII entities
+            method: Pseudonymization method instance
+            language: Language code of the texts
+            min_score: Minimum confidence score threshold
+            entity_types: Types of entities to detect (None means all supported types)
+            pseudonym_enricher: Optional enrichment service for adding contextual
+                information to pseudonyms found in texts
+
+        Returns:
+            One TextPseudonymizationResult per text, in the input order
+
+        Raises:
+            TextPseudonymizationError: If pseudonymization fails
+        """
+        raise NotImplementedError
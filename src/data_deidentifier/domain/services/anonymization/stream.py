@@ -0,0 +1,106 @@
+from typing import Any
+
+from src.data_deidentifier.domain.contracts.anonymizer.structured import (
+    StructuredDataAnonymizerContract,
+)
+from src.data_deidentifier.domain.contracts.anonymizer.text import (
+    TextAnonymizerContract,
+)
+from src.data_deidentifier.domain.contracts.validator import EntityTypeValidatorContract
+from src.data_deidentifier.domain.types.anonymization_operator import (
+    AnonymizationOperator,
+)
+from src.data_deidentifier.domain.types.language import SupportedLanguage
+from src.data_deidentifier.domain.types.stream_record import StreamRecord
+from src.data_deidentifier.domain.types.structured_anonymization_result import (
+    StructuredDataAnonymizationResult,
+)
+from src.data_deidentifier.domain.types.text_anonymization_result import (
+    TextAnonymizationResult,
+)
+
+
+class RecordStreamAnonymizationService:
+    """Service for anonymizing PII entities in streams of records.
+
+    Records are handed over in micro-batches: the texts of a micro-batch are
+    analyzed in a single batched pass, and its JSON objects are anonymized as
+    structured data one by one.
+    """
+
+    def __init__(
+        self,
+        text_anonymizer: TextAnonymizerContract,
+        structured_anonymizer: StructuredDataAnonymizerContract,
+        validator: EntityTypeValidatorContract,
+    ) -> None:
+        """Initialize the record stream anonymization service.
+
+        Args:
+            text_anonymizer: Implementation of the text anonymization contract
+            structured_anonymizer: Implementation of the structured data
+                anonymization contract
+            validator: Implementation of the validator contract
+        """
+        self.text_anonymizer = text_anonymizer
+        self.structured_anonymizer = structured_anonymizer
+        self.validator = validator
+
+    def anonymize_records(  # noqa: PLR0913
+        self,
+        records: list[StreamRecord],
+        operator: AnonymizationOperator,
+        language: SupportedLanguage,
+        min_score: float,
+        entity_types: list[str],
+        operator_params: dict[str, Any] | None = None,
+    ) -> list[TextAnonymizationResult | StructuredDataAnonymizationResult]:
+        """Anonymize PII entities in a micro-batch of records.
+
+        Args:
+            records: The texts and JSON objects to anonymize
+            operator: Anonymization method to use
+            language: Language code of the records
+            min_score: Minimum confidence score of the entities found in texts
+            entity_types: Entity types to detect
+            operator_params: Optional parameters for the operator
+
+        Returns:
+            One anonymization result per record, in the input order
+        """
+        effective_entity_types = self.validator.validate_entity_types(
+            entity_types=entity_types,
+        )
+
+        results: list[TextAnonymizationResult | StructuredDataAnonymizationResult] = [
+            self.structured_anonymizer.anonymize(
+                data=record,
+                operator=operator,
+                language=language,
+                entity_types=effective_entity_types,
+                operator_params=operator_params,
+            )
+            if not isinstance(record, str)
+            else None
+            for record in records
+        ]
+
+        # Texts are analyzed together, then put back at their position
+        text_positions = [
+            position
+            for position, record in enumerate(records)
+            if isinstance(record, str)
+        ]
+        if text_positions:
+            text_results = self.text_anonymizer.anonymize_batch(
+                texts=[records[position] for position in text_positions],
+                operator=operator,
+                language=language,
+                min_score=min_score,
+                entity_types=effective_entity_types,
+                operator_params=operator_params,
+            )
+            for position, text_result in zip(text_positions, text_results, strict=True):
+                results[position] = text_result
+
+        return results
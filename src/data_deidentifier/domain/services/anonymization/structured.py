@@ -1,3 +1,4 @@
+from dataclasses import replace
 from typing import Any
 
 from src.data_deidentifier.domain.contracts.anonymizer.structured import (
@@ -9,6 +10,9 @@ from src.data_deidentifier.domain.types.anonymization_operator import (
     AnonymizationOperator,
 )
 from src.data_deidentifier.domain.types.language import SupportedLanguage
+from src.data_deidentifier.domain.types.structured_analysis_options import (
+    StructuredAnalysisOptions,
+)
 from src.data_deidentifier.domain.types.structured_anonymization_result import (
     StructuredDataAnonymizationResult,
 )
@@ -36,13 +40,14 @@ class StructuredDataAnonymizationService:
         self.anonymizer = anonymizer
         self.validator = validator
 
-    def anonymize(
+    def anonymize(  # noqa: PLR0913
         self,
         data: StructuredData,
         operator: AnonymizationOperator,
         language: SupportedLanguage,
         entity_types: list[str],
         operator_params: dict[str, Any] | None = None,
+        analysis_options: StructuredAnalysisOptions | None = None,
     ) -> StructuredDataAnonymizationResult:
         """Anonymize PII entities in structured data.
 
@@ -52,6 +57,7 @@ class StructuredDataAnonymizationService:
             language: Language code of the text
             entity_types: Entity types to detect
             operator_params: Optional parameters for the operator
+            analysis_options: Optional per-request options of the analysis
 
         Returns:
             A StructuredDataAnonymizationResult containing anonymized data and metadata
@@ -59,10 +65,21 @@ class StructuredDataAnonymizationService:
         if not data:
             raise InvalidInputDataError("Data cannot be empty")
 
-        # Validate data
+        # Validate data, including the entity types of the field hints
         effective_entity_types = self.validator.validate_entity_types(
             entity_types=entity_types,
         )
+        if analysis_options is not None and analysis_options.field_hints:
+            self.validator.validate_entity_types(
+                entity_types=list(analysis_options.field_hints.values()),
+            )
+            analysis_options = replace(
+                analysis_options,
+                field_hints={
+                    field_name: entity_type.upper()
+                    for field_name, entity_type in analysis_options.field_hints.items()
+                },
+            )
 
         # Anonymize the data
         return self.anonymizer.anonymize(
@@ -71,4 +88,5 @@ class StructuredDataAnonymizationService:
             operator_params=operator_params,
             entity_types=effective_entity_types,
             language=language,
+            analysis_options=analysis_options,
         )
@@ -76,3 +76,43 @@ class TextAnonymizationService:
             language=language,
             min_score=min_score,
         )
+
+    def anonymize_batch(  # noqa: PLR0913
+        self,
+        texts: list[str],
+        operator: AnonymizationOperator,
+        language: SupportedLanguage,
+        min_score: float,
+        entity_types: list[str],
+        operator_params: dict[str, Any] | None = None,
+    ) -> list[TextAnonymizationResult]:
+        """Anonymize PII entities in several texts sharing the same settings.
+
+        Args:
+            texts: The texts to anonymize
+            operator: Anonymization method to use
+            language: Language code of the texts
+            min_score: Minimum confidence score
+            entity_types: Entity types to detect
+            operator_params: Optional parameters for the operator
+
+        Returns:
+            One AnonymizationResult per text, in the input order
+        """
+        if not texts:
+            raise InvalidInputTextError("Texts cannot be empty")
+
+        # Validate data
+        effective_entity_types = self.validator.validate_entity_types(
+            entity_types=entity_types,
+        )
+
+        # Anonymize the texts
+        return self.anonymizer.anonymize_batch(
+            texts=texts,
+            operator=operator,
+            operator_params=operator_params,
+            entity_types=effective_entity_types,
+            language=language,
+            min_score=min_score,
+        )
@@ -43,6 +43,25 @@ class CounterPseudonymizationMethod(PseudonymizationMethodContract):
         # Thread safety for concurrent access
         self._lock = threading.Lock()
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the lock for pickling into pool processes.
+
+        Returns:
+            The instance state without the lock
+        """
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the instance state with a new lock.
+
+        Args:
+            state: The instance state produced by `__getstate__`
+        """
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
     @override
     def generate_pseudonym(self, entity: Entity) -> str:
         cache_key = entity.text
@@ -0,0 +1,163 @@
+from typing import Any
+
+from logger import LoggerContract
+
+from src.data_deidentifier.domain.contracts.enricher.manager import (
+    PseudonymEnrichmentManagerContract,
+)
+from src.data_deidentifier.domain.contracts.pseudonymizer.method import (
+    PseudonymizationMethodContract,
+)
+from src.data_deidentifier.domain.contracts.pseudonymizer.structured import (
+    StructuredDataPseudonymizerContract,
+)
+from src.data_deidentifier.domain.contracts.pseudonymizer.text import (
+    TextPseudonymizerContract,
+)
+from src.data_deidentifier.domain.contracts.validator import EntityTypeValidatorContract
+from src.data_deidentifier.domain.exceptions import TextPseudonymizationError
+from src.data_deidentifier.domain.services.pseudonymization.methods.factory import (
+    PseudonymizationMethodFactory,
+)
+from src.data_deidentifier.domain.types.language import SupportedLanguage
+from src.data_deidentifier.domain.types.pseudonymization_method import (
+    PseudonymizationMethod,
+)
+from src.data_deidentifier.domain.types.stream_record import StreamRecord
+from src.data_deidentifier.domain.types.structured_pseudonymization_result import (
+    StructuredDataPseudonymizationResult,
+)
+from src.data_deidentifier.domain.types.text_pseudonymization_result import (
+    TextPseudonymizationResult,
+)
+
+
+class RecordStreamPseudonymizationService:
+    """Service for pseudonymizing PII entities in streams of records.
+
+    A single method instance is created for the whole stream and handed to
+    every micro-batch, so that an entity gets the same pseudonym in every
+    record of the stream.
+    """
+
+    def __init__(
+        self,
+        text_pseudonymizer: TextPseudonymizerContract,
+        structured_pseudonymizer: StructuredDataPseudonymizerContract,
+        validator: EntityTypeValidatorContract,
+        logger: LoggerContract,
+        pseudonym_enricher: PseudonymEnrichmentManagerContract | None = None,
+    ) -> None:
+        """Initialize the record stream pseudonymization service.
+
+        Args:
+            text_pseudonymizer: Implementation of the text pseudonymization contract
+            structured_pseudonymizer: Implementation of the structured data
+                pseudonymization contract
+            validator: Implementation of the validator contract
+            logger: Logger for logging events
+            pseudonym_enricher: Optional enrichment service for adding contextual
+                information to pseudonyms
+        """
+        self.text_pseudonymizer = text_pseudonymizer
+        self.structured_pseudonymizer = structured_pseudonymizer
+        self.validator = validator
+        self.logger = logger
+        self.pseudonym_enricher = pseudonym_enricher
+
+    def create_method(
+        self,
+        method: PseudonymizationMethod,
+        method_params: dict[str, Any] | None = None,
+    ) -> PseudonymizationMethodContract:
+        """Create the method instance shared by all the records of a stream.
+
+        Args:
+            method: Pseudonymization method to use
+            method_params: Optional parameters for the method
+
+        Returns:
+            The pseudonymization method instance
+
+        Raises:
+            TextPseudonymizationError: If the method is unknown
+        """
+        try:
+            return PseudonymizationMethodFactory.create(
+                method=method,
+                method_params=method_params or {},
+                logger=self.logger,
+            )
+        except Exception as e:
+            raise TextPseudonymizationError(
+                "Pseudonymization method loading failed",
+            ) from e
+
+    def pseudonymize_records(
+        self,
+        records: list[StreamRecord],
+        method: PseudonymizationMethodContract,
+        language: SupportedLanguage,
+        min_score: float,
+        entity_types: list[str],
+    ) -> tuple[
+        list[TextPseudonymizationResult | StructuredDataPseudonymizationResult],
+        PseudonymizationMethodContract,
+    ]:
+        """Pseudonymize PII entities in a micro-batch of records.
+
+        The method instance is returned along with the results: when the
+        micro-batch runs in a pool process, it works on a copy of the method,
+        which holds the pseudonyms given so far and must be handed to the next
+        micro-batch of the stream.
+
+        Args:
+            records: The texts and JSON objects to pseudonymize
+            method: The method instance shared by the records of the stream
+            language: Language code of the records
+            min_score: Minimum confidence score of the entities found in texts
+            entity_types: Entity types to detect
+
+        Returns:
+            A tuple containing:
+                - One pseudonymization result per record, in the input order
+                - The method instance, holding the pseudonyms given so far
+        """
+        effective_entity_types = self.validator.validate_entity_types(
+            entity_types=entity_types,
+        )
+
+        results: list[
+            TextPseudonymizationResult | StructuredDataPseudonymizationResult
+        ] = [
+            self.structured_pseudonymizer.pseudonymize(
+                data=record,
+                method=method,
+                language=language,
+                entity_types=effective_entity_types,
+                pseudonym_enricher=self.pseudonym_enricher,
+            )
+            if not isinstance(record, str)
+            else None
+            for record in records
+        ]
+
+        # Texts are analyzed together, then put back at their position
+        text_positions = [
+            position
+            for position, record in enumerate(records)
+            if isinstance(record, str)
+        ]
+        if text_positions:
+            text_results = self.text_pseudonymizer.pseudonymize_batch(
+                texts=[records[position] for position in text_positions],
+                method=method,
+                language=language,
+                min_score=min_score,
+                entity_types=effective_entity_types,
+                pseudonym_enricher=self.pseudonym_enricher,
+            )
+            for position, text_result in zip(text_positions, text_results, strict=True):
+                results[position] = text_result
+
+        return results, method
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from typing import Any
 
 from logger import LoggerContract
@@ -20,6 +21,9 @@ from src.data_deidentifier.domain.types.language import SupportedLanguage
 from src.data_deidentifier.domain.types.pseudonymization_method import (
     PseudonymizationMethod,
 )
+from src.data_deidentifier.domain.types.structured_analysis_options import (
+    StructuredAnalysisOptions,
+)
 from src.data_deidentifier.domain.types.structured_data import StructuredData
 from src.data_deidentifier.domain.types.structured_pseudonymization_result import (
     StructuredDataPseudonymizationResult,
@@ -54,13 +58,14 @@ class StructuredDataPseudonymizationService:
         self.logger = logger
         self.pseudonym_enricher = pseudonym_enricher
 
-    def pseudonymize(
+    def pseudonymize(  # noqa: PLR0913
         self,
         data: StructuredData,
         method: PseudonymizationMethod,
         language: SupportedLanguage,
         entity_types: list[str],
         method_params: dict[str, Any] | None = None,
+        analysis_options: StructuredAnalysisOptions | None = None,
     ) -> StructuredDataPseudonymizationResult:
         """Pseudonymize PII entities in text.
 
@@ -70,6 +75,7 @@ class StructuredDataPseudonymizationService:
             language: Language code of the text
             entity_types: Entity types to detect
             method_params: Optional parameters for the method
+            analysis_options: Optional per-request options of the analysis
 
         Returns:
             A StructuredDataPseudonymizationResult
@@ -94,10 +100,21 @@ class StructuredDataPseudonymizationService:
                 "Pseudonymization method loading failed",
             ) from e
 
-        # Validate data
+        # Validate data, including the entity types of the field hints
         effective_entity_types = self.validator.validate_entity_types(
             entity_types=entity_types,
         )
+        if analysis_options is not None and analysis_options.field_hints:
+            self.validator.validate_entity_types(
+                entity_types=list(analysis_options.field_hints.values()),
+            )
+            analysis_options = replace(
+                analysis_options,
+                field_hints={
+                    field_name: entity_type.upper()
+                    for field_name, entity_type in analysis_options.field_hints.items()
+                },
+            )
 
         # Pseudonymize the text
         return self.pseudonymizer.pseudonymize(
@@ -106,4 +123,5 @@ class StructuredDataPseudonymizationService:
             entity_types=effective_entity_types,
             language=language,
             pseudonym_enricher=self.pseudonym_enricher,
+            analysis_options=analysis_options,
         )
@@ -108,3 +108,62 @@ class TextPseudonymizationService:
             min_score=min_score,
             pseudonym_enricher=self.pseudonym_enricher,
         )
+
+    def pseudonymize_batch(  # noqa: PLR0913
+        self,
+        texts: list[str],
+        method: PseudonymizationMethod,
+        language: SupportedLanguage,
+        min_score: float,
+        entity_types: list[str],
+        method_params: dict[str, Any] | None = None,
+    ) -> list[TextPseudonymizationResult]:
+        """Pseudonymize PII entities in several texts sharing the same settings.
+
+        A single method instance is created for the whole batch, so pseudonyms
+        stay consistent across texts.
+
+        Args:
+            texts: The texts to pseudonymize
+            method: Pseudonymization method to use
+            language: Language code of the texts
+            min_score: Minimum confidence score
+            entity_types: Entity types to detect
+            method_params: Optional parameters for the method
+
+        Returns:
+            One TextPseudonymizationResult per text, in the input order
+
+        Raises:
+            InvalidInputTextError: If no text is provided
+            TextPseudonymizationError: If the method is unknown
+        """
+        if not texts:
+            raise InvalidInputTextError("Texts cannot be empty")
+
+        # Get the pseudonymization method
+        try:
+            method_instance = PseudonymizationMethodFactory.create(
+                method=method,
+                method_params=method_params or {},
+                logger=self.logger,
+            )
+        except Exception as e:
+            raise TextPseudonymizationError(
+                "Pseudonymization method loading failed",
+            ) from e
+
+        # Validate data
+        effective_entity_types = self.validator.validate_entity_types(
+            entity_types=entity_types,
+        )
+
+        # Pseudonymize the texts
+        return self.pseudonymizer.pseudonymize_batch(
+            texts=texts,
+            method=method_instance,
+            entity_types=effective_entity_types,
+            language=language,
+            min_score=min_score,
+            pseudonym_enricher=self.pseudonym_enricher,
+        )
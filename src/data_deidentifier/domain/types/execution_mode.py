@@ -0,0 +1,15 @@
+from enum import StrEnum, auto
+
+
+class ExecutionMode(StrEnum):
+    """Enumeration of the pools used to run CPU-bound work off the event loop.
+
+    Attributes:
+        THREAD: Bounded thread pool living in the worker process. Cheap to
+            dispatch and shares the already loaded engines.
+        PROCESS: Bounded process pool. Avoids GIL contention at the cost of
+            loading the engines once in every pool process.
+    """
+
+    THREAD = auto()
+    PROCESS = auto()
@@ -0,0 +1,20 @@
+from enum import StrEnum, auto
+
+
+class FieldKind(StrEnum):
+    """Enumeration of the kinds of structured data fields that hold no free text.
+
+    Attributes:
+        NUMERIC: Numbers too short to be identifiers (e.g. phone numbers).
+        BOOLEAN: True or false flags.
+        UUID: Universally unique identifiers.
+        TIMESTAMP: Dates and times, typed or as ISO 8601 strings.
+        ENUM: A few distinct codes (e.g. `IN_PROGRESS`, `FR-75`) repeated
+            across many values.
+    """
+
+    NUMERIC = auto()
+    BOOLEAN = auto()
+    UUID = auto()
+    TIMESTAMP = auto()
+    ENUM = auto()
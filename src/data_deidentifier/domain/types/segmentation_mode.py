@@ -0,0 +1,16 @@
+from enum import StrEnum, auto
+
+
+class SegmentationMode(StrEnum):
+    """Enumeration of the ways texts are split before their analysis is cached.
+
+    Attributes:
+        NONE: The whole text is analyzed and cached as a single unit.
+        SENTENCE: Each sentence is analyzed and cached separately.
+        PARAGRAPH: Each paragraph (separated by blank lines) is analyzed and
+            cached separately.
+    """
+
+    NONE = auto()
+    SENTENCE = auto()
+    PARAGRAPH = auto()
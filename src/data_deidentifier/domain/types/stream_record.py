@@ -0,0 +1,5 @@
+from collections.abc import Mapping
+from typing import Any
+
+# A text, or a JSON object de-identified as structured data
+type StreamRecord = str | Mapping[str, Any]
@@ -0,0 +1,35 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StructuredAnalysisOptions:
+    """Per-request options of a structured data analysis.
+
+    Attributes:
+        bypass_cache: Analyze the data even if data of the same structure
+            has been analyzed recently
+        sample_size: Maximum number of values analyzed per table column
+        min_agreement: Minimum share of the sampled values of a column agreeing
+            on an entity type for the column to be mapped to it
+        random_seed: Seed of the column sampling
+        stratified_sampling: Sample the distinct values of each column rather
+            than its rows
+        field_hints: Entity types of known fields (e.g. `{"user.email":
+            "EMAIL_ADDRESS"}`), mapped without being analyzed
+        free_text: Anonymize the fields holding long strings at the level of
+            the entities found in their values instead of as a whole
+        free_text_min_length: Length from which a string value makes its field
+            free text
+
+    Sampling and free-text options left to None take their configured default.
+    """
+
+    bypass_cache: bool = False
+    sample_size: int | None = None
+    min_agreement: float | None = None
+    random_seed: int | None = None
+    stratified_sampling: bool | None = None
+    field_hints: Mapping[str, str] | None = None
+    free_text: bool = False
+    free_text_min_length: int | None = None
@@ -1,4 +1,6 @@
 from collections.abc import Mapping
 from typing import Any
 
-type StructuredData = Mapping[str, Any]
+from .tabular_data import TabularData
+
+type StructuredData = Mapping[str, Any] | TabularData
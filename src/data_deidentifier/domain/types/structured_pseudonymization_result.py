@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 from .structured_anonymization_result import StructuredDataAnalysisField
 from .structured_data import StructuredData
@@ -13,10 +14,12 @@ class StructuredDataPseudonymizationResult:
     Attributes:
         pseudonymized_data: The structured data after pseudonymization
         detected_fields: List of fields with detected PII entities
+        analysis_details: How the analysis ran (e.g. cache hits), if reported
     """
 
     pseudonymized_data: StructuredData
     detected_fields: list[StructuredDataAnalysisField]
+    analysis_details: dict[str, Any] = field(default_factory=dict)
 
     @property
     def field_mapping(self) -> dict[str, str]:
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class TabularData:
+    """Table of records sharing the same columns.
+
+    Tables are analyzed column by column: each column is mapped to a single
+    entity type, detected on a sample of its values, then anonymized as a whole.
+
+    Attributes:
+        columns: Names of the columns
+        rows: Values of each record, in the order of the columns
+    """
+
+    columns: list[str]
+    rows: list[list[Any]]
+
+    def __len__(self) -> int:
+        """Get the number of records, so that empty tables are falsy.
+
+        Returns:
+            The number of rows
+        """
+        return len(self.rows)
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 from .entity import Entity
 
@@ -12,7 +13,9 @@ class TextPseudonymizationResult:
     Attributes:
         pseudonymized_text: The text after pseudonymization
         detected_entities: List of PII entities that were detected and pseudonymized
+        analysis_details: How the analysis ran (e.g. cache hits), if reported
     """
 
     pseudonymized_text: str
     detected_entities: list[Entity]
+    analysis_details: dict[str, Any] = field(default_factory=dict)